@@ -0,0 +1,227 @@
+"""
+Quick draft-board lookups without re-running the pipeline.
+
+Reads the binary snapshot main.py writes (output/draft_board.snap) through a
+memory map; standard library only, so a query answers in well under 100 ms
+from a cold start — usable from a phone SSH session mid-draft.
+
+Run:
+    python board.py top 20 --pos SS        # best available shortstops
+    python board.py search judge
+    python board.py where "Value > 10" "ADP < 150" --pos OF
+    python board.py take "bobby witt"      # mark drafted (hidden from top/where)
+    python board.py untake "bobby witt"
+    python board.py taken
+    python board.py reset                  # clear all drafted marks
+
+Drafted players are listed in output/draft_board.taken, one name per line;
+pass --all to top/where to include them.
+"""
+
+import argparse
+import os
+import re
+import sys
+
+from src.snapshot import Snapshot
+
+SNAPSHOT_PATH = "output/draft_board.snap"
+TAKEN_PATH    = "output/draft_board.taken"
+
+HITTERS = {"C", "1B", "2B", "3B", "SS", "OF", "DH"}
+POS_GROUPS = {
+    "CI":   {"1B", "3B"},
+    "MI":   {"2B", "SS"},
+    "P":    {"SP", "RP"},
+    "UTIL": HITTERS,
+}
+
+# (column, header, width, format)
+DISPLAY = [
+    ("Draft_Rank",       "#",    4,  "{:.0f}"),
+    ("Name",             "Name", 22, "{}"),
+    ("Position",         "Pos",  3,  "{}"),
+    ("projected_points", "Pts",  6,  "{:.1f}"),
+    ("VORP",             "VORP", 6,  "{:.1f}"),
+    ("ADP",              "ADP",  6,  "{:.1f}"),
+    ("Value",            "Val",  5,  "{:+.0f}"),
+    ("Est_Round",        "Rd",   3,  "{:.0f}"),
+]
+
+ALIASES = {"pts": "projected_points", "points": "projected_points", "val": "Value",
+           "rank": "Draft_Rank", "round": "Est_Round", "rd": "Est_Round", "pos": "Position"}
+
+_CONDITION = re.compile(r"^\s*(\w+)\s*(>=|<=|==|!=|=|>|<)\s*(-?\d+(?:\.\d+)?)\s*$")
+_OPS = {
+    ">":  lambda a, b: a > b,
+    "<":  lambda a, b: a < b,
+    ">=": lambda a, b: a >= b,
+    "<=": lambda a, b: a <= b,
+    "=":  lambda a, b: a == b,
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+}
+
+
+def load_taken(path: str = TAKEN_PATH) -> set:
+    try:
+        with open(path) as f:
+            return {line.strip().lower() for line in f if line.strip()}
+    except FileNotFoundError:
+        return set()
+
+
+def save_taken(taken: set, path: str = TAKEN_PATH) -> None:
+    with open(path, "w") as f:
+        f.writelines(f"{name}\n" for name in sorted(taken))
+
+
+def resolve_column(snap: Snapshot, name: str) -> str:
+    name = ALIASES.get(name.lower(), name)
+    for col in snap.columns:
+        if col.lower() == name.lower():
+            return col
+    sys.exit(f"Unknown column {name!r}. Columns: {', '.join(snap.columns)}")
+
+
+def parse_conditions(snap: Snapshot, conditions: list) -> list:
+    parsed = []
+    for cond in conditions:
+        m = _CONDITION.match(cond)
+        if not m:
+            sys.exit(f"Can't parse {cond!r} — use e.g. \"Value > 10\"")
+        col, op, value = m.groups()
+        parsed.append((snap.column(resolve_column(snap, col)), _OPS[op], float(value)))
+    return parsed
+
+
+def position_filter(pos: str | None):
+    if not pos:
+        return None
+    pos = pos.upper()
+    return POS_GROUPS.get(pos, {pos})
+
+
+def select(snap: Snapshot, limit: int, pos: str | None = None, conditions: list = (),
+           include_taken: bool = False) -> list:
+    """Row indices in board order matching every filter, up to `limit`."""
+    positions = position_filter(pos)
+    names, pos_col = snap.column("Name"), snap.column("Position")
+    taken = set() if include_taken else load_taken()
+    out = []
+    for i in range(snap.rows):
+        if positions and pos_col[i] not in positions:
+            continue
+        if any(not op(col[i], value) for col, op, value in conditions):
+            continue
+        if taken and names[i].lower() in taken:
+            continue
+        out.append(i)
+        if len(out) >= limit:
+            break
+    return out
+
+
+def find(snap: Snapshot, query: str) -> list:
+    """Row indices whose name contains `query` (case-insensitive)."""
+    query = query.lower()
+    return [i for i, name in enumerate(snap.column("Name")) if query in name.lower()]
+
+
+def _cell(value, fmt: str) -> str:
+    if isinstance(value, float) and (value != value or value >= 999):
+        return "–"
+    return fmt.format(value)
+
+
+def print_rows(snap: Snapshot, rows: list, taken: set | None = None) -> None:
+    cols = [(c, h, w, f) for c, h, w, f in DISPLAY if c in snap.columns]
+    print("  ".join(h.rjust(w) if f != "{}" else h.ljust(w) for _, h, w, f in cols))
+    for i in rows:
+        cells = []
+        for col, _, width, fmt in cols:
+            text = _cell(snap.column(col)[i], fmt)
+            cells.append(text.ljust(width)[:width] if fmt == "{}" else text.rjust(width))
+        line = "  ".join(cells)
+        if taken and snap.column("Name")[i].lower() in taken:
+            line += "  (taken)"
+        print(line)
+    if not rows:
+        print("(no players)")
+
+
+def pick_one(snap: Snapshot, query: str) -> str:
+    matches = find(snap, query)
+    names = snap.column("Name")
+    exact = [i for i in matches if names[i].lower() == query.lower()]
+    if len(exact) == 1 or len(matches) == 1:
+        return names[(exact or matches)[0]]
+    if not matches:
+        sys.exit(f"No player matches {query!r}")
+    print(f"{query!r} matches {len(matches)} players — be more specific:")
+    print_rows(snap, matches[:15])
+    sys.exit(1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the draft board snapshot.")
+    parser.add_argument("--snapshot", default=SNAPSHOT_PATH, help="board snapshot written by main.py")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    top = sub.add_parser("top", help="best available players")
+    top.add_argument("n", nargs="?", type=int, default=20)
+    top.add_argument("--pos", help="position (C, 1B, ..., SP, RP, or CI/MI/P/UTIL)")
+    top.add_argument("--all", action="store_true", help="include drafted players")
+
+    search = sub.add_parser("search", help="find players by name")
+    search.add_argument("query", nargs="+")
+
+    where = sub.add_parser("where", help='filter, e.g. "Value > 10" "ADP < 150"')
+    where.add_argument("conditions", nargs="+")
+    where.add_argument("--pos")
+    where.add_argument("--limit", type=int, default=50)
+    where.add_argument("--all", action="store_true", help="include drafted players")
+
+    take = sub.add_parser("take", help="mark a player drafted")
+    take.add_argument("query", nargs="+")
+    untake = sub.add_parser("untake", help="unmark a drafted player")
+    untake.add_argument("query", nargs="+")
+    sub.add_parser("taken", help="list drafted players")
+    sub.add_parser("reset", help="clear all drafted marks")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "reset":
+        if os.path.exists(TAKEN_PATH):
+            os.remove(TAKEN_PATH)
+        print("✓ Cleared drafted players")
+        return
+
+    if not os.path.exists(args.snapshot):
+        sys.exit(f"{args.snapshot} not found — run 'python main.py' first.")
+    snap = Snapshot(args.snapshot)
+
+    if args.command == "top":
+        print_rows(snap, select(snap, args.n, args.pos, include_taken=args.all), load_taken() if args.all else None)
+    elif args.command == "where":
+        conditions = parse_conditions(snap, args.conditions)
+        print_rows(snap, select(snap, args.limit, args.pos, conditions, include_taken=args.all),
+                   load_taken() if args.all else None)
+    elif args.command == "search":
+        print_rows(snap, find(snap, " ".join(args.query))[:25], load_taken())
+    elif args.command in ("take", "untake"):
+        name = pick_one(snap, " ".join(args.query))
+        taken = load_taken()
+        if args.command == "take":
+            taken.add(name.lower())
+        else:
+            taken.discard(name.lower())
+        save_taken(taken)
+        print(f"✓ {name} {'marked drafted' if args.command == 'take' else 'available again'} ({len(taken)} drafted)")
+    elif args.command == "taken":
+        taken = load_taken()
+        print_rows(snap, [i for i, name in enumerate(snap.column("Name")) if name.lower() in taken])
+
+
+if __name__ == "__main__":
+    main()
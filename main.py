@@ -1,70 +1,198 @@
+import argparse
+import datetime as dt
+import functools
+import os
+import sys
+
 import pandas as pd
-from src.scoring import calculate_points
+from src.scoring import calculate_points_frame
 from src.scarcity import compute_vorp
-from src.rank import merge_adp, compute_value_score, build_draft_board
-from src.export import export_html, export_csv
-import os
+from src.rank import merge_adp, merge_adp_trends, compute_value_score, build_draft_board
+from src.categories import METHODS, category_values
+from src.dynasty import AGES_PATH, DYNASTY_PATH, KEEPERS_PATH, build_dynasty_board
+from src.export import export_html, export_csv, export_parquet, export_snapshot
+from src.pipeline import Pipeline
+from src.profiling import enable as enable_profiling, profiled
+from src.rules import RULES_PATH, EXCLUSIONS_PATH, POSITIONS_PATH, apply_rules, load_rules
+from src.schedule import FACTORS_PATH, MLB_TEAMS_PATH, SCHEDULE_PATH, build_weekly_board, two_start_pitchers
+from src.storage import read_table
 
-def load_exclusions(path: str = "data/injured_out.csv") -> list:
-    try:
-        df = pd.read_csv(path)
-        names = df["Name"].tolist()
-        print(f"Excluding {len(names)} players: {', '.join(names)}")
-        return names
-    except FileNotFoundError:
-        return []
-
-def apply_position_overrides(df: pd.DataFrame, path: str = "data/position_overrides.csv") -> pd.DataFrame:
-    """Override positions for misclassified players."""
-    try:
-        overrides = pd.read_csv(path)
-        for _, row in overrides.iterrows():
-            mask = df["Name"] == row["Name"]
-            if mask.any():
-                old = df.loc[mask, "Position"].values[0]
-                df.loc[mask, "Position"] = row["Position"]
-                print(f"  Position override: {row['Name']} {old} -> {row['Position']}")
-        return df
-    except FileNotFoundError:
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts")
+
+# Stage inputs list every module the stage's code imports, directly or not,
+# so editing any of them invalidates the cached result.
+STORAGE_MODULES = ["src/storage.py", "src/matching.py"]          # storage keys rows by matching.player_ids
+EXPORT_MODULES  = ["src/export.py", "src/snapshot.py"] + STORAGE_MODULES
+
+
+def load_players() -> pd.DataFrame:
+    df = profiled("read_projections", read_table, "data/projections.parquet")   # falls back to data/projections.csv
+
+    # Exclusions, position fixes, playing-time and stat adjustments
+    print("Applying rules...")
+    rules = profiled("read_rules", load_rules)
+    return profiled("rules", apply_rules, df, rules)
+
+
+def score_players(df: pd.DataFrame, scoring: str = "points") -> pd.DataFrame:
+    df = df.copy()
+    if scoring == "points":
+        # stats are stored as float32 with one decimal; the weights are integers,
+        # so rounding to one decimal recovers the exact total
+        df["projected_points"] = calculate_points_frame(df).round(1)
         return df
+    # categories leagues: SGP / z-score total stands in for points from here on
+    values = category_values(df, method=scoring)
+    df[values.columns] = values
+    df["projected_points"] = values["Category_Value"].round(2)
+    return df
+
 
-def main():
-    df = pd.read_csv("data/projections.csv")
+def add_vorp(df: pd.DataFrame) -> pd.DataFrame:
+    return compute_vorp(df, eligibility_path="data/espn_eligibility.csv")
 
-    # Remove excluded players
-    excluded = load_exclusions("data/injured_out.csv")
-    if excluded:
-        df = df[~df["Name"].isin(excluded)].reset_index(drop=True)
 
-    # Fix misclassified positions
-    print("Applying position overrides...")
-    df = apply_position_overrides(df)
+def add_adp(df: pd.DataFrame) -> pd.DataFrame:
+    df = profiled("adp_merge", merge_adp, df, adp_path="data/adp.parquet")
+    df = profiled("adp_trends", merge_adp_trends, df, history_dir="data/adp_history")
+    return profiled("value_score", compute_value_score, df)
+
+
+def export_board(board: pd.DataFrame) -> None:
+    os.makedirs("output", exist_ok=True)
+    profiled("export_csv", export_csv, board, path="output/draft_board.csv")
+    profiled("export_html", export_html, board, path="output/draft_board.html")
+    profiled("export_parquet", export_parquet, board, path="output/draft_board.parquet")
+    profiled("export_snapshot", export_snapshot, board, path="output/draft_board.snap")
 
-    # For pitchers, remap K_pitch -> K before scoring
-    def calculate_points_row(row):
-        if row["Position"] in {"SP", "RP", "P"}:
-            row = row.copy()
-            row["K"] = row.get("K_pitch", 0)
-        return calculate_points(row)
 
-    df["projected_points"] = df.apply(calculate_points_row, axis=1)
+def export_dynasty(board: pd.DataFrame) -> None:
+    export_csv(board, path="output/dynasty_board.csv")
+    export_parquet(board, path="output/dynasty_board.parquet")
 
-    df = compute_vorp(df, eligibility_path="data/espn_eligibility.csv")
-    df = merge_adp(df, adp_path="data/adp.csv")
-    df = compute_value_score(df)
 
-    board = build_draft_board(df)
+def export_weekly(board: pd.DataFrame) -> None:
+    export_csv(board, path="output/weekly_board.csv")
+    export_parquet(board, path="output/weekly_board.parquet")
+
+
+def add_refresh_stages(pipe: Pipeline, fetch: bool) -> None:
+    """Fetch (optional, always runs) and the two combine steps, ahead of the board stages."""
+    sys.path.insert(0, SCRIPTS_DIR)
+    from combine_adp import ADP_SOURCES, combine_adp  # noqa: E402
+    from combine_projections import BR_PATH, FG_PATH, FG_SYSTEMS_GLOB, FP_PATH, combine_projections  # noqa: E402
+
+    if fetch:
+        from fetch_all import fetch_all  # noqa: E402
+        pipe.add("fetch", lambda: fetch_all(combine=False), cache=False)
+
+    pipe.add("combine_projections", combine_projections, result=False,
+             inputs=[FP_PATH, FG_PATH, BR_PATH, FG_SYSTEMS_GLOB, "scripts/combine_projections.py"] + STORAGE_MODULES,
+             outputs=["data/projections.csv", "data/projections.parquet"])
+    # one ADP history snapshot per day, so the date is part of the key
+    pipe.add("combine_adp", combine_adp, result=False,
+             inputs=[src["path"] for src in ADP_SOURCES.values()]
+                    + ["scripts/combine_adp.py", "src/adp_consensus.py", "src/adp_history.py"] + STORAGE_MODULES,
+             outputs=["data/adp.csv", "data/adp.parquet"],
+             params={"date": dt.date.today().isoformat()})
+
+
+def build_pipeline(use_cache: bool = True, fetch: bool = False, combine: bool = False,
+                   dynasty: bool = False, scoring: str = "points", weekly: bool = False,
+                   season: int | None = None) -> Pipeline:
+    pipe = Pipeline(use_cache=use_cache)
+    if fetch or combine:
+        add_refresh_stages(pipe, fetch)
+
+    pipe.add("load", load_players,
+             inputs=["data/projections.parquet", "data/projections.csv", RULES_PATH, EXCLUSIONS_PATH, POSITIONS_PATH,
+                     "src/rules.py", "main.py"] + STORAGE_MODULES)
+    pipe.add("score", functools.partial(score_players, scoring=scoring), deps=["load"],
+             inputs=["src/scoring.py", "src/categories.py", "src/scarcity.py", "src/matching.py", "main.py"],
+             params={"scoring": scoring})
+    pipe.add("vorp", add_vorp, deps=["score"], inputs=["data/espn_eligibility.csv", "src/scarcity.py", "main.py"])
+    pipe.add("adp", add_adp, deps=["vorp"],
+             inputs=["data/adp.parquet", "data/adp.csv", "data/adp_history", "src/rank.py", "src/adp_history.py",
+                     "main.py"] + STORAGE_MODULES)
+    pipe.add("rank", build_draft_board, deps=["adp"], inputs=["src/rank.py", "src/adp_history.py"] + STORAGE_MODULES)
+    pipe.add("export", export_board, deps=["rank"], inputs=EXPORT_MODULES + ["main.py"],
+             outputs=["output/draft_board.csv", "output/draft_board.html", "output/draft_board.parquet",
+                      "output/draft_board.snap"])
+    if dynasty:
+        season = season or dt.date.today().year
+        pipe.add("dynasty", functools.partial(build_dynasty_board, season=season), deps=["score"],
+                 inputs=[DYNASTY_PATH, "data/dynasty_projections.csv", AGES_PATH, KEEPERS_PATH, "data/espn_eligibility.csv",
+                         "src/dynasty.py", "src/scarcity.py", "src/scoring.py"] + STORAGE_MODULES,
+                 params={"season": season})
+        pipe.add("dynasty_export", export_dynasty, deps=["dynasty"], inputs=EXPORT_MODULES + ["main.py"],
+                 outputs=["output/dynasty_board.csv", "output/dynasty_board.parquet"])
+    if weekly:
+        pipe.add("weekly", build_weekly_board, deps=["score"],
+                 inputs=[SCHEDULE_PATH, MLB_TEAMS_PATH, FACTORS_PATH, "src/schedule.py", "src/scoring.py", "src/matching.py"])
+        pipe.add("weekly_export", export_weekly, deps=["weekly"], inputs=EXPORT_MODULES + ["main.py"],
+                 outputs=["output/weekly_board.csv", "output/weekly_board.parquet"])
+    return pipe
+
+
+def main(use_cache: bool = True, fetch: bool = False, combine: bool = False,
+         profile: str | None = None, trace: str | None = None, dynasty: bool = False,
+         scoring: str = "points", weekly: int | None = None, season: int | None = None):
+    profiler = enable_profiling() if profile or trace else None
+    results = build_pipeline(use_cache, fetch, combine, dynasty, scoring, weekly is not None, season).run()
+    board = results["rank"]
 
     pd.set_option("display.max_rows", 35)
     pd.set_option("display.width", 130)
     print("\n=== FANTASY DRAFT BOARD (Top 35) ===\n")
     print(board.head(35).to_string(index=False))
 
-    os.makedirs("output", exist_ok=True)
-    export_csv(board, path="output/draft_board.csv")
-    export_html(board, path="output/draft_board.html")
     print("\n✓ Exported: output/draft_board.csv")
     print("✓ Exported: output/draft_board.html")
 
+    if dynasty:
+        print("\n=== DYNASTY BOARD (Top 25) ===\n")
+        print(results["dynasty"].head(25).to_string(index=False))
+        print("\n✓ Exported: output/dynasty_board.csv")
+
+    if weekly is not None:
+        week_col = f"Week_{weekly}"
+        weekly_board = results["weekly"]
+        if week_col not in weekly_board.columns:
+            print(f"\n⚠ No week {weekly} in the schedule")
+        else:
+            print(f"\n=== WEEK {weekly} (Top 25) ===\n")
+            print(weekly_board.sort_values(week_col, ascending=False)
+                  [["Name", "Position", "Team", week_col]].head(25).to_string(index=False))
+            print(f"\n=== TWO-START SPs, WEEK {weekly} ===\n")
+            print(two_start_pitchers(weekly_board, weekly).head(25).to_string(index=False))
+        print("\n✓ Exported: output/weekly_board.csv")
+
+    if profiler is not None:
+        profiler.print_summary()
+        if profile:
+            profiler.write_json(profile)
+            print(f"✓ Profile: {profile}")
+        if trace:
+            profiler.write_chrome_trace(trace)
+            print(f"✓ Chrome trace: {trace} (open in chrome://tracing or ui.perfetto.dev)")
+
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Build the draft board.")
+    parser.add_argument("--fetch", action="store_true", help="fetch every source first (implies --combine)")
+    parser.add_argument("--combine", action="store_true", help="re-run combine_projections / combine_adp if their inputs changed")
+    parser.add_argument("--no-cache", action="store_true", help="recompute every stage")
+    parser.add_argument("--scoring", choices=("points",) + METHODS, default="points",
+                        help="points league, or categories valued by SGP or z-scores")
+    parser.add_argument("--dynasty", action="store_true", help="also build the multi-season dynasty/keeper board")
+    parser.add_argument("--season", type=int, metavar="YEAR",
+                        help="the season the board projects, for aligning dynasty projections (default this year)")
+    parser.add_argument("--weekly", nargs="?", type=int, const=1, metavar="WEEK",
+                        help="also build schedule-aware weekly projections and show WEEK (default 1)")
+    parser.add_argument("--profile", nargs="?", const="output/profile.json", metavar="PATH",
+                        help="record wall/CPU time, peak memory and rows per stage (default output/profile.json)")
+    parser.add_argument("--trace", nargs="?", const="output/profile.trace.json", metavar="PATH",
+                        help="also write a Chrome trace (default output/profile.trace.json)")
+    args = parser.parse_args()
+    main(use_cache=not args.no_cache, fetch=args.fetch, combine=args.combine,
+         profile=args.profile, trace=args.trace, dynasty=args.dynasty,
+         scoring=args.scoring, weekly=args.weekly, season=args.season)
@@ -0,0 +1,136 @@
+"""
+Auction draft helper: dollar values from the board's VORP, re-priced after
+every purchase.
+
+Values split the league's money between hitters and pitchers, give every
+rosterable player at least the minimum bid and cap anyone at the most a team
+can still pay (src/auction.py). Purchases are logged to output/auction_log.csv;
+each command replays the log and recomputes inflation and live values.
+
+Install deps:
+    pip install pandas pyarrow
+
+Run (after python main.py):
+    python scripts/auction.py values               # best available, pre-draft $ vs live $
+    python scripts/auction.py values --pitchers -n 40
+    python scripts/auction.py buy "juan soto" Mike 58
+    python scripts/auction.py undo
+    python scripts/auction.py teams                # spent / left / max bid per team
+    python scripts/auction.py reset                # new auction
+
+League settings: --teams, --budget, --min-bid, --hitter-share.
+"""
+
+import argparse
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from src.auction import BUDGET, HITTER_SHARE, MIN_BID, AuctionState  # noqa: E402
+from src.scarcity import TEAMS  # noqa: E402
+from src.storage import read_table  # noqa: E402
+
+BOARD_PATH = "output/draft_board.parquet"
+LOG_PATH   = "output/auction_log.csv"
+LOG_COLUMNS = ["Name", "Team", "Price"]
+
+
+def load_log(path: str = LOG_PATH) -> pd.DataFrame:
+    try:
+        return pd.read_csv(path)
+    except FileNotFoundError:
+        return pd.DataFrame(columns=LOG_COLUMNS)
+
+
+def save_log(state: AuctionState, path: str = LOG_PATH) -> None:
+    rows = [(state.board.at[r, "Name"], team, price) for r, team, price in state.purchases]
+    pd.DataFrame(rows, columns=LOG_COLUMNS).to_csv(path, index=False)
+
+
+def pick_name(state: AuctionState, query: str) -> str:
+    names = state.board["Name"]
+    exact = names[names.str.lower() == query.lower()]
+    matches = exact if len(exact) else names[names.str.lower().str.contains(query.lower(), regex=False)]
+    if len(matches) == 1:
+        return matches.iloc[0]
+    if matches.empty:
+        sys.exit(f"No player matches {query!r}")
+    sys.exit(f"{query!r} matches {len(matches)} players: {', '.join(matches.head(10))}")
+
+
+def print_values(state: AuctionState, n: int, hitters: bool | None) -> None:
+    live = state.recompute()
+    print(f"Money left ${live['money']:.0f}  ·  inflation {live['inflation']:.2f}x  ·  "
+          f"max bid ${live['cap']:.0f}  ·  {len(state.purchases)} bought  ({live['ms']:.1f} ms)\n")
+    table = state.table(n, hitters)
+    table["VORP"] = table["VORP"].astype("float64").round(1)
+    print(table.to_string(index=False))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Auction values and live inflation.")
+    parser.add_argument("--board", default=BOARD_PATH, help="board written by main.py")
+    parser.add_argument("--log", default=LOG_PATH, help="purchase log")
+    parser.add_argument("--teams", type=int, default=TEAMS)
+    parser.add_argument("--budget", type=int, default=BUDGET)
+    parser.add_argument("--min-bid", type=int, default=MIN_BID)
+    parser.add_argument("--hitter-share", type=float, default=HITTER_SHARE)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    values = sub.add_parser("values", help="best available by live value")
+    values.add_argument("-n", type=int, default=25)
+    side = values.add_mutually_exclusive_group()
+    side.add_argument("--hitters", action="store_true")
+    side.add_argument("--pitchers", action="store_true")
+
+    buy = sub.add_parser("buy", help="record a purchase")
+    buy.add_argument("name")
+    buy.add_argument("team")
+    buy.add_argument("price", type=float)
+
+    sub.add_parser("undo", help="remove the last purchase")
+    sub.add_parser("teams", help="budget left and max bid per team")
+    sub.add_parser("reset", help="clear the purchase log")
+    args = parser.parse_args()
+
+    if args.command == "reset":
+        if os.path.exists(args.log):
+            os.remove(args.log)
+        print("✓ Cleared auction log")
+        return
+
+    if not os.path.exists(args.board):
+        sys.exit(f"{args.board} not found — run 'python main.py' first.")
+    state = AuctionState(read_table(args.board), args.teams, args.budget, args.min_bid, args.hitter_share)
+    for _, row in load_log(args.log).iterrows():
+        state.buy(row["Name"], row["Team"], row["Price"])
+
+    if args.command == "values":
+        print_values(state, args.n, True if args.hitters else False if args.pitchers else None)
+    elif args.command == "buy":
+        name = pick_name(state, args.name)
+        value = state.recompute()["values"][state.row(name)]
+        try:
+            state.buy(name, args.team, args.price)
+        except ValueError as e:
+            sys.exit(str(e))
+        save_log(state, args.log)
+        print(f"✓ {name} to {args.team} for ${args.price:.0f} (live value ${value:.0f})\n")
+        print_values(state, 10, None)
+    elif args.command == "undo":
+        last = state.undo()
+        if last is None:
+            sys.exit("Nothing to undo")
+        save_log(state, args.log)
+        print(f"✓ Removed {state.board.at[last[0], 'Name']} ({last[1]}, ${last[2]:.0f})")
+    elif args.command == "teams":
+        if not state.purchases:
+            print("No purchases yet")
+        else:
+            print(state.teams_table().to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Backtests the draft board against past seasons: does VORP order beat ADP?
+
+Rebuilds each archived season's board (src/backtest.py describes the
+data/archive/<season>/ layout) and scores it against realized fantasy points —
+rank correlation, top-N hit rate and points captured per round — next to
+drafting by ADP and by raw projected points. Season × config jobs run in
+parallel processes.
+
+Install deps:
+    pip install pandas pyarrow rapidfuzz
+
+Run:
+    python scripts/backtest.py                          # every season, default league
+    python scripts/backtest.py --seasons 2022 2023
+    python scripts/backtest.py --teams 10 12 14         # one config per league size
+    python scripts/backtest.py --configs configs.json   # [{"name": "6sp", "slots": {"SP": 6}}, ...]
+    python scripts/backtest.py --workers 1              # no process pool
+
+Outputs: output/backtest.csv (per season / config / ranking) and
+output/backtest_rounds.csv (mean realized points per round).
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from src.backtest import ARCHIVE_DIR, TOP_N, discover_seasons, run_backtest  # noqa: E402
+
+SUMMARY_PATH = "output/backtest.csv"
+ROUNDS_PATH  = "output/backtest_rounds.csv"
+
+
+def load_configs(path: str | None, teams: list | None) -> list:
+    if path:
+        with open(path) as f:
+            configs = json.load(f)
+        return configs if isinstance(configs, list) else [configs]
+    if teams:
+        return [{"name": f"{n}team", "teams": n} for n in teams]
+    return [{"name": "default"}]
+
+
+def print_summary(summary, rounds) -> None:
+    metrics = ["spearman"] + [f"hit@{n}" for n in TOP_N] + ["points"]
+    print("\n=== Mean over seasons ===")
+    print(summary.groupby(["config", "ranking"], sort=True)[metrics].mean().round(3).to_string())
+
+    print("\n=== Mean realized points per pick, by round ===")
+    table = rounds.groupby(["round", "config", "ranking"])["points"].mean().unstack(["config", "ranking"]).round(1)
+    print(table.to_string())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backtest the draft board against archived seasons.")
+    parser.add_argument("--archive", default=ARCHIVE_DIR, help="directory of season folders")
+    parser.add_argument("--seasons", nargs="+", help="seasons to run (default: all complete ones)")
+    parser.add_argument("--teams", nargs="+", type=int, help="league sizes to compare")
+    parser.add_argument("--configs", help="JSON file with a list of configs (name, teams, rounds, slots)")
+    parser.add_argument("--workers", type=int, help="processes (default: one per CPU)")
+    parser.add_argument("--out", default=SUMMARY_PATH, help="summary CSV path")
+    args = parser.parse_args()
+
+    available = discover_seasons(args.archive)
+    seasons = args.seasons or available
+    missing = sorted(set(seasons) - set(available))
+    if missing:
+        print(f"⚠ Skipping seasons without projections/adp/actuals in {args.archive}: {', '.join(missing)}")
+        seasons = [s for s in seasons if s in available]
+    if not seasons:
+        sys.exit(f"No complete seasons in {args.archive}/ — see src/backtest.py for the layout.")
+
+    configs = load_configs(args.configs, args.teams)
+    print(f"Backtesting {len(seasons)} seasons × {len(configs)} configs...")
+    start = time.perf_counter()
+    summary, rounds = run_backtest(seasons, configs, args.archive, args.workers)
+    if summary.empty:
+        sys.exit("Every backtest job failed.")
+    print(f"✓ {len(summary) // len(set(summary['ranking']))} jobs in {time.perf_counter() - start:.1f}s")
+
+    print_summary(summary, rounds)
+    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+    summary.to_csv(args.out, index=False)
+    rounds_path = os.path.join(os.path.dirname(args.out) or ".", os.path.basename(ROUNDS_PATH))
+    rounds.to_csv(rounds_path, index=False)
+    print(f"\n✓ Saved {args.out} and {rounds_path}")
+
+
+if __name__ == "__main__":
+    main()
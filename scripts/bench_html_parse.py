@@ -0,0 +1,146 @@
+"""
+Benchmarks the lxml table parsers in html_tables.py against the previous
+BeautifulSoup implementation, and checks both produce the same DataFrame.
+
+Run:
+    python scripts/bench_html_parse.py
+    python scripts/bench_html_parse.py --rows 1500 --repeat 5
+    python scripts/bench_html_parse.py --fp-page saved/of.php.html --bbref-page saved/batting.html
+
+Without saved pages, the trimmed FantasyPros and Baseball Reference pages in
+tests/fixtures/ are used, their rows repeated up to --rows.
+"""
+
+import argparse
+import os
+import time
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+from fetch_bbref_projections import BR_COL_MAP, parse_bbref_page
+from fetch_fantasypros_projections import BATTER_COL_MAP, parse_projection_page
+
+FIXTURES   = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tests", "fixtures")
+FP_PAGE    = os.path.join(FIXTURES, "fantasypros_1b.html")
+BBREF_PAGE = os.path.join(FIXTURES, "bbref_standard_batting.html")
+
+
+# --- previous BeautifulSoup implementations (parse part only) ---------------
+
+def legacy_fp(html: str, pos: str, col_map: dict) -> pd.DataFrame:
+    soup = BeautifulSoup(html, "html.parser")
+    table = soup.find("table", {"id": "data"})
+    headers_raw = [th.text.strip() for th in table.find("thead").find_all("th")]
+    rows = []
+    for tr in table.find("tbody").find_all("tr"):
+        cells = tr.find_all("td")
+        if len(cells) < 2:
+            continue
+        row = {}
+        for i, th in enumerate(headers_raw):
+            if i < len(cells):
+                text = cells[i].text.strip()
+                if th == "Player":
+                    name_tag = cells[i].find("a")
+                    text = name_tag.text.strip() if name_tag else text
+                    text = text.split(" - ")[0].strip()
+                row[th] = text
+        rows.append(row)
+    df = pd.DataFrame(rows)
+    df = df.rename(columns={k: v for k, v in col_map.items() if k in df.columns})
+    keep = list(dict.fromkeys(["Name"] + [v for v in col_map.values() if v != "Name" and v in df.columns]))
+    df = df[[c for c in keep if c in df.columns]].copy()
+    for col in df.columns:
+        if col != "Name":
+            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
+    df["Position"] = pos
+    return df
+
+
+def legacy_bbref(html: str, table_id: str, pos_label: str) -> pd.DataFrame:
+    soup = BeautifulSoup(html, "html.parser")
+    table = soup.find("table", {"id": table_id}) or soup.find("table", {"class": "stats_table"})
+    rows = []
+    for tr in table.find_all("tr"):
+        if tr.get("class") and "thead" in tr.get("class", []):
+            continue
+        cells = tr.find_all(["td", "th"])
+        if not cells:
+            continue
+        row = {}
+        for td in cells:
+            col = td.get("data-stat", "")
+            if col:
+                if col == "player":
+                    link = td.find("a")
+                    row["Name"] = link.text.strip() if link else td.text.strip()
+                else:
+                    row[col] = td.text.strip()
+        if "Name" in row and row["Name"]:
+            rows.append(row)
+    df = pd.DataFrame(rows).rename(columns=BR_COL_MAP)
+    for col in df.columns:
+        if col != "Name":
+            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
+    df = df[df["Name"].str.len() > 3]
+    df = df.drop_duplicates(subset="Name", keep="first")
+    df["Position"] = pos_label
+    df["Source"] = "BBRef_2025"
+    return df
+
+
+# --- pages -------------------------------------------------------------------
+
+def tiled_page(html: str, rows: int) -> str:
+    """`html` with its <tbody> rows repeated until the table has at least `rows` rows."""
+    head, rest = html.split("<tbody>", 1)
+    body, tail = rest.split("</tbody>", 1)
+    copies = max(1, -(-rows // max(1, body.count("<tr"))))
+    return f"{head}<tbody>{body * copies}</tbody>{tail}"
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _check(name: str, new: pd.DataFrame, old: pd.DataFrame) -> None:
+    pd.testing.assert_frame_equal(
+        new.reset_index(drop=True), old.reset_index(drop=True),
+        check_dtype=False, check_column_type=False,
+    )
+    print(f"  {name}: outputs match ({len(new)} rows x {new.shape[1]} cols)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML table parsing.")
+    parser.add_argument("--rows", type=int, default=1000, help="rows per fixture page after tiling")
+    parser.add_argument("--repeat", type=int, default=3, help="timing repeats (best of)")
+    parser.add_argument("--fp-page", help="saved FantasyPros batter projection page")
+    parser.add_argument("--bbref-page", help="saved Baseball Reference standard batting page")
+    args = parser.parse_args()
+
+    fp_html = open(args.fp_page).read() if args.fp_page else tiled_page(open(FP_PAGE).read(), args.rows)
+    br_html = open(args.bbref_page).read() if args.bbref_page else tiled_page(open(BBREF_PAGE).read(), args.rows)
+
+    print("Checking parsers agree...")
+    _check("FantasyPros", parse_projection_page(fp_html, "OF", BATTER_COL_MAP), legacy_fp(fp_html, "OF", BATTER_COL_MAP))
+    _check("BBRef", parse_bbref_page(br_html, "batting_standard", "BAT"), legacy_bbref(br_html, "batting_standard", "BAT"))
+
+    print(f"\nParse time per page (best of {args.repeat}):")
+    print(f"{'page':14} {'bs4 ms':>9} {'lxml ms':>9} {'speedup':>8}")
+    for name, old, new in (
+        ("FantasyPros", lambda: legacy_fp(fp_html, "OF", BATTER_COL_MAP), lambda: parse_projection_page(fp_html, "OF", BATTER_COL_MAP)),
+        ("BBRef",       lambda: legacy_bbref(br_html, "batting_standard", "BAT"), lambda: parse_bbref_page(br_html, "batting_standard", "BAT")),
+    ):
+        t_old, t_new = _time(old, args.repeat), _time(new, args.repeat)
+        print(f"{name:14} {t_old * 1000:9.1f} {t_new * 1000:9.1f} {t_old / t_new:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,89 +1,85 @@
 """
-Combines FantasyPros and ESPN ADP into a consensus ADP file.
-Run after both fetch scripts have been run.
+Combines ADP from any number of sources into a consensus ADP file.
+Run after the fetch scripts (and/or after dropping NFBC / Yahoo / CBS exports
+into data/ — any CSV with a Name column and an ADP column works).
 
     python scripts/combine_adp.py
+
+Sources and weights live in ADP_SOURCES below; missing files are skipped.
 """
 
+import os
+import sys
+
 import pandas as pd
-from thefuzz import process as fuzz_process
 
-FP_PATH   = "data/fantasypros_adp.csv"
-ESPN_PATH = "data/espn_adp.csv"
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from src.adp_consensus import STAT_COLS, align_sources, consensus_adp, drop_fringe  # noqa: E402
+from src.adp_history import append_snapshot  # noqa: E402
+from src.storage import parquet_path, write_with_csv  # noqa: E402
+
 OUT_PATH  = "data/adp.csv"
 FUZZY_THRESHOLD = 88
-
-
-def fuzzy_merge(df_left, df_right, left_on, right_on, threshold=FUZZY_THRESHOLD):
-    right_names = df_right[right_on].tolist()
-    matched_rows = []
-
-    for _, row in df_left.iterrows():
-        query = row[left_on]
-        result = fuzz_process.extractOne(query, right_names)
-        if result is None:
-            matched_rows.append(row.to_dict())
-            continue
-
-        # thefuzz returns (match, score) or (match, score, key) depending on version
-        match = result[0]
-        score = result[1]
-
-        if score >= threshold:
-            right_row = df_right[df_right[right_on] == match].iloc[0]
-            merged = {**row.to_dict(), **right_row.to_dict()}
-            merged["match_score"] = score
-            matched_rows.append(merged)
-        else:
-            matched_rows.append(row.to_dict())
-
-    return pd.DataFrame(matched_rows)
-
-
-def combine_adp(fp_path=FP_PATH, espn_path=ESPN_PATH, out_path=OUT_PATH):
+MIN_SOURCES     = 2
+
+# label -> file, ADP column in that file, consensus weight, and optionally
+# "undrafted": the ADP a site gives players nobody drafts (ESPN parks them at
+# ~260, the last pick of a 26-round, 10-team draft); values at or past it are
+# treated as not listed. The first available source supplies display names,
+# and players it doesn't list need at least MIN_SOURCES sources.
+ADP_SOURCES = {
+    "FP":    {"path": "data/fantasypros_adp.csv", "column": "ADP_FP",   "weight": 1.0},
+    "ESPN":  {"path": "data/espn_adp.csv",        "column": "ADP_ESPN", "weight": 1.0, "undrafted": 259.0},
+    "NFBC":  {"path": "data/nfbc_adp.csv",        "column": "ADP",      "weight": 1.0},
+    "YAHOO": {"path": "data/yahoo_adp.csv",       "column": "ADP",      "weight": 1.0},
+    "CBS":   {"path": "data/cbs_adp.csv",         "column": "ADP",      "weight": 1.0},
+}
+
+
+def load_adp_sources(config: dict = ADP_SOURCES) -> dict:
+    """Load each configured file as DataFrame[Name, ADP]; skip missing ones."""
     sources = {}
-    try:
-        sources["fp"] = pd.read_csv(fp_path)
-        print(f"✓ Loaded FantasyPros ADP: {len(sources['fp'])} players")
-    except FileNotFoundError:
-        print(f"⚠ {fp_path} not found")
-
-    try:
-        sources["espn"] = pd.read_csv(espn_path)
-        print(f"✓ Loaded ESPN ADP: {len(sources['espn'])} players")
-    except FileNotFoundError:
-        print(f"⚠ {espn_path} not found")
-
+    for label, src in config.items():
+        try:
+            df = pd.read_csv(src["path"], usecols=["Name", src["column"]])
+        except FileNotFoundError:
+            continue
+        except ValueError as e:
+            print(f"⚠ {src['path']}: {e}")
+            continue
+        df = df.rename(columns={src["column"]: "ADP"})
+        df["ADP"] = pd.to_numeric(df["ADP"], errors="coerce")
+        sources[label] = df
+        print(f"✓ Loaded {label} ADP: {len(df)} players ({src['path']})")
+        if "undrafted" in src:
+            capped = df["ADP"] >= src["undrafted"]
+            df.loc[capped, "ADP"] = float("nan")
+            print(f"  {int(capped.sum())} at the undrafted ADP ({src['undrafted']:g}+) treated as unlisted")
+    return sources
+
+
+def combine_adp(sources_config: dict = ADP_SOURCES, out_path=OUT_PATH):
+    sources = load_adp_sources(sources_config)
     if not sources:
         raise RuntimeError("No ADP source files found.")
 
-    if len(sources) == 1:
-        key = list(sources.keys())[0]
-        df = sources[key].copy()
-        adp_col = "ADP_FP" if key == "fp" else "ADP_ESPN"
-        df = df.rename(columns={adp_col: "ADP"})[["Name", "ADP"]]
-        df.to_csv(out_path, index=False)
-        print(f"✓ Saved {len(df)} players to {out_path}")
-        return df
-
-    fp_df   = sources["fp"][["Name", "ADP_FP"]].copy()
-    espn_df = sources["espn"][["Name", "ADP_ESPN"]].copy()
-
-    print(f"Fuzzy-merging {len(fp_df)} FantasyPros players against {len(espn_df)} ESPN players...")
-    merged = fuzzy_merge(fp_df, espn_df, left_on="Name", right_on="Name")
-
-    adp_cols = [c for c in ["ADP_FP", "ADP_ESPN"] if c in merged.columns]
-    merged["ADP"] = merged[adp_cols].mean(axis=1).round(1)
-
-    result = merged[["Name", "ADP"] + adp_cols].sort_values("ADP").reset_index(drop=True)
-    result.to_csv(out_path, index=False)
-    print(f"✓ Consensus ADP saved: {len(result)} players → {out_path}")
-
-    if "match_score" in merged.columns:
-        low_conf = merged[merged.get("match_score", pd.Series(dtype=float)) < 95][["Name", "match_score"]].dropna()
-        if not low_conf.empty:
-            print(f"\n⚠ {len(low_conf)} fuzzy matches below 95% confidence:")
-            print(low_conf.head(20).to_string(index=False))
+    print(f"Aligning {len(sources)} sources...")
+    long, names = align_sources(sources, threshold=FUZZY_THRESHOLD)
+    weights = {label: sources_config[label].get("weight", 1.0) for label in sources}
+    result = drop_fringe(consensus_adp(long, names, weights), next(iter(sources)), MIN_SOURCES)
+
+    source_cols = [f"ADP_{label}" for label in sources]
+    result = result[["Name"] + STAT_COLS + source_cols]
+    write_with_csv(result, out_path)
+    print(f"✓ Consensus ADP saved: {len(result)} players → {parquet_path(out_path)} (+ CSV)")
+    append_snapshot(result)
+
+    low_conf = long[long["match_score"] < 95].merge(
+        pd.DataFrame({"Player_ID": names.index, "Name": names.to_numpy()}), on="Player_ID"
+    )
+    if not low_conf.empty:
+        print(f"\n⚠ {len(low_conf)} fuzzy matches below 95% confidence:")
+        print(low_conf[["Name", "source", "match_score"]].head(20).to_string(index=False))
 
     print(f"\n=== Consensus ADP (Top 30) ===")
     print(result.head(30).to_string(index=False))
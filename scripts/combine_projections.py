@@ -11,19 +11,37 @@ Run after all three fetch scripts:
     python scripts/fetch_bbref_projections.py
     python scripts/combine_projections.py
 
+Per-system FanGraphs files (data/fangraphs_<system>.parquet, from
+fetch_fangraphs_projections.py --systems) replace the single FanGraphs CSV
+only when they are newer than it; --fg-systems uses them regardless:
+    python scripts/combine_projections.py --fg-systems
+
 Outputs:
-    data/projections.csv   <- replaces the hand-built file, used by main.py
+    data/projections.parquet   <- typed table used by main.py
+    data/projections.csv       <- same data as a CSV export
 """
 
+import argparse
+import glob
+import os
+import sys
+
 import pandas as pd
 import numpy as np
 from thefuzz import process as fuzz_process
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from src.storage import parquet_path, write_with_csv  # noqa: E402
+
 # Source files
 FP_PATH    = "data/fantasypros_projections.csv"
 FG_PATH    = "data/fangraphs_projections.csv"
 BR_PATH    = "data/bbref_projections.csv"
 
+# Per-system FanGraphs files from `fetch_fangraphs_projections.py --systems ...`.
+# When used, each system is its own source and they share the "fg" weight.
+FG_SYSTEMS_GLOB = "data/fangraphs_*.parquet"
+
 OUT_PATH   = "data/projections.csv"
 
 # Source weights (must sum to 1.0 across available sources)
@@ -35,11 +53,13 @@ WEIGHTS = {
 
 FUZZY_THRESHOLD = 88
 
+PITCHER_POSITIONS = ("SP", "RP", "P", "PIT")
+
 # Stats we care about — map to internal column names used by scoring.py
 # Batters
-BATTER_STATS = ["H", "2B", "3B", "HR", "R", "RBI", "BB", "K", "SB"]
+BATTER_STATS = ["AB", "H", "2B", "3B", "HR", "R", "RBI", "BB", "K", "SB"]
 # Pitchers
-PITCHER_STATS = ["IP", "ER", "K_pitch", "QS", "SV", "HLD", "H_allowed", "BB_issued", "CG", "NH", "PG", "GS"]
+PITCHER_STATS = ["IP", "W", "ER", "K_pitch", "QS", "SV", "HLD", "H_allowed", "BB_issued", "CG", "NH", "PG", "GS"]
 
 # Rare events — set to 0 (can't project these reliably)
 RARE_EVENTS = {"CYC": 0, "GSHR": 0, "NH": 0, "PG": 0}
@@ -52,15 +72,15 @@ def fuzzy_match_name(name: str, candidates: list, threshold: int = FUZZY_THRESHO
     return None
 
 
-def normalize_weights(available_sources: list) -> dict:
+def normalize_weights(available_sources: list, weights: dict = WEIGHTS) -> dict:
     """Redistribute weights if a source is missing."""
-    total = sum(WEIGHTS[s] for s in available_sources)
-    return {s: WEIGHTS[s] / total for s in available_sources}
+    total = sum(weights[s] for s in available_sources)
+    return {s: weights[s] / total for s in available_sources}
 
 
 def load_source(path: str, label: str) -> pd.DataFrame | None:
     try:
-        df = pd.read_csv(path)
+        df = pd.read_parquet(path) if path.endswith(".parquet") else pd.read_csv(path)
         print(f"✓ Loaded {label}: {len(df)} players")
         return df
     except FileNotFoundError:
@@ -68,6 +88,32 @@ def load_source(path: str, label: str) -> pd.DataFrame | None:
         return None
 
 
+def load_fangraphs_systems(pattern: str = FG_SYSTEMS_GLOB, csv_path: str = FG_PATH,
+                           use: bool | None = None) -> dict:
+    """
+    Load the per-system FanGraphs files, keyed by system name (steamer, zips, ...).
+    By default a file is only used if it is newer than the single-system CSV
+    at csv_path, so files left by an old --systems run don't replace a fresh
+    fetch; use=True takes every file, use=False none.
+    """
+    if use is False:
+        return {}
+    paths = sorted(glob.glob(pattern))
+    if use is None and os.path.exists(csv_path):
+        stale = [p for p in paths if os.path.getmtime(p) < os.path.getmtime(csv_path)]
+        if stale:
+            print(f"⚠ {', '.join(stale)} older than {csv_path} — skipping (--fg-systems to use them)")
+        paths = [p for p in paths if p not in stale]
+
+    systems = {}
+    for path in paths:
+        system = os.path.basename(path)[len("fangraphs_"):-len(".parquet")]
+        df = load_source(path, f"FanGraphs {system.upper()}")
+        if df is not None:
+            systems[system] = df
+    return systems
+
+
 def align_to_master(master_names: list, source_df: pd.DataFrame) -> pd.DataFrame:
     """
     For each name in master_names, find the best fuzzy match in source_df.
@@ -119,24 +165,31 @@ def weighted_average_stats(sources: dict, weights: dict, stat_cols: list) -> pd.
     return result
 
 
-def infer_position(fp_df, fg_df, br_df, name: str) -> str:
-    """Get position from whichever source has it."""
-    for df in [fp_df, fg_df, br_df]:
+def _positions(frames: list, name: str) -> list:
+    """`name`'s Position in each source that lists it, in source order."""
+    out = []
+    for df in frames:
         if df is None or "Position" not in df.columns:
             continue
         match = df[df["Name"] == name]
         if not match.empty:
-            pos = match.iloc[0].get("Position", "")
-            if pos and pos not in ("BAT", "PIT", ""):
-                return pos
+            out.append(match.iloc[0].get("Position", ""))
+    return out
+
+
+def infer_position(frames: list, name: str) -> str:
+    """Get position from whichever source has it; frames in priority order."""
+    positions = _positions(frames, name)
+    for pos in positions:
+        if pos and pos not in ("BAT", "PIT", ""):
+            return pos
     # Fall back to BAT/PIT label
-    for df in [fp_df, fg_df, br_df]:
-        if df is None or "Position" not in df.columns:
-            continue
-        match = df[df["Name"] == name]
-        if not match.empty:
-            return match.iloc[0].get("Position", "")
-    return ""
+    return positions[0] if positions else ""
+
+
+def is_pitcher(frames: list, name: str) -> bool:
+    """True if any source lists `name` at a pitcher position."""
+    return any(str(pos) in PITCHER_POSITIONS for pos in _positions(frames, name))
 
 
 def combine_projections(
@@ -144,35 +197,33 @@ def combine_projections(
     fg_path=FG_PATH,
     br_path=BR_PATH,
     out_path=OUT_PATH,
+    fg_systems: bool | None = None,
 ) -> pd.DataFrame:
-
+    """fg_systems: use the per-system FanGraphs files (True), never (False) or when newer than fg_path (None)."""
     fp_df = load_source(fp_path, "FantasyPros")
-    fg_df = load_source(fg_path, "FanGraphs")
+    systems = load_fangraphs_systems(csv_path=fg_path, use=fg_systems)
+    fg_sources = ([(f"fg_{system}", df) for system, df in systems.items()]
+                  or [("fg", load_source(fg_path, "FanGraphs"))])
     br_df = load_source(br_path, "BBRef/Savant")
-
-    available = {k: df for k, df in [("fp", fp_df), ("fg", fg_df), ("br", br_df)] if df is not None}
+    # position lookups consult every source, each FanGraphs system included
+    frames = [fp_df, *(df for _, df in fg_sources), br_df]
+    available = {k: df for k, df in [("fp", fp_df), *fg_sources, ("br", br_df)] if df is not None}
 
     if not available:
         raise RuntimeError("No projection sources available. Run fetch scripts first.")
 
-    weights = normalize_weights(list(available.keys()))
+    source_weights = dict(WEIGHTS)
+    for label, _ in fg_sources:
+        if label != "fg":
+            source_weights[label] = WEIGHTS["fg"] / len(fg_sources)
+    weights = normalize_weights(list(available.keys()), source_weights)
     print(f"\nUsing weights: { {k: f'{v:.0%}' for k, v in weights.items()} }")
 
     # Build master player list from FantasyPros (or best available)
-    keys = list(available.keys()); primary = available[keys[0]]
+    primary = next(iter(available.values()))
     master_names = primary["Name"].tolist()
     print(f"\nMaster player list: {len(master_names)} players")
 
-    # --- Separate batters and pitchers ---
-    def is_pitcher(df, name):
-        if df is None or "Position" not in df.columns:
-            return False
-        match = df[df["Name"] == name]
-        if match.empty:
-            return False
-        pos = str(match.iloc[0].get("Position", ""))
-        return pos in ("SP", "RP", "P", "PIT") or "K_pitch" in match.columns
-
     # Build combined output rows
     rows = []
     print("Building consensus projections...")
@@ -181,12 +232,8 @@ def combine_projections(
         row = {"Name": name}
 
         # Determine if pitcher or batter from position
-        pos = infer_position(fp_df, fg_df, br_df, name)
-        pitcher = pos in ("SP", "RP", "P", "PIT") or (pos == "" and any(
-            df is not None and name in df["Name"].values and
-            df[df["Name"] == name].iloc[0].get("Position", "") in ("SP", "RP", "P", "PIT")
-            for df in [fp_df, fg_df, br_df]
-        ))
+        pos = infer_position(frames, name)
+        pitcher = pos in PITCHER_POSITIONS or (pos == "" and is_pitcher(frames, name))
 
         # Assign clean position
         if pos in ("BAT", ""):
@@ -246,17 +293,21 @@ def combine_projections(
     final_cols = [
         "Name", "Position",
         # Batter stats
-        "H", "2B", "3B", "HR", "R", "RBI", "BB", "K", "SB", "CYC", "GSHR",
+        "AB", "H", "2B", "3B", "HR", "R", "RBI", "BB", "K", "SB", "CYC", "GSHR",
         # Pitcher stats
-        "IP", "ER", "K_pitch", "QS", "SV", "HLD", "GS", "H_allowed", "BB_issued", "CG", "NH", "PG",
+        "IP", "W", "ER", "K_pitch", "QS", "SV", "HLD", "GS", "H_allowed", "BB_issued", "CG", "NH", "PG",
     ]
     df_out = df_out[[c for c in final_cols if c in df_out.columns]]
 
-    df_out.to_csv(out_path, index=False)
-    print(f"\n✓ Consensus projections saved: {len(df_out)} players → {out_path}")
+    write_with_csv(df_out, out_path)
+    print(f"\n✓ Consensus projections saved: {len(df_out)} players → {parquet_path(out_path)} (+ CSV)")
     print(df_out.head(10).to_string(index=False))
     return df_out
 
 
 if __name__ == "__main__":
-    combine_projections()
+    parser = argparse.ArgumentParser(description="Combine projection sources into a weighted consensus.")
+    parser.add_argument("--fg-systems", action="store_true", default=None,
+                        help=f"use {FG_SYSTEMS_GLOB} even if older than {FG_PATH}")
+    args = parser.parse_args()
+    combine_projections(fg_systems=args.fg_systems)
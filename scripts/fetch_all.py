@@ -0,0 +1,166 @@
+"""
+Runs every fetcher concurrently, then the two combine steps — a full data
+refresh in one command instead of seven scripts.
+
+Install deps:
+    pip install requests beautifulsoup4 lxml pandas pyarrow thefuzz rapidfuzz python-Levenshtein
+
+Run:
+    python scripts/fetch_all.py
+    python scripts/fetch_all.py --only fantasypros_adp espn_players
+    python scripts/fetch_all.py --skip espn_players --no-combine
+    python scripts/fetch_all.py --fg-systems steamer zips atc
+    python scripts/fetch_all.py --offline      # replay recorded responses, no network
+
+All fetchers share one pooled HTTP session (scripts/http_client.py), which
+caps concurrent requests per host; --workers bounds how many fetchers run at
+once. Outputs are written atomically, so a failed source keeps its previous
+file. ESPN credentials come from ESPN_S2 / SWID as usual.
+
+Responses go through the on-disk cache in scripts/http_cache.py: pages still
+inside their TTL aren't requested at all, and stale ones are revalidated with
+ETag / Last-Modified. --offline replays the cache without any network access;
+--no-cache bypasses it.
+
+Requests are rate-limited per host and transient failures (timeouts, 429,
+5xx) are retried with backoff, so one flaky response no longer drops a whole
+source from the consensus. Per-request latency and retry counts are written to
+data/fetch_metrics.json and summarised per host at the end.
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from combine_adp import combine_adp
+from combine_projections import combine_projections
+from fetch_bbref_projections import fetch_bbref_projections
+from fetch_espn_players import fetch_espn_players
+from fetch_fangraphs_projections import fetch_fangraphs_projections, fetch_fangraphs_systems
+from fetch_fantasypros_adp import fetch_fantasypros_adp
+from fetch_fantasypros_projections import fetch_fantasypros_projections
+from http_client import atomic_path, configure_cache, get_session
+
+FETCHERS = {
+    "fantasypros_projections": fetch_fantasypros_projections,
+    "fangraphs_projections":   fetch_fangraphs_projections,
+    "savant_bbref":            fetch_bbref_projections,
+    "fantasypros_adp":         fetch_fantasypros_adp,
+    "espn_players":            fetch_espn_players,   # ADP + eligibility + raw dump
+}
+
+COMBINERS = {
+    "combine_projections": combine_projections,
+    "combine_adp":         combine_adp,
+}
+
+MAX_WORKERS = 6
+
+METRICS_PATH = "data/fetch_metrics.json"
+
+
+def _rows(result) -> int | None:
+    if isinstance(result, dict):
+        return sum(len(df) for df in result.values())
+    return len(result) if hasattr(result, "__len__") else None
+
+
+def _timed(name: str, fn) -> dict:
+    start_wall, start_cpu = time.perf_counter(), time.thread_time()
+    try:
+        result = fn()
+        rows = _rows(result)
+        status = "ok" if rows else "empty"
+        error = ""
+    except Exception as e:
+        rows, status, error = None, "failed", f"{type(e).__name__}: {e}"
+    return {
+        "source":  name,
+        "status":  status,
+        "rows":    rows,
+        "seconds": time.perf_counter() - start_wall,
+        "cpu":     time.thread_time() - start_cpu,
+        "error":   error,
+    }
+
+
+def run_parallel(jobs: dict, max_workers: int = MAX_WORKERS) -> list:
+    """Run {name: zero-arg callable} on a bounded thread pool; return per-job timings."""
+    if not jobs:
+        return []
+    timings = []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs)))) as pool:
+        futures = [pool.submit(_timed, name, fn) for name, fn in jobs.items()]
+        for future in as_completed(futures):
+            timings.append(future.result())
+    order = list(jobs)
+    return sorted(timings, key=lambda t: order.index(t["source"]))
+
+
+def print_timings(timings: list, total: float) -> None:
+    print("\n=== Fetch summary ===")
+    print(f"{'source':26} {'status':8} {'rows':>6} {'wall s':>8} {'cpu s':>7}")
+    for t in timings:
+        rows = "–" if t["rows"] is None else t["rows"]
+        print(f"{t['source']:26} {t['status']:8} {rows:>6} {t['seconds']:8.2f} {t['cpu']:7.2f}  {t['error']}")
+    print(f"{'total':26} {'':8} {'':>6} {total:8.2f}")
+
+    session = get_session()
+    if session.cache is not None:
+        print("HTTP cache: " + ", ".join(f"{k} {v}" for k, v in session.cache.stats.items()))
+
+    summary = session.metrics.summary()
+    if summary:
+        print(f"\n{'host':32} {'reqs':>5} {'cached':>6} {'retry':>5} {'fail':>4} {'p50 s':>6} {'p95 s':>6} {'wait s':>7}")
+        for host, m in summary.items():
+            print(f"{host:32} {m['requests']:5} {m['cached']:6} {m['retries']:5} {m['failed']:4} "
+                  f"{m['p50']:6.2f} {m['p95']:6.2f} {m['wait']:7.1f}")
+
+
+def write_metrics(path: str = METRICS_PATH) -> None:
+    with atomic_path(path) as tmp:
+        get_session().metrics.dump(tmp)
+    print(f"✓ Request metrics saved to {path}")
+
+
+def fetch_all(only=None, skip=(), combine: bool = True, fg_systems=None,
+              max_workers: int = MAX_WORKERS) -> list:
+    fetchers = dict(FETCHERS)
+    if fg_systems:
+        fetchers["fangraphs_projections"] = lambda: fetch_fangraphs_systems(fg_systems)
+    names = [n for n in fetchers if (not only or n in only) and n not in skip]
+
+    start = time.perf_counter()
+    timings = run_parallel({n: fetchers[n] for n in names}, max_workers)
+    if combine:
+        # combine_projections and combine_adp read disjoint files, so they can overlap too
+        timings += run_parallel(COMBINERS, max_workers)
+    print_timings(timings, time.perf_counter() - start)
+    write_metrics()
+    return timings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fetch every data source concurrently, then combine.")
+    parser.add_argument("--only", nargs="+", choices=list(FETCHERS), help="run just these fetchers")
+    parser.add_argument("--skip", nargs="+", choices=list(FETCHERS), default=[], help="skip these fetchers")
+    parser.add_argument("--no-combine", action="store_true", help="don't run combine_projections / combine_adp")
+    parser.add_argument("--fg-systems", nargs="+", metavar="SYSTEM", help="fetch these FanGraphs systems to Parquet")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS, help="max fetchers running at once")
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument("--offline", action="store_true", help="replay cached responses only (no network)")
+    cache_group.add_argument("--no-cache", action="store_true", help="bypass the HTTP cache")
+    args = parser.parse_args()
+
+    if args.offline:
+        configure_cache("replay")
+    elif args.no_cache:
+        configure_cache("off")
+
+    fetch_all(
+        only=args.only,
+        skip=args.skip,
+        combine=not args.no_combine,
+        fg_systems=args.fg_systems,
+        max_workers=args.workers,
+    )
@@ -8,25 +8,17 @@ If BR projections aren't available, it falls back to pulling from
 baseballsavant.mlb.com Statcast expected stats as a proxy.
 
 Install deps:
-    pip install requests beautifulsoup4 pandas
+    pip install requests lxml pandas
 
 Run:
     python scripts/fetch_bbref_projections.py
 """
 
-import requests
 import pandas as pd
 import io
-import json
-from bs4 import BeautifulSoup
-
-HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0.0.0 Safari/537.36"
-    )
-}
+
+from html_tables import parse_data_stat_table, to_float
+from http_client import HEADERS, atomic_to_csv, get_session
 
 # Baseball Savant leaderboard CSV export (xStats - expected stats based on Statcast)
 # These aren't projections per se, but xBA/xSLG/xwOBA are strong forward-looking indicators
@@ -89,7 +81,7 @@ PITCHER_COL_MAP = {
 
 def fetch_savant_csv(url: str, col_map: dict, pos_label: str) -> pd.DataFrame:
     """Fetch Baseball Savant CSV export."""
-    resp = requests.get(url, headers=HEADERS, timeout=20)
+    resp = get_session().get(url, headers=HEADERS, timeout=20)
     resp.raise_for_status()
 
     df = pd.read_csv(io.StringIO(resp.text))
@@ -119,67 +111,32 @@ def fetch_savant_csv(url: str, col_map: dict, pos_label: str) -> pd.DataFrame:
     return df
 
 
-def fetch_bbref_table(url: str, col_map: dict, pos_label: str) -> pd.DataFrame:
-    """Scrape Baseball Reference standard stats table."""
-    resp = requests.get(url, headers=HEADERS, timeout=20)
-    resp.raise_for_status()
-
-    soup = BeautifulSoup(resp.text, "html.parser")
-
-    # BR uses id="batting_standard" or "pitching_standard"
-    table_id = "batting_standard" if "batting" in url else "pitching_standard"
-    table = soup.find("table", {"id": table_id})
+# Map BR stat column names to our internal names
+BR_COL_MAP = {
+    "R": "R", "H": "H", "2B": "2B", "3B": "3B", "HR": "HR",
+    "RBI": "RBI", "SB": "SB", "BB": "BB", "SO": "K",
+    "batting_avg": "AVG", "IP": "IP", "ER": "ER",
+    "hits_allowed": "H_allowed", "bases_on_balls": "BB_issued",
+    "strikeouts": "K_pitch", "earned_run_avg": "ERA",
+    "whip": "WHIP", "sv": "SV", "G": "G", "GS": "GS",
+}
 
-    if table is None:
-        # Try any stats table
-        table = soup.find("table", {"class": "stats_table"})
 
-    if table is None:
-        print(f"  ⚠ No table found at {url}")
+def parse_bbref_page(html: str, table_id: str, pos_label: str) -> pd.DataFrame | None:
+    """Parse a BR standard stats page; None if no stats table is found."""
+    # BR uses id="batting_standard" or "pitching_standard"; else any stats table
+    columns = parse_data_stat_table(html, table_id, fallback_class="stats_table")
+    if columns is None:
+        return None
+    if "Name" not in columns or not columns["Name"]:
         return pd.DataFrame()
 
-    rows = []
-    for tr in table.find_all("tr"):
-        # Skip header rows and separator rows
-        if tr.get("class") and "thead" in tr.get("class", []):
-            continue
-        cells = tr.find_all(["td", "th"])
-        if not cells:
-            continue
-
-        row = {}
-        for td in cells:
-            col = td.get("data-stat", "")
-            if col:
-                # Get player name from link if available
-                if col == "player":
-                    link = td.find("a")
-                    row["Name"] = link.text.strip() if link else td.text.strip()
-                else:
-                    row[col] = td.text.strip()
-        if "Name" in row and row["Name"]:
-            rows.append(row)
-
-    if not rows:
-        return pd.DataFrame()
-
-    df = pd.DataFrame(rows)
-
-    # Map BR stat column names to our internal names
-    br_col_map = {
-        "R": "R", "H": "H", "2B": "2B", "3B": "3B", "HR": "HR",
-        "RBI": "RBI", "SB": "SB", "BB": "BB", "SO": "K",
-        "batting_avg": "AVG", "IP": "IP", "ER": "ER",
-        "hits_allowed": "H_allowed", "bases_on_balls": "BB_issued",
-        "strikeouts": "K_pitch", "earned_run_avg": "ERA",
-        "whip": "WHIP", "sv": "SV", "G": "G", "GS": "GS",
-    }
-
-    df = df.rename(columns=br_col_map)
-
-    for col in df.columns:
-        if col != "Name":
-            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
+    data = {}
+    for stat, values in columns.items():
+        col = BR_COL_MAP.get(stat, stat)
+        if col not in data:
+            data[col] = values if col == "Name" else to_float(values)
+    df = pd.DataFrame(data)
 
     # Remove league average rows (Name is empty or team abbreviation)
     df = df[df["Name"].str.len() > 3]
@@ -190,6 +147,19 @@ def fetch_bbref_table(url: str, col_map: dict, pos_label: str) -> pd.DataFrame:
     return df
 
 
+def fetch_bbref_table(url: str, col_map: dict, pos_label: str) -> pd.DataFrame:
+    """Scrape Baseball Reference standard stats table."""
+    resp = get_session().get(url, headers=HEADERS, timeout=20)
+    resp.raise_for_status()
+
+    table_id = "batting_standard" if "batting" in url else "pitching_standard"
+    df = parse_bbref_page(resp.text, table_id, pos_label)
+    if df is None:
+        print(f"  ⚠ No table found at {url}")
+        return pd.DataFrame()
+    return df
+
+
 def fetch_bbref_projections(out_path: str = "data/bbref_projections.csv") -> pd.DataFrame:
     all_dfs = []
 
@@ -237,7 +207,7 @@ def fetch_bbref_projections(out_path: str = "data/bbref_projections.csv") -> pd.
 
     combined = pd.concat(all_dfs, ignore_index=True)
     combined = combined.drop_duplicates(subset="Name", keep="first")
-    combined.to_csv(out_path, index=False)
+    atomic_to_csv(combined, out_path)
     print(f"\n✓ Saved {len(combined)} players to {out_path}")
     return combined
 
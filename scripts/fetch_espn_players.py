@@ -0,0 +1,315 @@
+"""
+Single ESPN ingestion stage: pages through the ESPN players endpoint once and
+builds ADP, position eligibility and the raw dump from the same payload.
+
+Replaces running fetch_espn_adp.py and fetch_espn_eligibility.py separately
+(both still work and now call into this module).
+
+Run:
+    python scripts/fetch_espn_players.py
+
+Outputs:
+    data/espn_adp.csv           Name, Position, ADP_ESPN
+    data/espn_eligibility.csv   Name, Primary_Position, Eligible_Positions
+    data/espn_raw.json          every player record as returned by ESPN
+
+The first page asks for PAGE_SIZE players and however many ESPN returns is
+the page size from then on; later pages are requested concurrently in waves
+(the shared session caps in-flight requests to ESPN), and an empty page or
+one shorter than the first ends the scan. Set ESPN_S2 and SWID for your league's view; without them the
+public data is used.
+
+Responses are parsed incrementally (json_stream.py) and each page is written
+to the raw dump and folded into column builders as it arrives, so memory
+stays bounded by one wave of pages rather than the whole pull. To rebuild the
+CSVs from an existing dump without touching the network:
+    python scripts/fetch_espn_players.py --from-raw data/espn_raw.json
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from http_client import HOST_LIMITS, atomic_path, atomic_to_csv, get_session
+from json_stream import CHUNK_SIZE, ColumnBuilder, JsonArrayWriter, iter_json_file, iter_json_items
+
+URL = "https://lm-api-reads.fantasy.espn.com/apis/v3/games/flb/seasons/2025/players"
+HOST = "lm-api-reads.fantasy.espn.com"
+
+PAGE_SIZE  = 250
+MAX_OFFSET = 2000   # safety cap
+
+# ESPN slot ID -> position abbreviation (eligibility)
+SLOT_MAP = {
+    0:  "C",
+    1:  "1B",
+    2:  "2B",
+    3:  "3B",
+    4:  "SS",
+    5:  "OF",
+    6:  "MI",   # 2B/SS
+    7:  "CI",   # 1B/3B
+    8:  "OF",
+    9:  "OF",
+    10: "DH",
+    11: "P",
+    12: "SP",
+    13: "RP",
+    14: "BE",
+    15: "IL",
+    16: "IL",
+    17: "IL",
+}
+
+# Slots we care about for eligibility (ignore bench/IL/P)
+VALID_SLOTS = {0, 1, 2, 3, 4, 5, 10, 12, 13}
+
+# Primary position from defaultPositionId
+DEFAULT_POS_MAP = {
+    1:  "SP",
+    2:  "C",
+    3:  "1B",
+    4:  "2B",
+    5:  "3B",
+    6:  "SS",
+    7:  "OF",
+    8:  "OF",
+    9:  "OF",
+    10: "DH",
+    11: "SP",
+    12: "RP",
+}
+
+# Position label written to espn_adp.csv (kept from fetch_espn_adp.py)
+ADP_POS_MAP = {
+    0: "C", 1: "1B", 2: "2B", 3: "3B", 4: "SS",
+    5: "OF", 6: "2B/SS", 7: "1B/3B", 8: "OF", 9: "OF",
+    10: "DH", 11: "P", 12: "SP", 13: "RP",
+    14: "BE", 15: "IL", 16: "IL", 17: "IL"
+}
+
+ALL_SLOTS = list(range(14))
+
+ADP_COLUMNS         = ["Name", "Position", "ADP_ESPN"]
+ELIGIBILITY_COLUMNS = ["Name", "Primary_Position", "Eligible_Positions"]
+
+
+def _filter(offset: int, limit: int = PAGE_SIZE) -> dict:
+    # kona_player_info with draft-rank sorting returns ADP *and* eligibleSlots
+    return {
+        "players": {
+            "filterSlotIds": {"value": ALL_SLOTS},
+            "sortDraftRanks": {
+                "sortPriority": 1,
+                "sortAsc": True,
+                "value": "STANDARD"
+            },
+            "limit": limit,
+            "offset": offset,
+            "filterRanksForScoringPeriodIds": {"value": [1]},
+            "filterRanksForRankTypes": {"value": ["STANDARD"]},
+            "filterRanksForSlotIds": {"value": ALL_SLOTS},
+        }
+    }
+
+
+def _credentials() -> dict:
+    espn_s2 = os.environ.get("ESPN_S2")
+    swid    = os.environ.get("SWID")
+    if espn_s2 and swid:
+        print("Using authenticated ESPN session.")
+        return {"espn_s2": espn_s2, "SWID": swid}
+    return {}
+
+
+def fetch_page(offset: int, cookies: dict, limit: int = PAGE_SIZE) -> list:
+    headers = {
+        "User-Agent": "Mozilla/5.0",
+        "Accept": "application/json",
+        "x-fantasy-filter": json.dumps(_filter(offset, limit)),
+    }
+    resp = get_session().get(
+        URL,
+        headers=headers,
+        cookies=cookies,
+        params={"view": "kona_player_info"},
+        timeout=30,
+        stream=True,
+    )
+    with resp:
+        resp.raise_for_status()
+        # Root is either the player list or {"players": [...]};
+        # some views wrap each record as {"player": {...}}
+        return [p.get("player", p) if isinstance(p, dict) else p
+                for p in iter_json_items(resp.iter_content(CHUNK_SIZE), key="players")]
+
+
+def parse_adp(p: dict) -> dict | None:
+    """ADP row for one player, or None if ESPN has no ADP for them."""
+    name = p.get("fullName", "")
+
+    # ADP lives in draftRanksByRankType
+    draft_ranks = p.get("draftRanksByRankType", {}) or {}
+    adp = None
+    for rank_type in ["STANDARD", "PPR", "HALF"]:
+        if rank_type in draft_ranks:
+            adp = draft_ranks[rank_type].get("averageDraftPosition")
+            if adp:
+                break
+
+    # Fallback: ownership percent rank
+    if not adp:
+        ownership = p.get("ownership", {}) or {}
+        adp = ownership.get("averageDraftPosition") or ownership.get("auctionValueAverage")
+
+    try:
+        adp = float(adp) if adp else None
+    except (TypeError, ValueError):
+        return None
+    if not name or not adp or adp <= 0:
+        return None
+    pos = ADP_POS_MAP.get(p.get("defaultPositionId", -1), "")
+    return {"Name": name, "Position": pos, "ADP_ESPN": round(adp, 1)}
+
+
+def parse_eligibility(p: dict) -> dict | None:
+    name = p.get("fullName", "")
+    if not name:
+        return None
+
+    primary = DEFAULT_POS_MAP.get(p.get("defaultPositionId", -1), "")
+    eligible = []
+    seen = set()
+    for slot_id in p.get("eligibleSlots", []) or []:
+        if slot_id in VALID_SLOTS:
+            pos = SLOT_MAP.get(slot_id, "")
+            if pos and pos not in seen and pos != primary:
+                eligible.append(pos)
+                seen.add(pos)
+
+    return {
+        "Name":               name,
+        "Primary_Position":   primary,
+        "Eligible_Positions": ",".join(eligible) if eligible else "",
+    }
+
+
+class PlayerTables:
+    """Folds player records into ADP and eligibility columns one record at a time."""
+
+    def __init__(self):
+        self.adp         = ColumnBuilder(ADP_COLUMNS)
+        self.eligibility = ColumnBuilder(ELIGIBILITY_COLUMNS)
+        self.players     = 0
+
+    def add(self, p) -> None:
+        if not isinstance(p, dict):
+            return
+        self.players += 1
+        adp = parse_adp(p)
+        if adp:
+            self.adp.append(adp)
+        elig = parse_eligibility(p)
+        if elig:
+            self.eligibility.append(elig)
+
+
+def iter_pages(cookies: dict, page_size: int = PAGE_SIZE, max_offset: int = MAX_OFFSET):
+    """
+    Yield each page's player list in offset order. The first page is fetched
+    alone and its length is the page size from then on, since ESPN may cap a
+    page below `page_size`. The rest are requested `wave` pages at a time,
+    stopping after the wave with an empty page or one shorter than the first.
+    """
+    first = fetch_page(0, cookies, page_size)
+    yield first
+    size = len(first)
+    if not size:
+        return
+
+    wave = HOST_LIMITS.get(HOST, 4)
+    offsets = list(range(size, max_offset + 1, size))
+    fetched = size
+    with ThreadPoolExecutor(max_workers=wave) as pool:
+        for start in range(0, len(offsets), wave):
+            batch = offsets[start:start + wave]
+            for players in pool.map(lambda off: fetch_page(off, cookies, size), batch):
+                fetched += len(players)
+                yield players
+                if len(players) < size:
+                    return
+            print(f"  Fetched {fetched} players so far...")
+
+
+def save_tables(tables: PlayerTables, adp_path: str, eligibility_path: str, raw_path: str) -> dict:
+    out = {"adp": pd.DataFrame(), "eligibility": pd.DataFrame()}
+
+    if len(tables.adp):
+        adp = tables.adp.to_frame().drop_duplicates("Name").sort_values("ADP_ESPN").reset_index(drop=True)
+        atomic_to_csv(adp, adp_path)
+        print(f"✓ Saved {len(adp)} players to {adp_path}")
+        out["adp"] = adp
+    else:
+        print(f"⚠ No ADP data — inspect {raw_path}")
+
+    if len(tables.eligibility):
+        elig = tables.eligibility.to_frame().drop_duplicates("Name")
+        atomic_to_csv(elig, eligibility_path)
+        print(f"✓ Saved {len(elig)} players to {eligibility_path}")
+        out["eligibility"] = elig
+    else:
+        print("⚠ No eligibility data returned.")
+
+    return out
+
+
+def fetch_espn_players(
+    adp_path: str = "data/espn_adp.csv",
+    eligibility_path: str = "data/espn_eligibility.csv",
+    raw_path: str = "data/espn_raw.json",
+) -> dict:
+    """Returns {"adp": DataFrame, "eligibility": DataFrame} and writes all three outputs."""
+    cookies = _credentials()
+
+    print("Fetching ESPN players (ADP + eligibility)...")
+    tables = PlayerTables()
+    pages = 0
+    with atomic_path(raw_path) as tmp:
+        with open(tmp, "w") as f:
+            raw = JsonArrayWriter(f)
+            for players in iter_pages(cookies):
+                pages += 1
+                for p in players:
+                    raw.write(p)
+                    tables.add(p)
+            raw.close()
+    print(f"  {raw.count} player records in {pages} pages")
+
+    return save_tables(tables, adp_path, eligibility_path, raw_path)
+
+
+def rebuild_from_raw(
+    raw_path: str = "data/espn_raw.json",
+    adp_path: str = "data/espn_adp.csv",
+    eligibility_path: str = "data/espn_eligibility.csv",
+) -> dict:
+    """Re-derive the ADP and eligibility CSVs from a saved dump, streaming it from disk."""
+    print(f"Rebuilding ESPN ADP + eligibility from {raw_path}...")
+    tables = PlayerTables()
+    for p in iter_json_file(raw_path, key="players"):
+        tables.add(p.get("player", p) if isinstance(p, dict) else p)
+    print(f"  {tables.players} player records")
+    return save_tables(tables, adp_path, eligibility_path, raw_path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fetch ESPN ADP + eligibility in one pass.")
+    parser.add_argument("--from-raw", metavar="PATH", help="rebuild the CSVs from a saved raw dump instead of fetching")
+    args = parser.parse_args()
+
+    result = rebuild_from_raw(args.from_raw) if args.from_raw else fetch_espn_players()
+    if not result["adp"].empty:
+        print(result["adp"].head(30).to_string(index=False))
@@ -4,11 +4,14 @@ FanGraphs provides downloadable CSV exports — this script pulls them directly.
 Saves to data/fangraphs_projections.csv
 
 Install deps:
-    pip install requests pandas
+    pip install requests pandas pyarrow
 
 Run:
     python scripts/fetch_fangraphs_projections.py
 
+    # several systems at once, one typed Parquet file per system
+    python scripts/fetch_fangraphs_projections.py --systems steamer zips atc thebat
+
 Note: FanGraphs has a public CSV export endpoint that doesn't require login.
 We use the 'steamer' system by default. Change PROJ_SYSTEM to 'zips' or 'atc' if preferred.
 
@@ -16,19 +19,19 @@ The FanGraphs API automatically returns the upcoming season's projections (2026)
 No year parameter is needed — it defaults to the next season.
 """
 
-import requests
-import pandas as pd
+import argparse
 import io
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-PROJ_SYSTEM = "steamer"   # options: steamer, zips, atc, thebat, fangraphsdc
+import pandas as pd
 
-HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0.0.0 Safari/537.36"
-    )
-}
+from http_client import HEADERS, atomic_to_csv, atomic_to_parquet, get_session
+
+PROJ_SYSTEM  = "steamer"   # options: steamer, zips, atc, thebat, fangraphsdc
+PROJ_SYSTEMS = ["steamer", "zips", "atc", "thebat", "fangraphsdc"]
+
+FANGRAPHS = "https://www.fangraphs.com"
 
 # FanGraphs CSV export URLs
 # pos=all gets all players; stats=bat = batters, stats=pit = pitchers
@@ -92,9 +95,9 @@ PITCHER_COL_MAP = {
 }
 
 
-def fetch_json_api(url: str, col_map: dict, pos_label: str) -> pd.DataFrame:
+def fetch_json_api(url: str, col_map: dict, pos_label: str, session=None) -> pd.DataFrame:
     """Try FanGraphs JSON API endpoint."""
-    resp = requests.get(url, headers=HEADERS, timeout=20)
+    resp = (session or get_session()).get(url, headers=HEADERS, timeout=20)
     resp.raise_for_status()
 
     data = resp.json()
@@ -120,9 +123,9 @@ def fetch_json_api(url: str, col_map: dict, pos_label: str) -> pd.DataFrame:
     return df
 
 
-def fetch_csv_download(url: str, col_map: dict, pos_label: str) -> pd.DataFrame:
+def fetch_csv_download(url: str, col_map: dict, pos_label: str, session=None) -> pd.DataFrame:
     """Fallback: try CSV download endpoint."""
-    resp = requests.get(url, headers=HEADERS, timeout=20)
+    resp = (session or get_session()).get(url, headers=HEADERS, timeout=20)
     resp.raise_for_status()
 
     df = pd.read_csv(io.StringIO(resp.text))
@@ -140,52 +143,59 @@ def fetch_csv_download(url: str, col_map: dict, pos_label: str) -> pd.DataFrame:
     return df
 
 
+def fetch_stat_group(proj_system: str, stats: str, session=None) -> pd.DataFrame:
+    """
+    Fetch one system's batters (stats='bat') or pitchers (stats='pit').
+    Tries the JSON API first and falls back to the CSV download.
+    """
+    col_map   = BATTER_COL_MAP if stats == "bat" else PITCHER_COL_MAP
+    pos_label = "BAT" if stats == "bat" else "PIT"
+    api_url = f"{FANGRAPHS}/api/projections?type={proj_system}&stats={stats}&pos=all&team=0&players=0"
+    csv_url = f"{FANGRAPHS}/projections.aspx?pos=all&stats={stats}&type={proj_system}&team=0&lg=all&players=0&download=1"
+
+    try:
+        df = fetch_json_api(api_url, col_map, pos_label, session=session)
+        if df.empty:
+            raise ValueError("Empty response")
+        return df
+    except Exception as e:
+        print(f"  ⚠ {proj_system}/{stats} JSON API failed ({e}), trying CSV download...")
+    try:
+        return fetch_csv_download(csv_url, col_map, pos_label, session=session)
+    except Exception as e:
+        print(f"  ✗ {proj_system}/{stats} CSV also failed: {e}")
+        return pd.DataFrame()
+
+
+def to_typed_columns(df: pd.DataFrame, col_map: dict) -> pd.DataFrame:
+    """Keep mapped columns only, stats as float32 and Position as a category."""
+    df = df.loc[:, ~df.columns.duplicated()]
+    stat_cols = [c for c in dict.fromkeys(col_map.values()) if c != "Name" and c in df.columns]
+    out = df[["Name", "Position"] + stat_cols].copy()
+    out["Name"] = out["Name"].astype(str)
+    out["Position"] = out["Position"].astype("category")
+    out[stat_cols] = out[stat_cols].astype("float32")
+    return out
+
+
 def fetch_fangraphs_projections(
     out_path: str = "data/fangraphs_projections.csv",
     proj_system: str = PROJ_SYSTEM,
+    session=None,
 ) -> pd.DataFrame:
     all_dfs = []
 
-    batter_api  = f"https://www.fangraphs.com/api/projections?type={proj_system}&stats=bat&pos=all&team=0&players=0"
-    pitcher_api = f"https://www.fangraphs.com/api/projections?type={proj_system}&stats=pit&pos=all&team=0&players=0"
-
     print(f"Fetching FanGraphs {proj_system.upper()} batter projections (2026)...")
-    try:
-        df_bat = fetch_json_api(batter_api, BATTER_COL_MAP, "BAT")
-        if not df_bat.empty:
-            print(f"  ✓ {len(df_bat)} batters")
-            all_dfs.append(df_bat)
-        else:
-            raise ValueError("Empty response")
-    except Exception as e:
-        print(f"  ⚠ JSON API failed ({e}), trying CSV download...")
-        try:
-            batter_csv = f"https://www.fangraphs.com/projections.aspx?pos=all&stats=bat&type={proj_system}&team=0&lg=all&players=0&download=1"
-            df_bat = fetch_csv_download(batter_csv, BATTER_COL_MAP, "BAT")
-            if not df_bat.empty:
-                print(f"  ✓ {len(df_bat)} batters (CSV)")
-                all_dfs.append(df_bat)
-        except Exception as e2:
-            print(f"  ✗ CSV also failed: {e2}")
+    df_bat = fetch_stat_group(proj_system, "bat", session=session)
+    if not df_bat.empty:
+        print(f"  ✓ {len(df_bat)} batters")
+        all_dfs.append(df_bat)
 
     print(f"Fetching FanGraphs {proj_system.upper()} pitcher projections (2026)...")
-    try:
-        df_pit = fetch_json_api(pitcher_api, PITCHER_COL_MAP, "PIT")
-        if not df_pit.empty:
-            print(f"  ✓ {len(df_pit)} pitchers")
-            all_dfs.append(df_pit)
-        else:
-            raise ValueError("Empty response")
-    except Exception as e:
-        print(f"  ⚠ JSON API failed ({e}), trying CSV download...")
-        try:
-            pitcher_csv = f"https://www.fangraphs.com/projections.aspx?pos=all&stats=pit&type={proj_system}&team=0&lg=all&players=0&download=1"
-            df_pit = fetch_csv_download(pitcher_csv, PITCHER_COL_MAP, "PIT")
-            if not df_pit.empty:
-                print(f"  ✓ {len(df_pit)} pitchers (CSV)")
-                all_dfs.append(df_pit)
-        except Exception as e2:
-            print(f"  ✗ CSV also failed: {e2}")
+    df_pit = fetch_stat_group(proj_system, "pit", session=session)
+    if not df_pit.empty:
+        print(f"  ✓ {len(df_pit)} pitchers")
+        all_dfs.append(df_pit)
 
     if not all_dfs:
         print("⚠ No FanGraphs data fetched.")
@@ -193,12 +203,70 @@ def fetch_fangraphs_projections(
 
     combined = pd.concat(all_dfs, ignore_index=True)
     combined = combined.drop_duplicates(subset="Name", keep="first")
-    combined.to_csv(out_path, index=False)
+    atomic_to_csv(combined, out_path)
     print(f"\n✓ Saved {len(combined)} players to {out_path}")
     return combined
 
 
+def fetch_fangraphs_systems(
+    systems: list = PROJ_SYSTEMS,
+    out_dir: str = "data",
+    max_workers: int = 8,
+    session=None,
+) -> dict:
+    """
+    Fetch several projection systems at once. Every (system, bat/pit) pair is
+    its own task on a thread pool sharing the pooled session, and each system
+    is written to data/fangraphs_<system>.parquet so combine_projections.py
+    can treat it as a separate consensus source.
+    Returns {system: DataFrame} for the systems that returned data.
+    """
+    tasks = [(system, stats) for system in systems for stats in ("bat", "pit")]
+    workers = max(1, min(max_workers, len(tasks)))
+    session = session or get_session()
+
+    print(f"Fetching FanGraphs {', '.join(s.upper() for s in systems)} ({len(tasks)} requests, {workers} workers)...")
+    frames = {system: {} for system in systems}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(fetch_stat_group, system, stats, session): (system, stats) for system, stats in tasks}
+        for future in as_completed(futures):
+            system, stats = futures[future]
+            frames[system][stats] = future.result()
+
+    os.makedirs(out_dir, exist_ok=True)
+    results = {}
+    for system in systems:
+        parts = []
+        for stats, col_map in (("bat", BATTER_COL_MAP), ("pit", PITCHER_COL_MAP)):
+            df = frames[system].get(stats)
+            if df is not None and not df.empty:
+                parts.append(to_typed_columns(df, col_map))
+        if not parts:
+            print(f"  ✗ {system}: no data")
+            continue
+
+        combined = pd.concat(parts, ignore_index=True)
+        combined = combined.drop_duplicates(subset="Name", keep="first").reset_index(drop=True)
+        combined["Position"] = combined["Position"].astype("category")
+        path = os.path.join(out_dir, f"fangraphs_{system}.parquet")
+        atomic_to_parquet(combined, path)
+        print(f"  ✓ {system}: {len(combined)} players → {path}")
+        results[system] = combined
+
+    return results
+
+
 if __name__ == "__main__":
-    df = fetch_fangraphs_projections()
-    if not df.empty:
-        print(df.head(10).to_string(index=False))
+    parser = argparse.ArgumentParser(description="Fetch FanGraphs projections.")
+    parser.add_argument(
+        "--systems", nargs="+", metavar="SYSTEM",
+        help=f"fetch several systems concurrently into data/fangraphs_<system>.parquet (choices: {', '.join(PROJ_SYSTEMS)})",
+    )
+    args = parser.parse_args()
+
+    if args.systems:
+        fetch_fangraphs_systems(args.systems)
+    else:
+        df = fetch_fangraphs_projections()
+        if not df.empty:
+            print(df.head(10).to_string(index=False))
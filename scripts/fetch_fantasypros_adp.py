@@ -8,24 +8,17 @@ Run:
     python scripts/fetch_fantasypros_adp.py
 """
 
-import requests
 import pandas as pd
 from bs4 import BeautifulSoup
 
-URL = "https://www.fantasypros.com/mlb/adp/overall.php"
+from http_client import HEADERS, atomic_to_csv, get_session
 
-HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0.0.0 Safari/537.36"
-    )
-}
+URL = "https://www.fantasypros.com/mlb/adp/overall.php"
 
 
 def fetch_fantasypros_adp(url: str = URL, out_path: str = "data/fantasypros_adp.csv") -> pd.DataFrame:
     print(f"Fetching FantasyPros ADP from {url} ...")
-    resp = requests.get(url, headers=HEADERS, timeout=15)
+    resp = get_session().get(url, headers=HEADERS, timeout=15)
     resp.raise_for_status()
 
     soup = BeautifulSoup(resp.text, "html.parser")
@@ -56,7 +49,7 @@ def fetch_fantasypros_adp(url: str = URL, out_path: str = "data/fantasypros_adp.
 
     df = pd.DataFrame(rows)
     df = df.sort_values("ADP_FP").reset_index(drop=True)
-    df.to_csv(out_path, index=False)
+    atomic_to_csv(df, out_path)
     print(f"✓ Saved {len(df)} players to {out_path}")
     return df
 
@@ -3,24 +3,18 @@ Fetches FantasyPros consensus projections for batters and pitchers.
 Saves to data/fantasypros_projections.csv
 
 Install deps:
-    pip install requests beautifulsoup4 pandas
+    pip install requests lxml pandas
 
 Run:
     python scripts/fetch_fantasypros_projections.py
 """
 
-import requests
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
-from bs4 import BeautifulSoup
-import time
-
-HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0.0.0 Safari/537.36"
-    )
-}
+
+from html_tables import map_columns, parse_header_table
+from http_client import HEADERS, HOST_LIMITS, atomic_to_csv, get_session
 
 # FantasyPros projection URLs by position group
 BATTER_URLS = {
@@ -75,90 +69,64 @@ PITCHER_COL_MAP = {
 }
 
 
+def parse_projection_page(html: str, pos: str, col_map: dict) -> pd.DataFrame | None:
+    """Parse one FantasyPros projection page; None if the page has no data table."""
+    columns = parse_header_table(html, table_id="data", name_col="Player")
+    if columns is None:
+        return None
+    if not columns or not next(iter(columns.values())):
+        return pd.DataFrame()
+
+    # Rename to internal names, keep mapped columns, stats -> float
+    df = map_columns(columns, col_map)
+    if df.empty:
+        return df
+    df["Position"] = pos
+    return df
+
+
 def scrape_table(url: str, pos: str, col_map: dict) -> pd.DataFrame:
     """Scrape a single FantasyPros projection page."""
-    resp = requests.get(url, headers=HEADERS, timeout=15)
+    resp = get_session().get(url, headers=HEADERS, timeout=15)
     resp.raise_for_status()
 
-    soup = BeautifulSoup(resp.text, "html.parser")
-    table = soup.find("table", {"id": "data"})
-    if table is None:
+    df = parse_projection_page(resp.text, pos, col_map)
+    if df is None:
         print(f"  ⚠ No table found at {url}")
         return pd.DataFrame()
+    return df
 
-    # Parse headers
-    headers_raw = [th.text.strip() for th in table.find("thead").find_all("th")]
-
-    rows = []
-    for tr in table.find("tbody").find_all("tr"):
-        cells = tr.find_all("td")
-        if len(cells) < 2:
-            continue
-        row = {}
-        for i, th in enumerate(headers_raw):
-            if i < len(cells):
-                text = cells[i].text.strip()
-                # Clean player name (remove team suffix like " - NYY")
-                if th == "Player":
-                    name_tag = cells[i].find("a")
-                    text = name_tag.text.strip() if name_tag else text
-                    text = text.split(" - ")[0].strip()
-                row[th] = text
-        rows.append(row)
-
-    if not rows:
-        return pd.DataFrame()
-
-    df = pd.DataFrame(rows)
-
-    # Rename columns to internal names
-    rename = {k: v for k, v in col_map.items() if k in df.columns}
-    df = df.rename(columns=rename)
-
-    # Keep only mapped columns that exist
-    keep = ["Name"] + [v for v in col_map.values() if v != "Name" and v in df.columns]
-    keep = list(dict.fromkeys(keep))  # dedupe preserving order
-    df = df[[c for c in keep if c in df.columns]].copy()
-
-    # Convert numeric columns
-    for col in df.columns:
-        if col != "Name":
-            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
 
-    df["Position"] = pos
-    return df
+def _scrape_page(pos: str, url: str, col_map: dict) -> tuple:
+    try:
+        return pos, scrape_table(url, pos, col_map), None
+    except Exception as e:
+        return pos, pd.DataFrame(), e
 
 
 def fetch_fantasypros_projections(out_path: str = "data/fantasypros_projections.csv") -> pd.DataFrame:
+    """
+    All position pages are requested concurrently; the shared session caps
+    in-flight requests to fantasypros.com (HOST_LIMITS), which keeps us polite.
+    """
+    pages = [(pos, url, BATTER_COL_MAP) for pos, url in BATTER_URLS.items()]
+    pages += [(pos, url, PITCHER_COL_MAP) for pos, url in PITCHER_URLS.items()]
+
+    print(f"Fetching FantasyPros projections ({len(pages)} position pages)...")
+    with ThreadPoolExecutor(max_workers=HOST_LIMITS["www.fantasypros.com"]) as pool:
+        results = list(pool.map(lambda page: _scrape_page(*page), pages))
+
+    # Results come back in page order, so drop_duplicates below keeps the
+    # same player rows as the sequential version did.
     all_dfs = []
-
-    print("Fetching FantasyPros batter projections...")
-    for pos, url in BATTER_URLS.items():
-        print(f"  {pos}...", end=" ")
-        try:
-            df = scrape_table(url, pos, BATTER_COL_MAP)
-            if not df.empty:
-                all_dfs.append(df)
-                print(f"{len(df)} players")
-            else:
-                print("empty")
-        except Exception as e:
-            print(f"ERROR: {e}")
-        time.sleep(0.5)  # be polite
-
-    print("\nFetching FantasyPros pitcher projections...")
-    for pos, url in PITCHER_URLS.items():
-        print(f"  {pos}...", end=" ")
-        try:
-            df = scrape_table(url, pos, PITCHER_COL_MAP)
-            if not df.empty:
-                all_dfs.append(df)
-                print(f"{len(df)} players")
-            else:
-                print("empty")
-        except Exception as e:
-            print(f"ERROR: {e}")
-        time.sleep(0.5)
+    for pos, df, err in results:
+        if err is not None:
+            print(f"  {pos}... ERROR: {err}")
+        elif df.empty:
+            print(f"  {pos}... empty")
+        else:
+            print(f"  {pos}... {len(df)} players")
+            all_dfs.append(df)
 
     if not all_dfs:
         print("⚠ No data fetched.")
@@ -169,7 +137,7 @@ def fetch_fantasypros_projections(out_path: str = "data/fantasypros_projections.
     # Drop duplicate players (e.g. OF appears in multiple OF pages)
     combined = combined.drop_duplicates(subset="Name", keep="first")
 
-    combined.to_csv(out_path, index=False)
+    atomic_to_csv(combined, out_path)
     print(f"\n✓ Saved {len(combined)} players to {out_path}")
     return combined
 
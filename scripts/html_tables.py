@@ -0,0 +1,144 @@
+"""
+lxml-based HTML table extraction for the scrapers.
+
+The old path parsed each page with BeautifulSoup's pure-Python parser, built a
+dict per row, then ran pd.to_numeric column by column. Here the page is
+parsed by libxml2, cells are read straight into per-column lists, and each
+stat column is converted to float64 in one numpy call (falling back to
+pd.to_numeric only for columns with blanks or stray text).
+
+See scripts/bench_html_parse.py for the before/after timing.
+"""
+
+import numpy as np
+import pandas as pd
+from lxml import html as lxml_html
+
+
+def to_float(values) -> np.ndarray:
+    """Column of strings -> float64; anything non-numeric becomes 0 (like to_numeric(coerce).fillna(0))."""
+    try:
+        arr = np.asarray(values, dtype=np.float64)   # None -> nan here
+    except (TypeError, ValueError):
+        return pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").fillna(0).to_numpy(dtype=np.float64)
+    arr[np.isnan(arr)] = 0.0
+    return arr
+
+
+def _find_table(doc, table_id: str | None = None, table_class: str | None = None):
+    if table_id:
+        found = doc.xpath(f'//table[@id="{table_id}"]')
+        if found:
+            return found[0]
+    if table_class:
+        found = doc.xpath(f'//table[contains(concat(" ", normalize-space(@class), " "), " {table_class} ")]')
+        if found:
+            return found[0]
+    return None
+
+
+def _text(el) -> str:
+    return el.text_content().strip()
+
+
+def _link_text(cell) -> str | None:
+    link = next(cell.iter("a"), None)
+    return _text(link) if link is not None else None
+
+
+def parse_header_table(html: str, table_id: str = "data", name_col: str = "Player") -> dict | None:
+    """
+    Tables with a <thead> of column names and one <tr> per player in <tbody>
+    (FantasyPros). Returns {header: [cell text, ...]} or None if there's no
+    such table. The name column uses the first link's text with any
+    " - TEAM" suffix removed; short rows leave None in the missing columns.
+    """
+    table = _find_table(lxml_html.fromstring(html), table_id)
+    if table is None:
+        return None
+
+    thead = next(table.iter("thead"), None)
+    tbody = next(table.iter("tbody"), None)
+    if thead is None or tbody is None:
+        return None
+    headers = [_text(th) for th in thead.iter("th")]
+
+    # a repeated header keeps its last column, as the old row-dict code did
+    col_index = {h: i for i, h in enumerate(headers)}
+    columns = {h: [] for h in col_index}
+    name_idx = col_index.get(name_col)
+
+    for tr in tbody.iter("tr"):
+        cells = list(tr.iter("td"))
+        if len(cells) < 2:
+            continue
+        n = len(cells)
+        for h, i in col_index.items():
+            if i >= n:
+                columns[h].append(None)
+            elif i == name_idx:
+                text = _link_text(cells[i])
+                text = _text(cells[i]) if text is None else text
+                columns[h].append(text.split(" - ")[0].strip())
+            else:
+                columns[h].append(_text(cells[i]))
+    return columns
+
+
+def parse_data_stat_table(html: str, table_id: str, fallback_class: str = "stats_table",
+                          name_stat: str = "player") -> dict | None:
+    """
+    Tables whose cells carry a data-stat attribute (Baseball Reference).
+    Returns {data-stat: [cell text, ...]} with the player column as "Name"
+    (link text if present), or None if no table is found. Rows without a
+    player name are dropped, as are repeated header rows (class "thead").
+    """
+    table = _find_table(lxml_html.fromstring(html), table_id, fallback_class)
+    if table is None:
+        return None
+
+    columns = {}
+    n_rows = 0
+    for tr in table.iter("tr"):
+        if "thead" in (tr.get("class") or "").split():
+            continue
+        row = {}
+        for cell in tr:
+            if cell.tag not in ("td", "th"):
+                continue
+            stat = cell.get("data-stat", "")
+            if not stat:
+                continue
+            if stat == name_stat:
+                text = _link_text(cell)
+                row["Name"] = _text(cell) if text is None else text
+            else:
+                row[stat] = _text(cell)
+        if not row.get("Name"):
+            continue
+        for stat, text in row.items():
+            col = columns.get(stat)
+            if col is None:
+                col = columns[stat] = [None] * n_rows
+            col.append(text)
+        n_rows += 1
+        for col in columns.values():
+            if len(col) < n_rows:
+                col.append(None)
+    return columns
+
+
+def map_columns(columns: dict, col_map: dict, name_col: str = "Name") -> pd.DataFrame:
+    """
+    Rename parsed columns with col_map (source header -> internal name), keep
+    only mapped ones, and convert everything but the name to float64.
+    When several headers map to one name, the first present in col_map wins.
+    """
+    out = {}
+    for src, dst in col_map.items():
+        if src in columns and dst not in out:
+            out[dst] = columns[src]
+    if name_col not in out:
+        return pd.DataFrame()
+    order = [name_col] + [c for c in out if c != name_col]
+    return pd.DataFrame({c: out[c] if c == name_col else to_float(out[c]) for c in order})
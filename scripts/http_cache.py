@@ -0,0 +1,182 @@
+"""
+On-disk HTTP response cache for the fetch scripts.
+
+Modes (FETCH_CACHE env var, or http_client.configure_cache):
+    on      serve fresh entries (younger than the host's TTL) from disk; revalidate
+            stale ones with If-None-Match / If-Modified-Since, so an unchanged page
+            costs a 304 instead of a full download (default)
+    replay  never touch the network — serve whatever was recorded, regardless of
+            age, and fail with CacheMiss if a request was never recorded
+    off     no caching
+
+Entries live in data/.http_cache/<host>/<key>.json (metadata) + <key>.body.gz
+(gzip body). The key covers method, full URL and the ESPN x-fantasy-filter
+header, since ESPN pages differ only by that header.
+
+Streamed responses (stream=True) are cached too: the body is written to disk
+as the caller iterates over it, and the entry is kept only once the body has
+been read to the end, so a stream is never buffered whole in memory.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+CACHE_DIR = "data/.http_cache"
+
+# Seconds an entry is served without revalidation
+TTLS = {
+    "www.fantasypros.com":           6 * 3600,
+    "www.fangraphs.com":             12 * 3600,
+    "baseballsavant.mlb.com":        24 * 3600,
+    "www.baseball-reference.com":    24 * 3600,
+    "lm-api-reads.fantasy.espn.com": 3600,
+}
+DEFAULT_TTL = 3600
+
+KEY_HEADERS = ("x-fantasy-filter",)
+
+# Describe the wire format, not the decoded body we store
+HOP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+MODES = ("on", "replay", "off")
+
+
+class CacheMiss(requests.ConnectionError):
+    """Replay mode was asked for a response that was never recorded."""
+
+
+class HttpCache:
+    def __init__(self, root: str = CACHE_DIR, ttls: dict = TTLS, default_ttl: int = DEFAULT_TTL):
+        self.root        = root
+        self.ttls        = dict(ttls)
+        self.default_ttl = default_ttl
+        self.stats       = {"hit": 0, "revalidated": 0, "miss": 0, "stored": 0}
+        self._lock       = threading.Lock()
+
+    def count(self, what: str) -> None:
+        with self._lock:
+            self.stats[what] += 1
+
+    def key(self, request: requests.PreparedRequest) -> str:
+        parts = [request.method or "GET", request.url or ""]
+        parts += [f"{h}:{request.headers.get(h, '')}" for h in KEY_HEADERS]
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+    def _paths(self, host: str, key: str) -> tuple:
+        directory = os.path.join(self.root, host or "_")
+        return os.path.join(directory, f"{key}.json"), os.path.join(directory, f"{key}.body.gz")
+
+    def ttl(self, host: str) -> int:
+        return self.ttls.get(host, self.default_ttl)
+
+    def load(self, host: str, key: str) -> tuple | None:
+        """(meta, body) or None."""
+        meta_path, body_path = self._paths(host, key)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            with gzip.open(body_path, "rb") as f:
+                body = f.read()
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+        return meta, body
+
+    def store(self, host: str, key: str, response: requests.Response) -> None:
+        meta_path, body_path = self._paths(host, key)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        # body first, so a reader never sees metadata without its body
+        tmp = f"{body_path}.{threading.get_ident()}.tmp"
+        _write_gz(tmp, response.content)
+        os.replace(tmp, body_path)
+        self._store_meta(meta_path, response)
+
+    def store_stream(self, host: str, key: str, response: requests.Response, chunks):
+        """
+        Yield the body `chunks` of a streamed response while writing them to
+        the cache, so the body is never held in memory whole. The entry is
+        only stored if the caller reads the body to the end.
+        """
+        meta_path, body_path = self._paths(host, key)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        tmp = f"{body_path}.{threading.get_ident()}.tmp"
+        try:
+            with gzip.open(tmp, "wb", compresslevel=6) as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    yield chunk
+            os.replace(tmp, body_path)
+            self._store_meta(meta_path, response)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def _store_meta(self, meta_path: str, response: requests.Response) -> None:
+        meta = {
+            "url":        response.url,
+            "status":     response.status_code,
+            "reason":     response.reason,
+            "headers":    {k: v for k, v in response.headers.items() if k.lower() not in HOP_HEADERS},
+            "fetched_at": time.time(),
+        }
+        tmp = f"{meta_path}.{threading.get_ident()}.tmp"
+        _write_json(tmp, meta)
+        os.replace(tmp, meta_path)
+        self.count("stored")
+
+    def touch(self, host: str, key: str, meta: dict, response: requests.Response) -> None:
+        """After a 304: restart the TTL and pick up any new validators."""
+        meta_path, _ = self._paths(host, key)
+        headers = CaseInsensitiveDict(meta["headers"])
+        for h in ("ETag", "Last-Modified"):
+            if h in response.headers:
+                headers[h] = response.headers[h]
+        meta["headers"]    = dict(headers)
+        meta["fetched_at"] = time.time()
+        tmp = f"{meta_path}.{threading.get_ident()}.tmp"
+        _write_json(tmp, meta)
+        os.replace(tmp, meta_path)
+
+    def is_fresh(self, host: str, meta: dict) -> bool:
+        return time.time() - meta.get("fetched_at", 0) < self.ttl(host)
+
+
+def _write_gz(path: str, data: bytes) -> None:
+    with gzip.open(path, "wb", compresslevel=6) as f:
+        f.write(data)
+
+
+def _write_json(path: str, meta: dict) -> None:
+    with open(path, "w") as f:
+        json.dump(meta, f)
+
+
+def conditional_headers(meta: dict) -> dict:
+    headers = CaseInsensitiveDict(meta.get("headers", {}))
+    out = {}
+    if "ETag" in headers:
+        out["If-None-Match"] = headers["ETag"]
+    if "Last-Modified" in headers:
+        out["If-Modified-Since"] = headers["Last-Modified"]
+    return out
+
+
+def build_response(request: requests.PreparedRequest, meta: dict, body: bytes) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = meta["status"]
+    resp.reason      = meta.get("reason", "")
+    resp.headers     = CaseInsensitiveDict(meta["headers"])
+    resp.url         = meta["url"]
+    resp.encoding    = get_encoding_from_headers(resp.headers)
+    resp.request     = request
+    resp._content    = body
+    resp._content_consumed = True   # iter_content / close work without a raw stream
+    resp.from_cache  = True
+    return resp
@@ -0,0 +1,256 @@
+"""
+Shared HTTP helpers for the fetch scripts.
+
+A single requests.Session keeps TCP/TLS connections alive between requests,
+so fetchers that hit the same host many times (position pages, stat groups,
+projection systems) don't pay a new handshake per request.
+
+get_session() returns one process-wide session that also caps how many
+requests can be in flight per host (HOST_LIMITS), so fetchers can run on
+thread pools without hammering any one site, and goes through the on-disk
+response cache in http_cache.py (FETCH_CACHE=on|replay|off).
+
+On top of the concurrency cap, each host has a token-bucket rate limit and
+transient failures are retried with backoff under a per-host retry budget
+(http_retry.py). session.metrics records every request's latency and retries.
+"""
+
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import stream_decode_response_unicode
+
+from http_cache import CACHE_DIR, MODES as CACHE_MODES, CacheMiss, HttpCache, build_response, conditional_headers
+from http_retry import (
+    DEFAULT_RATE_LIMIT, MAX_RETRIES, RATE_LIMITS, RETRY_METHODS, RETRY_STATUSES,
+    RequestMetrics, RetryBudget, TokenBucket, backoff_delay,
+)
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    )
+}
+
+POOL_SIZE = 8
+
+# Max concurrent requests per host
+HOST_LIMITS = {
+    "www.fantasypros.com":           3,
+    "www.fangraphs.com":             4,
+    "baseballsavant.mlb.com":        2,
+    "www.baseball-reference.com":    1,
+    "lm-api-reads.fantasy.espn.com": 4,
+}
+DEFAULT_HOST_LIMIT = 2
+
+
+class HostLimitedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that, per host, rate-limits with a token bucket, holds a
+    semaphore around every request on the wire, and retries transient
+    failures (see http_retry.py). Each logical request is recorded in
+    `metrics` once, with its attempt count.
+    """
+
+    def __init__(self, host_limits: dict = HOST_LIMITS, default_limit: int = DEFAULT_HOST_LIMIT,
+                 rate_limits: dict = RATE_LIMITS, max_retries: int = MAX_RETRIES,
+                 metrics: RequestMetrics | None = None, **kwargs):
+        self.host_limits   = dict(host_limits)
+        self.default_limit = default_limit
+        self.rate_limits   = dict(rate_limits)
+        self.retry_limit   = max_retries
+        self.metrics       = metrics if metrics is not None else RequestMetrics()
+        self._semaphores   = {}
+        self._buckets      = {}
+        self._budgets      = {}
+        self._sem_lock     = threading.Lock()
+        super().__init__(**kwargs)
+
+    def _host_state(self, host: str) -> tuple:
+        with self._sem_lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.host_limits.get(host, self.default_limit))
+                self._buckets[host]    = TokenBucket(*self.rate_limits.get(host, DEFAULT_RATE_LIMIT))
+                self._budgets[host]    = RetryBudget()
+            return self._semaphores[host], self._buckets[host], self._budgets[host]
+
+    def send(self, request, *args, **kwargs):
+        host = urlsplit(request.url).hostname or ""
+        sem, bucket, budget = self._host_state(host)
+        retryable_method = request.method in RETRY_METHODS
+        budget.record_request()
+
+        start, wait, attempt = time.perf_counter(), 0.0, 0
+        while True:
+            attempt += 1
+            wait += bucket.acquire()
+            resp, error = None, None
+            try:
+                with sem:
+                    resp = super().send(request, *args, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+
+            transient = error is not None or resp.status_code in RETRY_STATUSES
+            if (not transient or not retryable_method or attempt > self.retry_limit
+                    or not budget.try_spend()):
+                break
+            delay = backoff_delay(attempt - 1, resp)
+            if resp is not None:
+                resp.close()   # hand the connection back to the pool before sleeping
+            time.sleep(delay)
+
+        self.metrics.record(
+            host, request.url, None if resp is None else resp.status_code, attempt,
+            time.perf_counter() - start - wait, wait,
+            error="" if error is None else f"{type(error).__name__}: {error}",
+        )
+        if error is not None:
+            raise error
+        return resp
+
+
+class PooledSession(requests.Session):
+    """
+    requests.Session backed by HostLimitedAdapter, with an optional on-disk
+    response cache (see http_cache.py) for GET requests.
+    """
+
+    def __init__(self, cache: HttpCache | None = None, cache_mode: str = "off"):
+        super().__init__()
+        if cache_mode not in CACHE_MODES:
+            raise ValueError(f"cache_mode must be one of {CACHE_MODES}, got {cache_mode!r}")
+        self.cache      = cache
+        self.cache_mode = cache_mode if cache is not None else "off"
+        self.metrics    = RequestMetrics()
+
+    def _record_hit(self, request, host: str, start: float, status: int) -> None:
+        self.metrics.record(host, request.url, status, 0, time.perf_counter() - start, cached=True)
+
+    def send(self, request, **kwargs):
+        # Redirect hops come back through send() with allow_redirects=False;
+        # only the original request is cached.
+        if self.cache_mode == "off" or request.method != "GET" or not kwargs.get("allow_redirects", True):
+            return super().send(request, **kwargs)
+
+        start = time.perf_counter()
+        host  = urlsplit(request.url).hostname or ""
+        key   = self.cache.key(request)
+        entry = self.cache.load(host, key)
+
+        if self.cache_mode == "replay":
+            if entry is None:
+                raise CacheMiss(f"not recorded: {request.url}", request=request)
+            self.cache.count("hit")
+            self._record_hit(request, host, start, entry[0]["status"])
+            return build_response(request, *entry)
+
+        if entry is not None and self.cache.is_fresh(host, entry[0]):
+            self.cache.count("hit")
+            self._record_hit(request, host, start, entry[0]["status"])
+            return build_response(request, *entry)
+
+        if entry is not None:
+            request.headers.update(conditional_headers(entry[0]))
+        resp = super().send(request, **kwargs)
+
+        if resp.status_code == 304 and entry is not None:
+            self.cache.count("revalidated")
+            self.cache.touch(host, key, entry[0], resp)
+            return build_response(request, *entry)
+
+        self.cache.count("miss")
+        if resp.status_code == 200 and kwargs.get("stream"):
+            _cache_as_read(resp, self.cache, host, key)
+        elif resp.status_code == 200:
+            self.cache.store(host, key, resp)
+        return resp
+
+
+def _cache_as_read(resp: requests.Response, cache: HttpCache, host: str, key: str) -> None:
+    """Route a streamed body through cache.store_stream instead of reading all of resp.content up front."""
+    iter_content = resp.iter_content
+
+    def cached_iter_content(chunk_size=1, decode_unicode=False):
+        chunks = cache.store_stream(host, key, resp, iter_content(chunk_size))
+        return stream_decode_response_unicode(chunks, resp) if decode_unicode else chunks
+
+    resp.iter_content = cached_iter_content
+
+
+def make_session(pool_size: int = POOL_SIZE, headers: dict | None = None,
+                 host_limits: dict = HOST_LIMITS, cache_mode: str | None = None,
+                 cache_dir: str = CACHE_DIR) -> PooledSession:
+    """
+    Build a session whose connection pool can serve `pool_size` concurrent
+    workers per host. cache_mode defaults to the FETCH_CACHE env var ("on").
+    """
+    cache_mode = cache_mode or _cache_mode
+    session = PooledSession(HttpCache(cache_dir) if cache_mode != "off" else None, cache_mode)
+    adapter = HostLimitedAdapter(host_limits, metrics=session.metrics,
+                                 pool_connections=len(host_limits) + 1, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(HEADERS if headers is None else headers)
+    return session
+
+
+_cache_mode     = os.environ.get("FETCH_CACHE", "on")
+_shared_session = None
+_shared_lock    = threading.Lock()
+
+
+def configure_cache(mode: str) -> None:
+    """Set the cache mode ("on", "replay", "off") for the shared session."""
+    global _cache_mode, _shared_session
+    if mode not in CACHE_MODES:
+        raise ValueError(f"cache mode must be one of {CACHE_MODES}, got {mode!r}")
+    with _shared_lock:
+        _cache_mode = mode
+        _shared_session = None
+
+
+def get_session() -> PooledSession:
+    """The process-wide (cached, host-limited) session every fetcher uses unless handed its own."""
+    global _shared_session
+    with _shared_lock:
+        if _shared_session is None:
+            _shared_session = make_session(pool_size=max(HOST_LIMITS.values()))
+        return _shared_session
+
+
+@contextmanager
+def atomic_path(path: str):
+    """
+    Yield a temp path next to `path`; it replaces `path` only if the block
+    finishes, so a failed or interrupted fetch never leaves a half-written file.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=os.path.splitext(path)[1])
+    os.close(fd)
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def atomic_to_csv(df, path: str) -> None:
+    with atomic_path(path) as tmp:
+        df.to_csv(tmp, index=False)
+
+
+def atomic_to_parquet(df, path: str) -> None:
+    with atomic_path(path) as tmp:
+        df.to_parquet(tmp, index=False)
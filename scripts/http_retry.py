@@ -0,0 +1,170 @@
+"""
+Rate limiting, retries and request metrics for the shared HTTP session.
+
+Every request that goes on the wire through http_client's adapter:
+    1. takes a token from its host's bucket (RATE_LIMITS: steady requests/sec
+       plus a burst allowance), so bursts from thread pools are smoothed out
+       instead of tripping the site's limiter
+    2. is retried on connection errors, timeouts and RETRY_STATUSES with
+       exponential backoff and full jitter, honouring Retry-After
+    3. only retries while the host's retry budget allows it — retries may add
+       at most RETRY_BUDGET_RATIO of the host's request volume (plus a small
+       floor), so a site that is down fails fast instead of being hammered
+    4. is recorded in RequestMetrics: status, attempts, latency, time spent
+       waiting for tokens
+
+Only idempotent methods (GET/HEAD/OPTIONS) are retried.
+"""
+
+import json
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+# host -> (requests per second, burst)
+RATE_LIMITS = {
+    "www.fantasypros.com":           (2.0, 3),
+    "www.fangraphs.com":             (4.0, 4),
+    "baseballsavant.mlb.com":        (1.0, 2),
+    "www.baseball-reference.com":    (0.3, 1),   # BBRef blocks above ~20 requests/minute
+    "lm-api-reads.fantasy.espn.com": (5.0, 4),
+}
+DEFAULT_RATE_LIMIT = (2.0, 2)
+
+RETRY_STATUSES    = {429, 500, 502, 503, 504}
+RETRY_METHODS     = {"GET", "HEAD", "OPTIONS"}
+MAX_RETRIES       = 4
+BACKOFF_BASE      = 0.5    # seconds; attempt n waits up to BACKOFF_BASE * 2**n
+BACKOFF_CAP       = 30.0
+RETRY_BUDGET_RATIO = 0.2
+RETRY_BUDGET_MIN   = 5
+
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until a token is available."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate     = float(rate)
+        self.capacity = float(max(1, burst))
+        self.tokens   = self.capacity
+        self.updated  = time.monotonic()
+        self._lock    = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token; returns the seconds spent waiting for it."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class RetryBudget:
+    """Allows retries up to `ratio` of requests sent (plus `minimum`)."""
+
+    def __init__(self, ratio: float = RETRY_BUDGET_RATIO, minimum: int = RETRY_BUDGET_MIN):
+        self.ratio    = ratio
+        self.minimum  = minimum
+        self.requests = 0
+        self.retries  = 0
+        self._lock    = threading.Lock()
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self.retries >= self.minimum + self.ratio * self.requests:
+                return False
+            self.retries += 1
+            return True
+
+
+def retry_after(response) -> float | None:
+    """Seconds from a Retry-After header (delta-seconds or HTTP date), if any."""
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, response=None, base: float = BACKOFF_BASE, cap: float = BACKOFF_CAP) -> float:
+    """Full-jitter exponential backoff; a Retry-After header sets the floor."""
+    delay = random.uniform(0, min(cap, base * 2 ** attempt))
+    hinted = retry_after(response)
+    if hinted is not None:
+        delay = max(delay, min(hinted, cap))
+    return delay
+
+
+class RequestMetrics:
+    """Per-request records plus a per-host summary."""
+
+    def __init__(self):
+        self.records = []
+        self._lock   = threading.Lock()
+
+    def record(self, host: str, url: str, status: int | None, attempts: int,
+               latency: float, wait: float = 0.0, cached: bool = False, error: str = "") -> None:
+        with self._lock:
+            self.records.append({
+                "host":     host,
+                "url":      url,
+                "status":   status,
+                "attempts": attempts,
+                "retries":  max(0, attempts - 1),
+                "latency":  round(latency, 4),
+                "wait":     round(wait, 4),
+                "cached":   cached,
+                "error":    error,
+            })
+
+    def summary(self) -> dict:
+        """{host: {requests, cached, retries, failed, p50, p95, max, wait}} (seconds)."""
+        with self._lock:
+            records = list(self.records)
+        by_host = {}
+        for r in records:
+            by_host.setdefault(r["host"], []).append(r)
+        out = {}
+        for host, rs in sorted(by_host.items()):
+            wire = sorted(r["latency"] for r in rs if not r["cached"])
+            out[host] = {
+                "requests": len(rs),
+                "cached":   sum(r["cached"] for r in rs),
+                "retries":  sum(r["retries"] for r in rs),
+                "failed":   sum(1 for r in rs if r["error"] or (r["status"] or 0) >= 400),
+                "p50":      _percentile(wire, 0.50),
+                "p95":      _percentile(wire, 0.95),
+                "max":      wire[-1] if wire else 0.0,
+                "wait":     round(sum(r["wait"] for r in rs), 3),
+            }
+        return out
+
+    def dump(self, path: str) -> None:
+        with self._lock:
+            records = list(self.records)
+        with open(path, "w") as f:
+            json.dump({"summary": self.summary(), "requests": records}, f, indent=2)
+
+
+def _percentile(sorted_values: list, q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
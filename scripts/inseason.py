@@ -0,0 +1,96 @@
+"""
+In-season rest-of-season board: blends preseason projections with daily stat
+lines from data/daily/ (src/inseason.py describes the format and the blend).
+
+Each run processes only day files it hasn't seen, re-blending just the players
+in them, then writes the ROS board. Season-to-date totals are kept in
+output/inseason_ytd.parquet between runs.
+
+Install deps:
+    pip install pandas pyarrow
+
+Run:
+    python scripts/inseason.py update          # process new days, write output/ros_board.csv
+    python scripts/inseason.py show -n 40      # current ROS board
+    python scripts/inseason.py show --pitchers
+    python scripts/inseason.py reset           # new season: forget processed days
+
+Outputs: output/ros_board.csv and output/ros_board.parquet.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from src.inseason import DAILY_DIR, STATE_PATH, InSeasonState, day_files, read_day  # noqa: E402
+from src.rules import apply_rules, load_rules  # noqa: E402
+from src.scoring import PITCHER_POSITIONS  # noqa: E402
+from src.storage import read_table, write_with_csv  # noqa: E402
+
+PROJECTIONS_PATH = "data/projections.parquet"
+BOARD_PATH       = "output/ros_board.csv"
+
+
+def load_state(state_path: str) -> InSeasonState:
+    players = apply_rules(read_table(PROJECTIONS_PATH), load_rules())
+    state = InSeasonState(players)
+    state.load(state_path)
+    return state
+
+
+def process_new_days(state: InSeasonState, directory: str) -> None:
+    seen = set(state.days)
+    new = [(day, path) for day, path in day_files(directory) if day not in seen]
+    if not new:
+        print(f"✓ No new days in {directory}/ ({len(state.days)} processed)")
+        return
+    total_ms = 0.0
+    for day, path in new:
+        result = state.update(read_day(path), day)
+        total_ms += result["ms"]
+        note = f", {result['unknown']} not on the board" if result["unknown"] else ""
+        print(f"  {day}: {result['changed']} players updated in {result['ms']:.1f} ms{note}")
+    print(f"✓ {len(new)} new days in {total_ms:.0f} ms ({len(state.days)} processed)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rest-of-season projections from daily stat lines.")
+    parser.add_argument("--daily", default=DAILY_DIR, help="directory of <YYYY-MM-DD>.csv stat lines")
+    parser.add_argument("--state", default=STATE_PATH, help="season-to-date totals")
+    parser.add_argument("--out", default=BOARD_PATH, help="ROS board CSV path")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("update", help="process new daily files and write the ROS board")
+    show = sub.add_parser("show", help="print the ROS board")
+    show.add_argument("-n", type=int, default=25)
+    side = show.add_mutually_exclusive_group()
+    side.add_argument("--hitters", action="store_true")
+    side.add_argument("--pitchers", action="store_true")
+    sub.add_parser("reset", help="clear season-to-date totals")
+    args = parser.parse_args()
+
+    if args.command == "reset":
+        if os.path.exists(args.state):
+            os.remove(args.state)
+        print("✓ Cleared season-to-date totals")
+        return
+
+    state = load_state(args.state)
+    if args.command == "update":
+        process_new_days(state, args.daily)
+        state.save(args.state)
+        board = state.table()
+        write_with_csv(board, args.out)
+        print(f"✓ Saved {args.out}")
+        print(board.head(15).to_string(index=False))
+    else:
+        board = state.table()
+        if args.hitters or args.pitchers:
+            board = board[board["Position"].astype(str).isin(PITCHER_POSITIONS) == args.pitchers]
+        print(f"{len(state.days)} days processed\n")
+        print(board.head(args.n).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
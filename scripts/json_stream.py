@@ -0,0 +1,168 @@
+"""
+Incremental JSON helpers for large ESPN payloads.
+
+iter_json_items() walks a JSON array (the document root, or one key of a root
+object such as ESPN's {"players": [...]}) and yields its elements one at a
+time while reading the input in chunks, so only the current chunk and the
+element being decoded are held in memory. JsonArrayWriter is the matching
+writer, and ColumnBuilder collects per-record dicts as column lists rather
+than a list of row dicts.
+
+Each element is decoded with the stdlib json.JSONDecoder.raw_decode.
+"""
+
+import codecs
+import json
+import re
+
+import pandas as pd
+
+CHUNK_SIZE = 1 << 16
+
+_WS      = re.compile(r"[ \t\n\r]*")
+_NUMBER  = re.compile(r"[0-9.eE+-]*")
+_DECODER = json.JSONDecoder()
+
+
+class _Reader:
+    """Sliding text buffer over an iterable of str/bytes chunks."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._decode = codecs.getincrementaldecoder("utf-8")().decode
+        self.buf     = ""
+        self.pos     = 0
+        self.eof     = False
+
+    def fill(self) -> bool:
+        """Append the next non-empty chunk (dropping consumed text); False at end of input."""
+        if self.eof:
+            return False
+        for chunk in self._chunks:
+            text = self._decode(chunk) if isinstance(chunk, (bytes, bytearray)) else chunk
+            if text:
+                self.buf, self.pos = self.buf[self.pos:] + text, 0
+                return True
+        self.buf, self.pos = self.buf[self.pos:] + self._decode(b"", final=True), 0
+        self.eof = True
+        return False
+
+    def peek(self) -> str:
+        """Next non-whitespace character ("" at end of input), without consuming it."""
+        while True:
+            self.pos = _WS.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"expected {char!r}, found {found or 'end of input'!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value, reading more input as needed."""
+        self.peek()
+        while True:
+            try:
+                obj, end = _DECODER.raw_decode(self.buf, self.pos)
+                # a number running up to the end of the buffer may continue in the next chunk
+                truncated = (isinstance(obj, (int, float)) and not isinstance(obj, bool)
+                             and _NUMBER.match(self.buf, end).end() == len(self.buf))
+                if not truncated or self.eof:
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self.fill()
+
+
+def iter_json_items(chunks, key: str | None = None):
+    """
+    Yield the elements of a JSON array from an iterable of str/bytes chunks.
+
+    With `key`, a root object is searched for that key and its array is
+    streamed (other keys are decoded and discarded); a root array is streamed
+    either way. Yields nothing if the key is missing.
+    """
+    reader = _Reader(chunks)
+    first = reader.peek()
+
+    if first == "{" and key is not None:
+        reader.pos += 1
+        while True:
+            if reader.peek() == "}":
+                return
+            name = reader.value()
+            reader.expect(":")
+            if name == key:
+                break
+            reader.value()
+            if reader.peek() == ",":
+                reader.pos += 1
+        first = reader.peek()
+
+    if first != "[":
+        raise ValueError(f"expected a JSON array, found {first or 'end of input'!r}")
+    reader.pos += 1
+    if reader.peek() == "]":
+        return
+    while True:
+        yield reader.value()
+        sep = reader.peek()
+        if sep == "]":
+            return
+        if sep != ",":
+            raise ValueError(f"expected ',' or ']' in array, found {sep or 'end of input'!r}")
+        reader.pos += 1
+
+
+def read_chunks(f, chunk_size: int = CHUNK_SIZE):
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_json_file(path: str, key: str | None = None, chunk_size: int = CHUNK_SIZE):
+    """iter_json_items over a file on disk."""
+    with open(path, "rb") as f:
+        yield from iter_json_items(read_chunks(f, chunk_size), key)
+
+
+class JsonArrayWriter:
+    """Writes a JSON array one element at a time."""
+
+    def __init__(self, f):
+        self.f     = f
+        self.count = 0
+        f.write("[")
+
+    def write(self, obj) -> None:
+        self.f.write(",\n" if self.count else "\n")
+        self.f.write(json.dumps(obj))
+        self.count += 1
+
+    def close(self) -> None:
+        self.f.write("\n]\n" if self.count else "]\n")
+
+
+class ColumnBuilder:
+    """Collects row dicts as one list per column; missing keys become None."""
+
+    def __init__(self, columns: list):
+        self.columns = {c: [] for c in columns}
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), []))
+
+    def append(self, row: dict) -> None:
+        for name, values in self.columns.items():
+            values.append(row.get(name))
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.columns)
@@ -0,0 +1,109 @@
+"""
+Daily lineup optimizer: best starting lineup for every day in the daily
+projections file, solved as exact assignments (src/lineup.py).
+
+Inputs:
+    data/rosters.csv              Team, Name (our team picked with --team)
+    data/daily_projections.csv    Date, Name, Points — projected points per
+                                  player and day; off days simply have no row
+    output/draft_board.parquet    Position for each player (plus
+                                  data/espn_eligibility.csv if present)
+
+Without a daily projections file the season projections are used as one "day".
+
+Install deps:
+    pip install pandas pyarrow scipy       # scipy optional (faster solver)
+
+Run:
+    python scripts/lineup.py --team Mike                          # every day in the file
+    python scripts/lineup.py --team Mike --start 2026-05-04 --days 7
+    python scripts/lineup.py --team Mike --show 2026-05-04
+
+Output: output/lineups.csv (Date, Slot, Name, Points).
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from src.lineup import (DAILY_PROJECTIONS_PATH, LINEUP_SLOTS, eligibility_matrix, linear_sum_assignment,  # noqa: E402
+                        lineup_table, load_daily_points, optimize_days)
+from src.scarcity import load_eligibility  # noqa: E402
+from src.storage import read_table  # noqa: E402
+from src.waivers import ROSTERS_PATH, load_rosters, points_column  # noqa: E402
+
+BOARD_PATH = "output/draft_board.parquet"
+OUT_PATH   = "output/lineups.csv"
+
+
+def roster_players(rosters_path: str, team: str, board: pd.DataFrame) -> pd.DataFrame:
+    """Our roster with Position (and season points) from the board."""
+    rosters = load_rosters(rosters_path)
+    ours = rosters[rosters["Team"] == team]
+    if ours.empty:
+        sys.exit(f"No team {team!r} in {rosters_path} (teams: {', '.join(sorted(set(rosters['Team'])))})")
+    board = board.drop_duplicates("Player_ID")[["Player_ID", "Position", points_column(board)]]
+    players = ours[["Name", "Player_ID"]].merge(board, on="Player_ID", how="left")
+    missing = players["Position"].isna()
+    if missing.any():
+        print(f"⚠ Not on the board (skipped): {', '.join(players.loc[missing, 'Name'])}")
+    return players[~missing].reset_index(drop=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Optimal daily lineups for a whole schedule.")
+    parser.add_argument("--team", required=True, help="our team's name in the rosters file")
+    parser.add_argument("--rosters", default=ROSTERS_PATH)
+    parser.add_argument("--daily", default=DAILY_PROJECTIONS_PATH, help="Date, Name, Points CSV")
+    parser.add_argument("--board", default=BOARD_PATH, help="board with each player's Position")
+    parser.add_argument("--start", help="first date (YYYY-MM-DD)")
+    parser.add_argument("--days", type=int, help="number of days from --start")
+    parser.add_argument("--show", help="print the lineup for this date (default: first day)")
+    parser.add_argument("--out", default=OUT_PATH)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.board):
+        sys.exit(f"{args.board} not found — run 'python main.py' first.")
+    board = read_table(args.board)
+    players = roster_players(args.rosters, args.team, board)
+    eligible = eligibility_matrix(players, load_eligibility())
+
+    if os.path.exists(args.daily):
+        dates, points = load_daily_points(args.daily, players["Name"])
+        keep = np.ones(len(dates), dtype=bool)
+        if args.start:
+            keep &= dates.astype(str) >= args.start
+        if args.days:
+            keep &= np.cumsum(keep) <= args.days
+        dates, points = dates[keep], points[keep]
+    else:
+        print(f"⚠ No {args.daily} — optimizing one lineup from season projections")
+        dates = np.array(["season"])
+        points = players[points_column(board)].to_numpy(dtype="float64")[None, :]
+
+    start = time.perf_counter()
+    lineups, totals = optimize_days(points, eligible)
+    elapsed = time.perf_counter() - start
+    solver = "scipy" if linear_sum_assignment is not None else "built-in Hungarian"
+    print(f"✓ {len(dates)} days × {len(LINEUP_SLOTS)} slots, {len(players)} players "
+          f"in {elapsed * 1000:.0f} ms ({solver}); {totals.sum():.1f} projected points")
+
+    table = lineup_table(dates, lineups, points, players["Name"])
+    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+    table.to_csv(args.out, index=False)
+    print(f"✓ Saved {args.out}")
+
+    if len(dates):
+        day = args.show or dates[0]
+        shown = table[table["Date"].astype(str) == str(day)]
+        print(f"\n{day}: {shown['Points'].sum():.1f} pts")
+        print(shown.drop(columns="Date").to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Scoring what-ifs: re-score the board over a grid of weights and report how
+ranks move (src/scenarios.py).
+
+Each --vary gives a scoring feature (src.scoring.FEATURES: R, TB, RBI, BB, K,
+SB, ..., IP, ER, K_pitch, SV, QS, HLD, ...) and its values; the grid is every
+combination. Ranks are by VORP, compared against the current weights.
+
+Install deps:
+    pip install pandas pyarrow
+
+Run:
+    python scripts/scenarios.py --vary IP=1,2,3                     # the IP weight change
+    python scripts/scenarios.py --vary IP=1:3:0.5 QS=1:4:1 SV=3,4,5,6
+    python scripts/scenarios.py --vary HLD=1,2,3 --top 150 --workers 1
+
+Outputs: output/scenarios.csv (one row per scenario, most disruptive first)
+and output/scenario_movers.csv (biggest movers per scenario).
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from src.rules import apply_rules, load_rules  # noqa: E402
+from src.scenarios import CHUNK, MOVERS, TOP_N, parse_vary, run_scenarios, scenario_grid  # noqa: E402
+from src.storage import read_table  # noqa: E402
+
+PROJECTIONS_PATH = "data/projections.parquet"
+SUMMARY_PATH     = "output/scenarios.csv"
+MOVERS_PATH      = "output/scenario_movers.csv"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep scoring weights and report rank changes.")
+    parser.add_argument("--vary", nargs="+", required=True, metavar="FEATURE=VALUES",
+                        help="e.g. IP=1,2,3 or QS=1:4:0.5")
+    parser.add_argument("--top", type=int, default=TOP_N, help="ranks that count for shifts and movers")
+    parser.add_argument("--movers", type=int, default=MOVERS, help="movers kept per scenario")
+    parser.add_argument("--chunk", type=int, default=CHUNK, help="scenarios per process-pool job")
+    parser.add_argument("--workers", type=int, help="processes (default: one per CPU)")
+    parser.add_argument("--out", default=SUMMARY_PATH, help="summary CSV path")
+    args = parser.parse_args()
+
+    try:
+        scenarios = scenario_grid(parse_vary(args.vary))
+    except ValueError as e:
+        sys.exit(str(e))
+    players = apply_rules(read_table(PROJECTIONS_PATH), load_rules())
+
+    print(f"Scoring {len(scenarios)} scenarios over {len(players)} players...")
+    start = time.perf_counter()
+    summary, movers = run_scenarios(players, scenarios, workers=args.workers, chunk=args.chunk,
+                                    top_n=args.top, movers=args.movers)
+    if summary.empty:
+        sys.exit("Every scenario batch failed.")
+    print(f"✓ {len(summary)} scenarios in {time.perf_counter() - start:.1f}s\n")
+
+    print("=== Most disruptive scenarios ===")
+    print(summary.head(15).to_string(index=False))
+    worst = summary.iloc[0]
+    varied = [c for c in summary.columns if c in movers.columns and c not in ("Name",)]
+    mask = (movers[varied] == worst[varied]).all(axis=1)
+    label = ", ".join(f"{c}={worst[c]:g}" for c in varied)
+    print(f"\n=== Biggest movers: {label} ===")
+    print(movers.loc[mask, ["Name", "Base_Rank", "Rank", "Shift"]].to_string(index=False))
+
+    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+    summary.to_csv(args.out, index=False)
+    movers_path = os.path.join(os.path.dirname(args.out) or ".", os.path.basename(MOVERS_PATH))
+    movers.to_csv(movers_path, index=False)
+    print(f"\n✓ Saved {args.out} and {movers_path}")
+
+
+if __name__ == "__main__":
+    main()
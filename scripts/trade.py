@@ -0,0 +1,92 @@
+"""
+Trade analyzer: each side's change in best starting-lineup points and roster
+VORP for a proposed trade, or a search over every team for trades that help
+us without hurting them (src/trade.py).
+
+Rosters are read from data/rosters.csv (Team, Name). Points come from the
+in-season ROS board when it exists, else the draft board.
+
+Install deps:
+    pip install pandas pyarrow scipy       # scipy optional (faster solver)
+
+Run:
+    python scripts/trade.py evaluate --team Mike --with T3 --give "Pete Alonso" --get "Ozzie Albies"
+    python scripts/trade.py evaluate --team Mike --with T3 --give "Pete Alonso" "Jhoan Duran" --get "Ozzie Albies"
+    python scripts/trade.py search --team Mike -n 20
+    python scripts/trade.py search --team Mike --workers 1      # no process pool
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from src.storage import read_table  # noqa: E402
+from src.trade import PRUNE_SLACK, TradeAnalyzer, search  # noqa: E402
+from src.waivers import ROSTERS_PATH, load_rosters  # noqa: E402
+
+ROS_BOARD_PATH   = "output/ros_board.parquet"
+DRAFT_BOARD_PATH = "output/draft_board.parquet"
+
+
+def print_evaluation(analyzer: TradeAnalyzer, args) -> None:
+    try:
+        give = analyzer.rows_for(args.team, args.give)
+        get = analyzer.rows_for(args.partner, args.get)
+    except KeyError as e:
+        sys.exit(str(e.args[0]))
+    start = time.perf_counter()
+    result = analyzer.evaluate(args.team, args.partner, give, get)
+    ms = (time.perf_counter() - start) * 1000
+    print(f"{args.team} gives {' + '.join(args.give)}  ·  {args.partner} gives {' + '.join(args.get)}\n")
+    names = analyzer.board["Name"].to_numpy()
+    for side, team in (("a", args.team), ("b", args.partner)):
+        drops = result[f"{side}_drops"]
+        dropped = f"   drops {' + '.join(names[drops])}" if len(drops) else ""
+        print(f"  {team:12} lineup {result[f'{side}_points']:+7.1f} pts   roster VORP {result[f'{side}_vorp']:+7.1f}"
+              f"{dropped}")
+    print(f"\n({ms:.1f} ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate or search for trades.")
+    parser.add_argument("--rosters", default=ROSTERS_PATH, help="CSV with Team, Name")
+    parser.add_argument("--board", help=f"board to value players from (default: {ROS_BOARD_PATH} if present)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    evaluate = sub.add_parser("evaluate", help="score one proposed trade")
+    evaluate.add_argument("--team", required=True)
+    evaluate.add_argument("--with", dest="partner", required=True, help="the other team")
+    evaluate.add_argument("--give", nargs="+", required=True, help="our players going out")
+    evaluate.add_argument("--get", nargs="+", required=True, help="their players coming in")
+
+    find = sub.add_parser("search", help="1-for-1, 2-for-1 and 1-for-2 trades with every team")
+    find.add_argument("--team", required=True)
+    find.add_argument("-n", type=int, default=20)
+    find.add_argument("--slack", type=float, default=PRUNE_SLACK, help="pruning tolerance in points")
+    find.add_argument("--workers", type=int, help="processes (default: one per CPU)")
+    args = parser.parse_args()
+
+    board_path = args.board or (ROS_BOARD_PATH if os.path.exists(ROS_BOARD_PATH) else DRAFT_BOARD_PATH)
+    if not os.path.exists(board_path):
+        sys.exit(f"{board_path} not found — run 'python main.py' first.")
+    if not os.path.exists(args.rosters):
+        sys.exit(f"{args.rosters} not found — export league rosters as Team,Name.")
+    analyzer = TradeAnalyzer(read_table(board_path), load_rosters(args.rosters))
+    for team in [args.team] + ([args.partner] if args.command == "evaluate" else []):
+        if team not in analyzer.teams:
+            sys.exit(f"No team {team!r} in {args.rosters} (teams: {', '.join(sorted(analyzer.teams))})")
+
+    if args.command == "evaluate":
+        print_evaluation(analyzer, args)
+    else:
+        start = time.perf_counter()
+        table = search(analyzer, args.team, args.workers, slack=args.slack)
+        print(f"✓ {len(table)} trades help {args.team} without hurting the other side "
+              f"({time.perf_counter() - start:.1f}s)\n")
+        print(table.head(args.n).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
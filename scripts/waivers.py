@@ -0,0 +1,73 @@
+"""
+Waiver-wire rankings: unrostered players by points gained over our weakest
+starter at each position they can play (src/waivers.py).
+
+League rosters are read from data/rosters.csv (Team, Name). Points come from
+the in-season ROS board (output/ros_board.parquet) when it exists, else the
+draft board. With --watch the rosters file is re-read every N seconds and
+only the players that moved are re-applied.
+
+Install deps:
+    pip install pandas pyarrow
+
+Run (after python main.py or python scripts/inseason.py update):
+    python scripts/waivers.py --team Mike
+    python scripts/waivers.py --team Mike --position SS -n 10
+    python scripts/waivers.py --team Mike --watch 300     # re-rank every 5 minutes
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from src.storage import read_table  # noqa: E402
+from src.waivers import ROSTERS_PATH, WaiverIndex, load_rosters  # noqa: E402
+
+ROS_BOARD_PATH   = "output/ros_board.parquet"
+DRAFT_BOARD_PATH = "output/draft_board.parquet"
+
+
+def default_board() -> str:
+    return ROS_BOARD_PATH if os.path.exists(ROS_BOARD_PATH) else DRAFT_BOARD_PATH
+
+
+def show(index: WaiverIndex, rosters_path: str, team: str, n: int, position: str | None) -> None:
+    rosters = load_rosters(rosters_path)
+    if team not in set(rosters["Team"]):
+        sys.exit(f"No team {team!r} in {rosters_path} (teams: {', '.join(sorted(set(rosters['Team'])))})")
+    result = index.set_rosters(rosters, team)
+    table = index.rank(n, position)
+    print(f"{int(index.free.sum())} free agents  ·  {result['moved']} roster changes applied "
+          f"in {result['ms']:.1f} ms\n")
+    print(table.to_string(index=False))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rank free agents against our weakest starters.")
+    parser.add_argument("--team", required=True, help="our team's name in the rosters file")
+    parser.add_argument("--rosters", default=ROSTERS_PATH, help="CSV with Team, Name")
+    parser.add_argument("--board", help=f"board to value players from (default: {ROS_BOARD_PATH} if present)")
+    parser.add_argument("--position", help="only this position, e.g. SS or RP")
+    parser.add_argument("-n", type=int, default=25)
+    parser.add_argument("--watch", type=int, metavar="SECONDS", help="re-read rosters and re-rank every N seconds")
+    args = parser.parse_args()
+
+    board_path = args.board or default_board()
+    if not os.path.exists(board_path):
+        sys.exit(f"{board_path} not found — run 'python main.py' first.")
+    if not os.path.exists(args.rosters):
+        sys.exit(f"{args.rosters} not found — export league rosters as Team,Name.")
+    index = WaiverIndex(read_table(board_path))
+    print(f"✓ Indexed {len(index.board)} players from {board_path}")
+
+    show(index, args.rosters, args.team, args.n, args.position)
+    while args.watch:
+        time.sleep(args.watch)
+        print(f"\n--- {time.strftime('%H:%M:%S')} ---")
+        show(index, args.rosters, args.team, args.n, args.position)
+
+
+if __name__ == "__main__":
+    main()
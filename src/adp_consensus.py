@@ -0,0 +1,109 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from src.matching import FUZZY_THRESHOLD, match_names, player_ids
+
+STAT_COLS = ["ADP", "ADP_Min", "ADP_Max", "ADP_Std", "ADP_N"]
+
+
+def align_sources(sources: dict, threshold: int = FUZZY_THRESHOLD) -> pd.DataFrame:
+    """
+    Put every source on one player key.
+
+    sources: {label: DataFrame[Name, ADP]} in priority order — the first
+    source that lists a player supplies its display name.
+
+    Each source is joined to the players seen so far on Player_ID (the
+    normalized-name hash). Only the rows that miss get fuzzy-matched, in one
+    batched match_names call per source against the players that source
+    hasn't claimed yet; anything still unmatched becomes a new player.
+
+    Returns long DataFrame[Player_ID, source, ADP, match_score] and a
+    Player_ID -> Name lookup as a second value.
+    """
+    names = pd.Series(dtype=object, index=pd.Index([], dtype="uint64"))   # Player_ID -> display name
+    parts = []
+
+    for label, df in sources.items():
+        df = df[["Name", "ADP"]].dropna().reset_index(drop=True)
+        ids = player_ids(df["Name"]).to_numpy()
+        ids_seen = names.index.to_numpy()
+
+        # one row per player per source
+        first = ~pd.Series(ids).duplicated().to_numpy()
+        df, ids = df[first].reset_index(drop=True), ids[first]
+
+        score = np.where(np.isin(ids, ids_seen), 100.0, np.nan)
+        missing = np.flatnonzero(np.isnan(score))
+        open_ids = np.setdiff1d(ids_seen, ids)
+        if len(missing) and len(open_ids):
+            pairs = match_names(df["Name"].to_numpy()[missing], names.loc[open_ids].to_numpy(), threshold)
+            ids[missing[pairs["left"].to_numpy()]] = open_ids[pairs["right"].to_numpy()]
+            score[missing[pairs["left"].to_numpy()]] = pairs["score"].to_numpy()
+
+        new = np.isnan(score)
+        names = pd.concat([names, pd.Series(df["Name"].to_numpy()[new], index=pd.Index(ids[new], dtype="uint64"))])
+        parts.append(pd.DataFrame({
+            "Player_ID":   ids,
+            "source":      label,
+            "ADP":         df["ADP"].to_numpy(dtype=np.float64),
+            "match_score": score,
+        }))
+        print(f"  {label}: {len(df)} players, {int((~new).sum())} joined, {int(new.sum())} new")
+
+    return pd.concat(parts, ignore_index=True), names
+
+
+def consensus_adp(long: pd.DataFrame, names: pd.Series, weights: dict) -> pd.DataFrame:
+    """
+    Weighted consensus over any number of sources in one pass over a
+    players x sources matrix (NaN = source doesn't list the player).
+
+    Output per player: ADP (weighted mean), ADP_Min, ADP_Max, ADP_Std
+    (weighted sample std across sources, with reliability weights so equal
+    weights give the usual ddof=1 std; NaN when only one source), ADP_N
+    (number of sources) and one ADP_<SOURCE> column per source.
+    """
+    labels = list(dict.fromkeys(long["source"]))
+    pid_codes, pids = pd.factorize(long["Player_ID"])
+    src_codes = pd.Index(labels).get_indexer(long["source"])
+
+    X = np.full((len(pids), len(labels)), np.nan)
+    X[pid_codes, src_codes] = long["ADP"].to_numpy()
+    w = np.array([weights.get(label, 1.0) for label in labels], dtype=np.float64)
+
+    has = ~np.isnan(X)
+    W = has * w
+    X0 = np.where(has, X, 0.0)
+    n = has.sum(axis=1)
+    V1 = W.sum(axis=1)
+    V2 = (W ** 2).sum(axis=1)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)   # single-source rows
+        mean = (X0 * W).sum(axis=1) / V1
+        dev2 = np.where(has, (X0 - mean[:, None]) ** 2, 0.0)
+        std = np.sqrt((W * dev2).sum(axis=1) / (V1 - V2 / V1))
+
+    out = pd.DataFrame({
+        "Name":    names.loc[pids].to_numpy(),
+        "ADP":     mean.round(1),
+        "ADP_Min": np.nanmin(X, axis=1).round(1),
+        "ADP_Max": np.nanmax(X, axis=1).round(1),
+        "ADP_Std": np.where(n > 1, std, np.nan).round(1),
+        "ADP_N":   n,
+    })
+    for j, label in enumerate(labels):
+        out[f"ADP_{label}"] = X[:, j]
+    return out.sort_values("ADP", kind="stable").reset_index(drop=True)
+
+
+def drop_fringe(result: pd.DataFrame, primary: str, min_sources: int = 2) -> pd.DataFrame:
+    """
+    Keep players the primary source lists or at least `min_sources` sources
+    list, so one site's long tail of barely-drafted names doesn't push real
+    draft picks down the consensus ranks.
+    """
+    keep = result[f"ADP_{primary}"].notna() | (result["ADP_N"] >= min_sources)
+    return result[keep].reset_index(drop=True)
@@ -0,0 +1,132 @@
+import datetime as dt
+import os
+import warnings
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.matching import player_ids
+
+HISTORY_DIR = "data/adp_history"
+
+# ADP columns that are consensus summaries, not individual sources
+SUMMARY_COLS = {"ADP", "ADP_Min", "ADP_Max", "ADP_Std", "ADP_N"}
+
+TREND_COLS = ["ADP_Trend_7d", "ADP_Trend_14d", "ADP_Volatility", "ADP_Divergence"]
+
+
+def _partition_path(root: str, date: str) -> str:
+    return os.path.join(root, f"date={date}", "adp.parquet")
+
+
+def list_snapshot_dates(root: str = HISTORY_DIR) -> list:
+    """ISO dates that have a snapshot, oldest first."""
+    if not os.path.isdir(root):
+        return []
+    return sorted(d[len("date="):] for d in os.listdir(root) if d.startswith("date="))
+
+
+def append_snapshot(adp_df: pd.DataFrame, date: str | None = None, root: str = HISTORY_DIR) -> str:
+    """
+    Store one combine_adp result as the snapshot for `date` (default today).
+    One Parquet file per date partition, keyed by Player_ID; ADP columns are
+    float32. Re-running on the same day replaces that day's snapshot.
+    """
+    date = date or dt.date.today().isoformat()
+    adp_cols = [c for c in adp_df.columns if c.startswith("ADP")]
+
+    snap = pd.DataFrame({"Player_ID": player_ids(adp_df["Name"]).to_numpy(), "Name": adp_df["Name"].astype(str).to_numpy()})
+    for col in adp_cols:
+        snap[col] = pd.to_numeric(adp_df[col], errors="coerce").astype("float32").to_numpy()
+    snap = snap.drop_duplicates("Player_ID", keep="first")
+
+    path = _partition_path(root, date)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    snap.to_parquet(tmp, index=False)
+    os.replace(tmp, path)
+    print(f"✓ ADP snapshot {date}: {len(snap)} players → {path}")
+    return path
+
+
+def load_history(root: str = HISTORY_DIR, since: str | None = None, until: str | None = None,
+                 columns: list | None = None) -> pd.DataFrame:
+    """
+    Long-format ADP history (one row per player per snapshot date).
+    Only partitions inside [since, until] are opened.
+    """
+    dates = [d for d in list_snapshot_dates(root) if (since is None or d >= since) and (until is None or d <= until)]
+    if not dates:
+        return pd.DataFrame(columns=["date", "Player_ID", "ADP"])
+
+    tables, sizes = [], []
+    for date in dates:
+        table = pq.read_table(_partition_path(root, date), columns=columns)
+        tables.append(table)
+        sizes.append(table.num_rows)
+    history = pa.concat_tables(tables, promote_options="default").to_pandas()
+    history.insert(0, "date", np.repeat(np.array(dates, dtype="datetime64[ns]"), sizes))
+    return history
+
+
+def compute_adp_trends(root: str = HISTORY_DIR, as_of: str | None = None, windows: tuple = (7, 14)) -> pd.DataFrame:
+    """
+    Per-player ADP movement as of the latest snapshot (or `as_of`).
+
+      ADP_Trend_<w>d  ADP <w> days ago minus ADP now — positive = rising
+                      (being drafted earlier). Uses the oldest snapshot
+                      inside the window when there is no exact match, and
+                      is NaN when the window has no earlier snapshot of
+                      the player.
+      ADP_Volatility  std of daily ADP over the longest window
+      ADP_Divergence  max - min of the per-source ADPs in the latest snapshot
+    """
+    dates = [d for d in list_snapshot_dates(root) if as_of is None or d <= as_of]
+    if not dates:
+        return pd.DataFrame({"Player_ID": pd.Series(dtype="uint64"),
+                             **{c: pd.Series(dtype="float64") for c in TREND_COLS}})
+
+    latest = pd.Timestamp(dates[-1])
+    since  = (latest - pd.Timedelta(days=max(windows))).date().isoformat()
+    history = load_history(root, since=since, until=dates[-1])
+
+    # players x dates matrix; columns sorted oldest -> newest
+    wide = history.pivot_table(index="Player_ID", columns="date", values="ADP", aggfunc="first")
+    wide = wide[[d for d in wide.columns if pd.notna(d)]].sort_index(axis=1)
+    values = wide.to_numpy(dtype=np.float64)
+    col_dates = wide.columns.to_numpy()
+
+    out = pd.DataFrame(index=wide.index)
+    now = values[:, -1]
+    for w in windows:
+        # earlier snapshots only: today's against itself is not a trend
+        in_window = (col_dates >= np.datetime64(latest - pd.Timedelta(days=w))) & (col_dates < np.datetime64(latest))
+        window_vals = values[:, in_window]
+        # first non-null earlier value in the window for each player; NaN if none
+        then = np.full(len(values), np.nan)
+        if window_vals.shape[1]:
+            has = ~np.isnan(window_vals)
+            found = has.any(axis=1)
+            then[found] = window_vals[found, has[found].argmax(axis=1)]
+        out[f"ADP_Trend_{w}d"] = np.round(then - now, 1)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)   # all-NaN rows
+        counts = (~np.isnan(values)).sum(axis=1)
+        vol = np.nanstd(values, axis=1, ddof=1) if values.shape[1] > 1 else np.full(len(values), np.nan)
+    out["ADP_Volatility"] = np.where(counts > 1, np.round(vol, 1), np.nan)
+
+    latest_snap = history[history["date"] == latest].set_index("Player_ID")
+    source_cols = [c for c in latest_snap.columns if c.startswith("ADP_") and c not in SUMMARY_COLS]
+    if source_cols:
+        src = latest_snap[source_cols].to_numpy(dtype=np.float64)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            spread = np.nanmax(src, axis=1) - np.nanmin(src, axis=1)
+        out["ADP_Divergence"] = pd.Series(np.round(spread, 1), index=latest_snap.index).reindex(out.index)
+    else:
+        out["ADP_Divergence"] = np.nan
+
+    return out.reset_index()
@@ -0,0 +1,183 @@
+"""
+Backtest the draft board against past seasons.
+
+Each season is rebuilt from what was known before that draft — archived
+projections, ADP and (optionally) eligibility and rules — the same way
+main.py builds the current board, then scored against the players' realized
+fantasy points. The board is compared with drafting straight off ADP and off
+raw projected points.
+
+Archive layout, one directory per season:
+
+    data/archive/2023/projections.parquet   same columns as data/projections (.csv also read)
+    data/archive/2023/adp.parquet           Name, ADP (+ ADP_Std), as data/adp
+    data/archive/2023/actuals.parquet       realized season stats, projection columns
+    data/archive/2023/espn_eligibility.csv  optional
+    data/archive/2023/rules.csv             optional, see src/rules.py
+
+Metrics per (season, config, ranking), all over the same pool — players with
+an ADP (< 999), since undrafted players were never on the table:
+    spearman     rank correlation between the ranking and realized points
+    hit@N        share of the ranking's top N that finished in the actual top N
+    points       realized points of the first teams × rounds picks in ranking order
+and, per round, the mean realized points of that round's picks.
+
+Season × config jobs run in a process pool (run_backtest).
+"""
+
+import contextlib
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from src.matching import player_ids
+from src.rank import build_draft_board, compute_value_score, merge_adp
+from src.rules import apply_rules, load_rules
+from src.scarcity import SLOTS, TEAMS, compute_vorp, starters_for
+from src.scoring import calculate_points_frame
+from src.storage import read_table
+
+ARCHIVE_DIR = "data/archive"
+REQUIRED    = ("projections", "adp", "actuals")
+ROUNDS      = 20
+TOP_N       = (25, 50, 100)
+RANKINGS    = ("board", "adp", "points")
+
+DEFAULT_CONFIG = {"name": "default", "teams": TEAMS, "rounds": ROUNDS, "slots": {}}
+
+
+def _table_exists(season_dir: str, name: str) -> bool:
+    return any(os.path.exists(os.path.join(season_dir, f"{name}.{ext}")) for ext in ("parquet", "csv"))
+
+
+def discover_seasons(archive_dir: str = ARCHIVE_DIR) -> list:
+    """Season directory names under archive_dir that have every REQUIRED table, sorted."""
+    if not os.path.isdir(archive_dir):
+        return []
+    return sorted(d for d in os.listdir(archive_dir)
+                  if all(_table_exists(os.path.join(archive_dir, d), name) for name in REQUIRED))
+
+
+def make_config(**overrides) -> dict:
+    """DEFAULT_CONFIG with overrides; slot overrides merge into SLOTS (e.g. slots={"SP": 6})."""
+    config = {**DEFAULT_CONFIG, **overrides}
+    config["slots"] = {**SLOTS, **(config.get("slots") or {})}
+    return config
+
+
+def build_season_board(season_dir: str, config: dict) -> pd.DataFrame:
+    """The board main.py would have produced for that season (without ADP trends)."""
+    config = make_config(**config)
+    df = read_table(os.path.join(season_dir, "projections.parquet"))
+    df = apply_rules(df, load_rules(os.path.join(season_dir, "rules.csv"), None, None))
+    df = df.copy()
+    df["projected_points"] = calculate_points_frame(df).round(1)
+    df = compute_vorp(df, eligibility_path=os.path.join(season_dir, "espn_eligibility.csv"),
+                      starters=starters_for(config["teams"], config["slots"]))
+    df = merge_adp(df, adp_path=os.path.join(season_dir, "adp.parquet"))
+    return build_draft_board(compute_value_score(df))
+
+
+def realized_points(board: pd.DataFrame, actuals: pd.DataFrame) -> pd.Series:
+    """Each board player's actual fantasy points, scored at their board position; 0 if they didn't play."""
+    if "Player_ID" not in actuals.columns:
+        if "Name" not in actuals.columns:
+            raise ValueError("actuals need a Player_ID or Name column")
+        actuals = actuals.assign(Player_ID=player_ids(actuals["Name"]).to_numpy())
+    actuals = actuals.drop(columns=["Name", "Position"], errors="ignore")
+    actuals = actuals.drop_duplicates("Player_ID").set_index("Player_ID")
+    stats = actuals.reindex(player_ids(board["Name"]).to_numpy()).fillna(0.0)
+    stats["Position"] = board["Position"].astype(str).to_numpy()
+    return pd.Series(calculate_points_frame(stats.reset_index(drop=True)).to_numpy(), index=board.index)
+
+
+def _orders(board: pd.DataFrame) -> dict:
+    return {
+        "board":  board.index,
+        "adp":    board.sort_values("ADP", kind="stable").index,
+        "points": board.sort_values("projected_points", ascending=False, kind="stable").index,
+    }
+
+
+def score_rankings(board: pd.DataFrame, realized: pd.Series, teams: int = TEAMS, rounds: int = ROUNDS,
+                   top_n: tuple = TOP_N) -> tuple:
+    """(summary rows, per-round rows) for each ranking in RANKINGS — see module docstring."""
+    pool = board.index[board["ADP"] < 999]
+    actual_top = {n: set(realized[pool].nlargest(n).index) for n in top_n}
+    picks = teams * rounds
+
+    summary, per_round = [], []
+    for ranking, order in _orders(board).items():
+        ranked_pool = order[np.isin(order, pool)]
+        points = realized[ranked_pool].to_numpy()
+        spearman = (pd.Series(-np.arange(len(points), dtype="float64")).corr(pd.Series(points), method="spearman")
+                    if len(points) > 1 else np.nan)
+        row = {"ranking": ranking, "spearman": round(spearman, 4)}
+        for n in top_n:
+            row[f"hit@{n}"] = round(len(set(ranked_pool[:n]) & actual_top[n]) / n, 4)
+        drafted = realized[ranked_pool[:picks]].to_numpy()
+        row["points"] = round(float(drafted.sum()), 1)
+        summary.append(row)
+
+        for r, chunk in enumerate(np.array_split(drafted, range(teams, len(drafted), teams)), start=1):
+            per_round.append({"ranking": ranking, "round": r, "points": round(float(chunk.mean()), 2)})
+    return summary, per_round
+
+
+def evaluate(season: str, config: dict, archive_dir: str = ARCHIVE_DIR) -> dict:
+    """One backtest job: build the season's board under `config` and score it."""
+    config = make_config(**config)
+    season_dir = os.path.join(archive_dir, season)
+    # the board builders narrate every step; keep worker output to one line per job
+    with contextlib.redirect_stdout(io.StringIO()):
+        board = build_season_board(season_dir, config)
+        actuals = read_table(os.path.join(season_dir, "actuals.parquet"))
+    realized = realized_points(board, actuals)
+    summary, per_round = score_rankings(board, realized, config["teams"], config["rounds"])
+    tag = {"season": season, "config": config["name"]}
+    return {"summary": [{**tag, **r} for r in summary], "rounds": [{**tag, **r} for r in per_round]}
+
+
+def run_backtest(seasons: list, configs: list, archive_dir: str = ARCHIVE_DIR,
+                 workers: int | None = None) -> tuple:
+    """
+    Every season × config, in a process pool of `workers` (default: one per
+    CPU; 1 runs inline). Returns (summary, rounds) DataFrames.
+    """
+    jobs = [(season, make_config(**config)) for season in seasons for config in configs]
+    results = []
+
+    def report(season, config, result):
+        board = next(r for r in result["summary"] if r["ranking"] == "board")
+        adp   = next(r for r in result["summary"] if r["ranking"] == "adp")
+        print(f"  ✓ {season} {config['name']:12} board ρ={board['spearman']:.3f}  adp ρ={adp['spearman']:.3f}  "
+              f"points {board['points']:.0f} vs {adp['points']:.0f}")
+
+    if workers == 1 or len(jobs) == 1:
+        for season, config in jobs:
+            result = evaluate(season, config, archive_dir)
+            report(season, config, result)
+            results.append(result)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(evaluate, season, config, archive_dir): (season, config)
+                       for season, config in jobs}
+            for future in as_completed(futures):
+                season, config = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"  ⚠ {season} {config['name']}: {e}")
+                    continue
+                report(season, config, result)
+                results.append(result)
+
+    summary = pd.DataFrame([r for res in results for r in res["summary"]])
+    rounds  = pd.DataFrame([r for res in results for r in res["rounds"]])
+    if not summary.empty:
+        summary = summary.sort_values(["config", "season", "ranking"]).reset_index(drop=True)
+        rounds  = rounds.sort_values(["config", "season", "ranking", "round"]).reset_index(drop=True)
+    return summary, rounds
@@ -0,0 +1,169 @@
+"""
+Rotisserie / H2H-categories valuation: standings gain points (SGP) and z-scores.
+
+Each category is a counting stat (R, HR, SV, ...) or a rate (AVG, ERA, WHIP)
+defined as numerator / denominator columns of the projection table. Rates are
+weighted by playing time: a player's contribution is the change their stats
+make to a team's rate, not the rate itself, so a .300 hitter over 600 AB
+counts for more than one over 150 AB.
+
+    z-score   contribution vs the draftable pool, in pool standard deviations;
+              rate contribution = numerator - pool rate × denominator
+    SGP       contribution in standings points, using SGP_DENOMINATORS (how
+              much of a stat moves a team one place in a typical league);
+              rate contribution = team rate with the player - team rate with
+              an average pool player instead
+
+Hitters and pitchers are valued separately against their own draftable pool
+(teams × roster slots). The pool starts as everyone, is re-picked as the top
+players by total value, and the valuation repeats until the pool stops
+changing (usually 3-5 passes).
+
+The total goes into projected_points, so compute_vorp, the board and the
+exports work unchanged — VORP is then in SGP or z units. Everything is
+players × categories array math.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.scarcity import SLOTS, TEAMS
+from src.scoring import HITTER_POSITIONS, PITCHER_POSITIONS
+
+# side: "hit" or "pitch"; counting categories sum `stat`, rates are sum(num) / sum(den) × scale
+CATEGORIES = {
+    "R":    {"side": "hit",   "stat": ["R"]},
+    "HR":   {"side": "hit",   "stat": ["HR"]},
+    "RBI":  {"side": "hit",   "stat": ["RBI"]},
+    "SB":   {"side": "hit",   "stat": ["SB"]},
+    "H":    {"side": "hit",   "stat": ["H"]},
+    "BB":   {"side": "hit",   "stat": ["BB"]},
+    "SO":   {"side": "hit",   "stat": ["K"], "lower": True},
+    "AVG":  {"side": "hit",   "num": ["H"], "den": ["AB"]},
+    "OBP":  {"side": "hit",   "num": ["H", "BB"], "den": ["AB", "BB"]},
+    "W":    {"side": "pitch", "stat": ["W"]},
+    "SV":   {"side": "pitch", "stat": ["SV"]},
+    "HLD":  {"side": "pitch", "stat": ["HLD"]},
+    "SVH":  {"side": "pitch", "stat": ["SV", "HLD"]},
+    "QS":   {"side": "pitch", "stat": ["QS"]},
+    "K":    {"side": "pitch", "stat": ["K_pitch"]},
+    "ERA":  {"side": "pitch", "num": ["ER"], "den": ["IP"], "scale": 9, "lower": True},
+    "WHIP": {"side": "pitch", "num": ["H_allowed", "BB_issued"], "den": ["IP"], "lower": True},
+}
+
+DEFAULT_CATEGORIES = ["R", "HR", "RBI", "SB", "AVG", "W", "SV", "K", "ERA", "WHIP"]
+
+# stat per standings point in a 12-team league
+SGP_DENOMINATORS = {
+    "R": 24.0, "HR": 9.0, "RBI": 24.0, "SB": 8.0, "H": 30.0, "BB": 20.0, "SO": 30.0,
+    "AVG": 0.0020, "OBP": 0.0025,
+    "W": 3.0, "SV": 7.0, "HLD": 7.0, "SVH": 10.0, "QS": 3.5, "K": 35.0,
+    "ERA": 0.08, "WHIP": 0.015,
+}
+
+METHODS  = ("sgp", "z")
+MAX_ITER = 20
+
+HITTER_SLOTS  = sum(n for pos, n in SLOTS.items() if pos in HITTER_POSITIONS)
+PITCHER_SLOTS = sum(n for pos, n in SLOTS.items() if pos not in HITTER_POSITIONS)
+
+
+def _columns(spec: dict) -> list:
+    return spec.get("stat", []) + spec.get("num", []) + spec.get("den", [])
+
+
+def usable_categories(df: pd.DataFrame, categories: list) -> list:
+    """`categories` minus any whose columns the table lacks (with a warning)."""
+    usable = []
+    for cat in categories:
+        if cat not in CATEGORIES:
+            raise ValueError(f"unknown category {cat!r} (known: {', '.join(CATEGORIES)})")
+        missing = [c for c in _columns(CATEGORIES[cat]) if c not in df.columns]
+        if missing:
+            print(f"⚠ Skipping {cat}: projections have no {', '.join(missing)} "
+                  f"(re-run scripts/combine_projections.py)")
+        else:
+            usable.append(cat)
+    return usable
+
+
+def _stat_arrays(df: pd.DataFrame, categories: list) -> tuple:
+    """(num, den) players × categories; counting stats have den = 0."""
+    num = np.zeros((len(df), len(categories)))
+    den = np.zeros((len(df), len(categories)))
+    for j, cat in enumerate(categories):
+        spec = CATEGORIES[cat]
+        for col in spec.get("stat", []) + spec.get("num", []):
+            num[:, j] += df[col].to_numpy(dtype="float64")
+        for col in spec.get("den", []):
+            den[:, j] += df[col].to_numpy(dtype="float64")
+        num[:, j] *= spec.get("scale", 1)
+    return num, den
+
+
+def _side_values(num: np.ndarray, den: np.ndarray, categories: list, spots: int, per_team: int,
+                 method: str, denominators: dict) -> tuple:
+    """(values players × categories, iterations) for one side, iterating the draftable pool."""
+    is_rate = np.array(["den" in CATEGORIES[c] for c in categories])
+    sign = np.array([-1.0 if CATEGORIES[c].get("lower") else 1.0 for c in categories])
+    sgp = np.array([denominators[c] for c in categories], dtype="float64")
+    n = len(num)
+    pool = np.ones(n, dtype=bool)
+    spots = min(spots, n)
+
+    for iteration in range(1, MAX_ITER + 1):
+        pool_num, pool_den = num[pool].sum(axis=0), den[pool].sum(axis=0)
+        rate = np.divide(pool_num, pool_den, out=np.zeros_like(pool_num), where=pool_den > 0)
+
+        if method == "z":
+            # rates: numerator above what the pool's rate would give over the same playing time
+            contrib = np.where(is_rate, num - rate * den, num) * sign
+            mean = contrib[pool].mean(axis=0)
+            std = contrib[pool].std(axis=0)
+            values = np.divide(contrib - mean, std, out=np.zeros_like(contrib), where=std > 0)
+        else:
+            # rates: team rate with this player vs with an average pool player, rest of roster average
+            k = pool.sum()
+            rest_num = (per_team - 1) * pool_num / k
+            rest_den = (per_team - 1) * pool_den / k
+            team = np.divide(num + rest_num, den + rest_den,
+                             out=np.zeros_like(num), where=(den + rest_den) > 0)
+            values = np.where(is_rate, (team - rate) * sign, num * sign) / sgp
+
+        total = values.sum(axis=1)
+        new_pool = np.zeros(n, dtype=bool)
+        new_pool[np.argpartition(-total, spots - 1)[:spots] if spots < n else slice(None)] = True
+        if (new_pool == pool).all():
+            break
+        pool = new_pool
+    return values, iteration
+
+
+def category_values(df: pd.DataFrame, categories: list = DEFAULT_CATEGORIES, method: str = "sgp",
+                    teams: int = TEAMS, denominators: dict = SGP_DENOMINATORS) -> pd.DataFrame:
+    """
+    Per-category values (columns "<METHOD>_<cat>") and their sum in
+    Category_Value, indexed like df. Players outside both sides get 0.
+    """
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {METHODS}")
+    categories = usable_categories(df, categories)
+    position = df["Position"].astype(str)
+    prefix = method.upper()
+    out = pd.DataFrame(0.0, index=df.index, columns=[f"{prefix}_{c}" for c in categories])
+
+    sides = {
+        "hit":   (position.isin(HITTER_POSITIONS).to_numpy(), HITTER_SLOTS),
+        "pitch": (position.isin(PITCHER_POSITIONS).to_numpy(), PITCHER_SLOTS),
+    }
+    for side, (rows, per_team) in sides.items():
+        cats = [c for c in categories if CATEGORIES[c]["side"] == side]
+        if not cats or not rows.any():
+            continue
+        num, den = _stat_arrays(df[rows], cats)
+        values, iterations = _side_values(num, den, cats, teams * per_team, per_team, method, denominators)
+        out.loc[rows, [f"{prefix}_{c}" for c in cats]] = values
+        print(f"  {side:5} {method.upper()} over {', '.join(cats)}: pool settled in {iterations} passes")
+
+    out["Category_Value"] = out.sum(axis=1)
+    return out
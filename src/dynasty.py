@@ -0,0 +1,227 @@
+"""
+Dynasty / keeper values: VORP over several seasons, discounted to today.
+
+Points per player and season come from one of two places:
+
+    data/dynasty_projections.parquet   Name, Year, Position, stats — multi-year
+                                       projections (.csv also read); prospects can
+                                       start in a later year
+    age curves                         for seasons a player has no projection
+                                       for, the last known season is carried
+                                       forward with AGE_CURVES (ages from
+                                       data/ages.csv: Name, Age this season)
+
+Season 0 is the current board (projected_points after rules) and is the
+calendar year `season` (main.py --season, default this year); the file's Year
+column is aligned to it, so a file that starts next season fills season 1 on,
+and a file whose first year isn't `season` gets a warning. Later seasons
+come from the file or the curves. Replacement levels come from the same
+scarcity logic as the board (src.scarcity.replacement_matrix) — this season's
+levels for every season unless FIXED_REPLACEMENT is off — and
+
+    Dynasty_VORP = sum over seasons y of DISCOUNT**y * max(VORP_y, 0)
+
+— a player below replacement in a future season can be cut, so that season
+counts as 0 rather than negative.
+
+Keepers (data/keepers.csv: Name plus Round or Salary) get Keeper_Surplus: their
+Dynasty_VORP minus what the pick or salary would buy instead, in the same units.
+
+Everything is players × seasons array arithmetic; there are no per-player loops.
+"""
+
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+
+from src.matching import player_ids
+from src.scarcity import (SLOTS, TEAMS, load_eligibility, position_table, replacement_matrix, starters_for,
+                          vorp_matrix)
+from src.scoring import PITCHER_POSITIONS, calculate_points_frame
+from src.storage import KEY, read_table
+
+DYNASTY_PATH = "data/dynasty_projections.parquet"
+AGES_PATH    = "data/ages.csv"
+KEEPERS_PATH = "data/keepers.csv"
+
+YEARS    = 5
+DISCOUNT = 0.80      # next season is worth 80% of this one
+
+# (up to age, points multiplier for the following season)
+AGE_CURVES = {
+    "hitter": [(23, 1.06), (26, 1.03), (29, 1.00), (32, 0.96), (35, 0.92), (99, 0.85)],
+    "pitcher": [(24, 1.04), (27, 1.02), (30, 1.00), (33, 0.95), (99, 0.88)],
+}
+
+# Hold every season to this season's replacement levels. The projected
+# universe only ages — nobody new enters it — so later seasons' pools thin
+# out and per-season levels would inflate everyone's future VORP.
+FIXED_REPLACEMENT = True
+
+BUDGET = 260         # auction dollars per team, for salary keepers
+
+
+def _curve(ages: np.ndarray, curve: list) -> np.ndarray:
+    bounds = np.array([age for age, _ in curve], dtype="float64")
+    factors = np.array([f for _, f in curve], dtype="float64")
+    return factors[np.minimum(np.searchsorted(bounds, ages, side="left"), len(curve) - 1)]
+
+
+def age_multipliers(ages: np.ndarray, pitcher: np.ndarray, years: int = YEARS) -> np.ndarray:
+    """
+    players × years: column y is the player's year-over-year multiplier going
+    into season y (column 0 is 1). Unknown ages (NaN) stay flat.
+    """
+    ages = np.asarray(ages, dtype="float64")
+    steps = ages[:, None] + np.arange(years - 1)[None, :]
+    step = np.where(pitcher[:, None], _curve(steps, AGE_CURVES["pitcher"]), _curve(steps, AGE_CURVES["hitter"]))
+    step[np.isnan(steps)] = 1.0
+    return np.hstack([np.ones((len(ages), 1)), step])
+
+
+def load_ages(path: str = AGES_PATH) -> pd.Series:
+    """Age this season by Player_ID (empty if there is no ages file)."""
+    try:
+        ages = pd.read_csv(path)
+    except FileNotFoundError:
+        return pd.Series(dtype="float64")
+    return pd.Series(ages["Age"].to_numpy(dtype="float64"), index=player_ids(ages["Name"]).to_numpy())
+
+
+def load_dynasty_projections(path: str = DYNASTY_PATH) -> pd.DataFrame | None:
+    """Multi-year projections with points per row, or None if the file doesn't exist."""
+    try:
+        df = read_table(path)
+    except FileNotFoundError:
+        return None
+    df = df.copy()
+    df["Year"] = df["Year"].astype(int)
+    df["points"] = calculate_points_frame(df).round(1)
+    return df
+
+
+def points_by_year(current: pd.DataFrame, future: pd.DataFrame | None, ages: pd.Series,
+                   years: int = YEARS, season: int | None = None) -> tuple:
+    """
+    (players, points): one row per player — the current board plus prospects
+    that only appear in `future` — and a players × years points matrix, NaN
+    for seasons before a prospect's first projection. Column y is the year
+    season + y (season defaults to this calendar year).
+    """
+    season = season or dt.date.today().year
+    players = current[["Name", "Position"]].copy()
+    players["Position"] = players["Position"].astype(str)
+    players[KEY] = player_ids(players["Name"]).to_numpy()
+    points = np.full((len(players), years), np.nan)
+    points[:, 0] = current["projected_points"].to_numpy(dtype="float64")
+
+    if future is not None and not future.empty:
+        first = future["Year"].min()
+        if first != season:
+            print(f"⚠ Multi-year projections start in {first}, not {season} — aligning by Year"
+                  + (f" (dropping {first}–{season - 1})" if first < season else ""))
+        future = future[(future["Year"] >= season) & (future["Year"] < season + years)]
+        ids = future[KEY] if KEY in future.columns else player_ids(future["Name"])
+        future = future.assign(**{KEY: ids.to_numpy()})
+
+        # prospects: in the multi-year file but not on this season's board
+        new = future[~future[KEY].isin(players[KEY])].drop_duplicates(KEY)
+        if len(new):
+            prospects = new[["Name", "Position", KEY]].assign(Position=new["Position"].astype(str))
+            players = pd.concat([players, prospects], ignore_index=True)
+            points = np.vstack([points, np.full((len(new), years), np.nan)])
+
+        wide = future.pivot_table(index=KEY, columns="Year", values="points", aggfunc="first")
+        wide = wide.reindex(index=players[KEY].to_numpy(), columns=range(season, season + years))
+        known = wide.to_numpy(dtype="float64", copy=True)
+        # the current board stays authoritative for season 0 (rules applied there)
+        known[:len(current), 0] = np.nan
+        points = np.where(np.isnan(known), points, known)
+
+    # carry the last known season forward along the age curve; seasons before
+    # a player's first projection score 0
+    pitcher = players["Position"].isin(PITCHER_POSITIONS).to_numpy()
+    curve = age_multipliers(players[KEY].map(ages).to_numpy(dtype="float64"), pitcher, years)
+    for y in range(1, years):
+        carried = points[:, y - 1] * curve[:, y]
+        points[:, y] = np.where(np.isnan(points[:, y]), carried, points[:, y])
+    return players, points
+
+
+def discounted_vorp(vorp: np.ndarray, discount: float = DISCOUNT) -> np.ndarray:
+    weights = discount ** np.arange(vorp.shape[1])
+    return np.clip(vorp, 0, None) @ weights
+
+
+def keeper_surplus(board: pd.DataFrame, keepers: pd.DataFrame, teams: int = TEAMS,
+                   budget: int = BUDGET, roster: int = sum(SLOTS.values())) -> pd.Series:
+    """
+    Dynasty_VORP minus the cost of keeping, per board row (NaN for non-keepers).
+    Round keepers cost the Dynasty_VORP of the player going mid-round at that
+    pick; salary keepers cost salary converted to VORP at the league's $/VORP
+    (budget beyond $1 per roster spot, spread over the rostered players' value).
+    """
+    value = board["Dynasty_VORP"].to_numpy()
+    ids = player_ids(keepers["Name"]).to_numpy()
+    row = pd.Series(np.arange(len(board)), index=player_ids(board["Name"]).to_numpy())
+    row = row[~row.index.duplicated()]
+    keepers = keepers.assign(row=row.reindex(ids).to_numpy())
+    keepers = keepers[keepers["row"].notna()]
+    cost = pd.Series(np.nan, index=keepers.index)
+
+    if "Round" in keepers.columns:
+        by_round = keepers["Round"].notna()
+        picks = ((keepers.loc[by_round, "Round"].astype(int) - 1) * teams + teams // 2).clip(upper=len(value) - 1)
+        cost[by_round] = np.sort(value)[::-1][picks.to_numpy()]
+    if "Salary" in keepers.columns:
+        by_salary = keepers["Salary"].notna() & cost.isna()
+        rostered = np.sort(value)[::-1][:teams * roster].clip(min=0).sum()
+        per_dollar = rostered / max(teams * (budget - roster), 1)
+        cost[by_salary] = (keepers.loc[by_salary, "Salary"].astype(float) - 1).clip(lower=0) * per_dollar
+
+    surplus = np.full(len(board), np.nan)
+    surplus[keepers["row"].astype(int).to_numpy()] = (value[keepers["row"].astype(int)] - cost.to_numpy()).round(1)
+    return pd.Series(surplus, index=board.index)
+
+
+def build_dynasty_board(current: pd.DataFrame, years: int = YEARS, discount: float = DISCOUNT,
+                        dynasty_path: str = DYNASTY_PATH, ages_path: str = AGES_PATH,
+                        keepers_path: str = KEEPERS_PATH,
+                        eligibility_path: str = "data/espn_eligibility.csv",
+                        teams: int = TEAMS, fixed_replacement: bool = FIXED_REPLACEMENT,
+                        season: int | None = None) -> pd.DataFrame:
+    """
+    Dynasty board from the scored current-season table (needs projected_points);
+    `season` is that table's year (default this calendar year).
+    """
+    future = load_dynasty_projections(dynasty_path)
+    ages = load_ages(ages_path)
+    if future is None and ages.empty:
+        print(f"⚠ No {dynasty_path} or {ages_path} — future seasons repeat this one")
+    players, points = points_by_year(current.reset_index(drop=True), future, ages, years, season)
+
+    projected = ~np.isnan(points)
+    points = np.nan_to_num(points, nan=0.0)
+    positions = position_table(players, load_eligibility(eligibility_path))
+    levels = replacement_matrix(points, positions, starters_for(teams))
+    if fixed_replacement:
+        levels = {pos: np.full(years, level[0]) for pos, level in levels.items()}
+    vorp = np.where(projected, vorp_matrix(points, positions, levels), 0.0)
+
+    board = players.drop(columns=KEY)
+    board["Age"] = players[KEY].map(ages).to_numpy()
+    for y in range(years):
+        board[f"VORP_Y{y + 1}"] = vorp[:, y].round(1)
+    board["Dynasty_VORP"] = discounted_vorp(vorp, discount).round(1)
+    board = board.sort_values("Dynasty_VORP", ascending=False, kind="stable").reset_index(drop=True)
+    board.insert(0, "Dynasty_Rank", np.arange(1, len(board) + 1))
+
+    try:
+        keepers = pd.read_csv(keepers_path)
+        board["Keeper_Surplus"] = keeper_surplus(board, keepers, teams)
+        print(f"✓ Keeper surplus for {board['Keeper_Surplus'].notna().sum()} of {len(keepers)} keepers")
+    except FileNotFoundError:
+        pass
+    print(f"✓ Dynasty board: {len(board)} players × {years} seasons (discount {discount})")
+    return board
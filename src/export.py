@@ -1,12 +1,26 @@
 import pandas as pd
 import os
 
+from src.snapshot import write_snapshot
+from src.storage import write_table
+
 
 def export_csv(df: pd.DataFrame, path: str = "output/draft_board.csv") -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
     df.to_csv(path, index=False)
 
 
+def export_parquet(df: pd.DataFrame, path: str = "output/draft_board.parquet") -> None:
+    """Typed board snapshot (see src/storage.py), for tools that read the board without rebuilding it."""
+    write_table(df, path)
+
+
+def export_snapshot(df: pd.DataFrame, path: str = "output/draft_board.snap") -> None:
+    """Memory-mappable board for board.py (see src/snapshot.py)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    write_snapshot(df.to_dict("list"), path, meta={"built": pd.Timestamp.now().isoformat(timespec="seconds")})
+
+
 def export_html(df: pd.DataFrame, path: str = "output/draft_board.html") -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
 
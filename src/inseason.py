@@ -0,0 +1,210 @@
+"""
+In-season rest-of-season (ROS) projections: preseason projections blended
+with season-to-date actuals, updated one day of stat lines at a time.
+
+Daily stat lines live in data/daily/<YYYY-MM-DD>.csv (or .parquet): Name plus
+any projection stat columns, with PA for hitters (AB + BB is used without it)
+and IP for pitchers. Each stat is treated as a rate per opportunity (PA for
+hitters, IP for pitchers) and blended as a beta-binomial style posterior mean:
+
+    rate = (preseason rate × S + actual) / (S + actual opportunities)
+
+where S is the stat's stabilization point (STABILIZATION) — the sample size at
+which actuals and the prior weigh the same. Strikeouts settle in a couple of
+weeks; batting average on balls in play takes years. Each stat counts only
+the opportunities of the lines that reported it, so a stat a file leaves out
+(or leaves blank) keeps its preseason rate instead of blending in zeros.
+
+    ROS stat   = rate × playing time left (projected PA / IP minus what's used)
+    ROS points = calculate_points_frame of the ROS stats
+
+Injuries and role changes belong in data/rules.csv (playing_time) as before,
+since the projections come in after the rules.
+
+A day touches only the players in that day's file: their season-to-date totals,
+blended rates and ROS points are recomputed, then replacement levels and VORP
+are refreshed with the same array code as the draft board. A whole day for the
+league universe is a few milliseconds.
+"""
+
+import glob
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.matching import player_ids
+from src.scarcity import STARTERS, load_eligibility, position_table, replacement_matrix, vorp_matrix
+from src.scoring import PITCHER_POSITIONS, calculate_points_frame
+from src.storage import KEY, read_table, write_table
+
+DAILY_DIR  = "data/daily"
+STATE_PATH = "output/inseason_ytd.parquet"
+
+HITTER_STATS  = ["H", "2B", "3B", "HR", "R", "RBI", "BB", "K", "SB", "CYC", "GSHR"]
+PITCHER_STATS = ["ER", "K_pitch", "H_allowed", "BB_issued", "QS", "W", "SV", "HLD", "GS", "CG", "NH", "PG"]
+
+# Stabilization points: PA for hitter stats, IP for pitcher stats (BF / 4.3).
+# inf keeps the preseason rate (rare events).
+STABILIZATION = {
+    "H": 910, "2B": 1600, "3B": 1600, "HR": 170, "R": 600, "RBI": 600,
+    "BB": 120, "K": 60, "SB": 200, "CYC": np.inf, "GSHR": np.inf,
+    "ER": 150, "K_pitch": 16, "H_allowed": 470, "BB_issued": 40, "QS": 60,
+    "W": 150, "SV": 50, "HLD": 50, "GS": 30, "CG": np.inf, "NH": np.inf, "PG": np.inf,
+}
+
+LEAGUE_AVG = 0.245   # AB ≈ H / LEAGUE_AVG when a table has neither PA nor AB
+
+
+def opportunity(df: pd.DataFrame, pitcher: np.ndarray) -> np.ndarray:
+    """PA for hitters (PA, else AB + BB, else an estimate from H), IP for pitchers."""
+    def col(name):
+        return df[name].to_numpy(dtype="float64") if name in df.columns else np.zeros(len(df))
+
+    if "PA" in df.columns:
+        pa = col("PA")
+    elif "AB" in df.columns:
+        pa = col("AB") + col("BB")
+    else:
+        pa = col("H") / LEAGUE_AVG + col("BB")
+    return np.nan_to_num(np.where(pitcher, col("IP"), pa))
+
+
+def day_files(directory: str = DAILY_DIR) -> list:
+    """(day, path) for every daily file, oldest first; .parquet wins over a .csv of the same day."""
+    files = {}
+    for path in sorted(glob.glob(os.path.join(directory, "*.csv")) + glob.glob(os.path.join(directory, "*.parquet"))):
+        day = os.path.splitext(os.path.basename(path))[0]
+        if day not in files or path.endswith(".parquet"):
+            files[day] = path
+    return sorted(files.items())
+
+
+def read_day(path: str) -> pd.DataFrame:
+    return pd.read_parquet(path) if path.endswith(".parquet") else pd.read_csv(path)
+
+
+class InSeasonState:
+    """Season-to-date totals and ROS projections for every player on the board."""
+
+    def __init__(self, players: pd.DataFrame, eligibility_path: str = "data/espn_eligibility.csv",
+                 starters: dict = STARTERS):
+        self.players   = players.reset_index(drop=True)
+        self.starters  = starters
+        self.pitcher   = self.players["Position"].astype(str).isin(PITCHER_POSITIONS).to_numpy()
+        self.stats     = [s for s in HITTER_STATS + PITCHER_STATS if s in self.players.columns]
+        ids            = player_ids(self.players["Name"]).to_numpy()
+        self.ids       = ids
+        self.row       = pd.Series(np.arange(len(ids)), index=ids)
+        self.row       = self.row[~self.row.index.duplicated()]
+
+        self.proj_opp  = opportunity(self.players, self.pitcher)
+        proj           = self.players[self.stats].to_numpy(dtype="float64")
+        self.prior     = np.divide(proj, self.proj_opp[:, None], out=np.zeros_like(proj),
+                                   where=self.proj_opp[:, None] > 0)
+        stab           = np.array([STABILIZATION.get(s, np.inf) for s in self.stats], dtype="float64")
+        self.fixed     = np.isinf(stab)             # prior rate only
+        self.stab      = np.where(self.fixed, 0.0, stab)
+        self.ytd       = np.zeros_like(proj)
+        self.ytd_opp   = np.zeros(len(self.players))
+        self.stat_opp  = np.zeros_like(proj)        # opportunities behind each stat's ytd
+        self.days      = []
+
+        self.positions = position_table(self.players, load_eligibility(eligibility_path))
+        self.preseason = calculate_points_frame(self.players).to_numpy(dtype="float64")
+        self.ros       = np.zeros_like(proj)
+        self.ros_points = np.zeros(len(self.players))
+        self.ytd_points = np.zeros(len(self.players))
+        self._refresh(np.arange(len(self.players)))
+
+    def _points(self, stats: np.ndarray, opp: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        frame = pd.DataFrame(stats, columns=self.stats)
+        frame["Position"] = self.players["Position"].astype(str).to_numpy()[rows]
+        frame["IP"] = np.where(self.pitcher[rows], opp, 0.0)
+        return calculate_points_frame(frame).to_numpy(dtype="float64")
+
+    def _refresh(self, rows: np.ndarray) -> None:
+        """Blend, ROS stats and points for `rows`; replacement levels and VORP for everyone."""
+        ytd, ytd_opp = self.ytd[rows], self.ytd_opp[rows]
+        prior = self.prior[rows]
+        weight = self.stab + self.stat_opp[rows]
+        posterior = np.divide(prior * self.stab + ytd, weight, out=prior.copy(), where=weight > 0)
+        blended = np.where(self.fixed, prior, posterior)
+        left = np.clip(self.proj_opp[rows] - ytd_opp, 0, None)
+        self.ros[rows] = blended * left[:, None]
+        self.ros_points[rows] = self._points(self.ros[rows], left, rows)
+        self.ytd_points[rows] = self._points(ytd, ytd_opp, rows)
+
+        levels = replacement_matrix(self.ros_points[:, None], self.positions, self.starters)
+        self.vorp = vorp_matrix(self.ros_points[:, None], self.positions, levels)[:, 0]
+
+    def update(self, day: pd.DataFrame, label: str | None = None) -> dict:
+        """Add one day of stat lines; only players in it are re-blended."""
+        start = time.perf_counter()
+        rows = self.row.reindex(player_ids(day["Name"]).to_numpy()).to_numpy()
+        known = ~np.isnan(rows)
+        rows = rows[known].astype(int)
+        day = day[known]
+
+        values = day.reindex(columns=self.stats).to_numpy(dtype="float64")
+        opp = opportunity(day, self.pitcher[rows])
+        np.add.at(self.ytd, rows, np.nan_to_num(values))
+        np.add.at(self.ytd_opp, rows, opp)
+        np.add.at(self.stat_opp, rows, np.where(np.isnan(values), 0.0, opp[:, None]))
+        changed = np.unique(rows)
+        self._refresh(changed)
+        if label is not None:
+            self.days.append(label)
+        return {
+            "changed": len(changed),
+            "unknown": int((~known).sum()),
+            "ms":      (time.perf_counter() - start) * 1000,
+        }
+
+    def save(self, path: str = STATE_PATH) -> None:
+        """Season-to-date totals (with the processed days in a Days column) as Parquet."""
+        played = np.flatnonzero(self.ytd_opp > 0)
+        state = pd.DataFrame(self.ytd[played], columns=self.stats)
+        state.insert(0, KEY, self.ids[played])
+        state["Opportunities"] = self.ytd_opp[played]
+        for j, stat in enumerate(self.stats):
+            state[f"Opp_{stat}"] = self.stat_opp[played, j]
+        state["Days"] = ",".join(self.days)
+        write_table(state, path, key=False)
+
+    def load(self, path: str = STATE_PATH) -> None:
+        """Restore totals saved by save(); players no longer on the board are dropped."""
+        try:
+            state = read_table(path)
+        except FileNotFoundError:
+            return
+        if state.empty:
+            return
+        rows = self.row.reindex(state[KEY].to_numpy()).to_numpy()
+        known = ~np.isnan(rows)
+        rows = rows[known].astype(int)
+        stats = [s for s in self.stats if s in state.columns]
+        cols = [self.stats.index(s) for s in stats]
+        self.ytd[np.ix_(rows, cols)] = state.loc[known, stats].to_numpy(dtype="float64")
+        self.ytd_opp[rows] = state.loc[known, "Opportunities"].to_numpy(dtype="float64")
+        # states saved before per-stat opportunities: every stat saw every opportunity
+        self.stat_opp[np.ix_(rows, cols)] = self.ytd_opp[rows, None]
+        opp_stats = [s for s in stats if f"Opp_{s}" in state.columns]
+        opp_cols = [self.stats.index(s) for s in opp_stats]
+        self.stat_opp[np.ix_(rows, opp_cols)] = state.loc[known, [f"Opp_{s}" for s in opp_stats]].to_numpy(dtype="float64")
+        days = str(state["Days"].iloc[0])
+        self.days = days.split(",") if days else []
+        self._refresh(np.arange(len(self.players)))
+
+    def table(self) -> pd.DataFrame:
+        """ROS board: preseason, season-to-date, rest-of-season and VORP, best first."""
+        out = self.players[["Name", "Position"]].copy()
+        out["Preseason_Points"] = self.preseason.round(1)
+        out["YTD_Points"]       = self.ytd_points.round(1)
+        out["ROS_Points"]       = self.ros_points.round(1)
+        out["Season_Points"]    = (self.ytd_points + self.ros_points).round(1)
+        out["ROS_VORP"]         = self.vorp.round(1)
+        out = out.sort_values(["ROS_VORP", "ROS_Points"], ascending=False, kind="stable").reset_index(drop=True)
+        out.insert(0, "ROS_Rank", np.arange(1, len(out) + 1))
+        return out
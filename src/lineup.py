@@ -0,0 +1,142 @@
+"""
+Daily lineup optimizer: the starting lineup that maximizes projected points.
+
+Slots follow src.scarcity.SLOTS (C, 1B, 2B, 3B, SS, OF×4, DH, SP×5, RP×2).
+A player can fill a slot if it's one of their positions (listed Position plus
+load_eligibility); any hitter can fill DH. Each day is an assignment problem:
+
+    maximize   Σ points[player] over (slot, player) pairs in the lineup
+    subject to each slot gets at most one player and each player one slot
+
+solved exactly — scipy.optimize.linear_sum_assignment when scipy is installed,
+otherwise the Hungarian algorithm below (same answers, a little slower). A
+slot nobody eligible is playing in stays empty.
+
+optimize_days solves many days in one call. Days with the same projected
+points for everyone (the same players off, the same matchups) share one
+solve, so a full season is a few hundred small solves.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.scarcity import SLOTS, position_table
+from src.scoring import HITTER_POSITIONS
+
+try:
+    from scipy.optimize import linear_sum_assignment
+except ImportError:            # optional: the pure-numpy Hungarian below is used instead
+    linear_sum_assignment = None
+
+DAILY_PROJECTIONS_PATH = "data/daily_projections.csv"
+
+LINEUP_SLOTS = [pos for pos, n in SLOTS.items() for _ in range(n)]
+
+
+def eligibility_matrix(players: pd.DataFrame, eligibility: dict, slots: list = LINEUP_SLOTS) -> np.ndarray:
+    """players × slots: True where the player can fill the slot."""
+    positions = position_table(players.reset_index(drop=True), eligibility)
+    eligible = np.zeros((len(players), len(slots)), dtype=bool)
+    for j, slot in enumerate(slots):
+        eligible[positions.loc[positions["pos"] == slot, "row"].to_numpy(), j] = True
+        if slot == "DH":
+            eligible[players["Position"].astype(str).isin(HITTER_POSITIONS).to_numpy(), j] = True
+    return eligible
+
+
+def _hungarian(cost: np.ndarray) -> np.ndarray:
+    """
+    Minimum-cost assignment for n rows ≤ m columns (shortest augmenting
+    paths with potentials, O(n² m)); returns the column for each row.
+    """
+    n, m = cost.shape
+    u, v = np.zeros(n + 1), np.zeros(m + 1)
+    match = np.zeros(m + 1, dtype=int)         # match[j]: 1-based row on column j, 0 if free
+    way = np.zeros(m + 1, dtype=int)
+    for i in range(1, n + 1):
+        match[0] = i
+        j0 = 0
+        minv = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = match[j0]
+            reduced = cost[i0 - 1] - u[i0] - v[1:]
+            free = ~used[1:]
+            better = free & (reduced < minv[1:])
+            minv[1:][better] = reduced[better]
+            way[1:][better] = j0
+            candidates = np.where(free, minv[1:], np.inf)
+            j1 = int(np.argmin(candidates)) + 1
+            delta = candidates[j1 - 1]
+            u[match[used]] += delta
+            v[used] -= delta
+            minv[1:][free] -= delta
+            j0 = j1
+            if match[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            match[j0] = match[j1]
+            j0 = j1
+    cols = np.full(n, -1)
+    assigned = np.flatnonzero(match[1:])
+    cols[match[1:][assigned] - 1] = assigned
+    return cols
+
+
+def solve_day(values: np.ndarray) -> np.ndarray:
+    """
+    values: players × slots points (0 where ineligible). Returns the player
+    row for each slot, -1 for a slot left empty.
+    """
+    n_players, n_slots = values.shape
+    if n_players < n_slots:         # pad with empty "players" so every slot can be assigned
+        values = np.vstack([values, np.zeros((n_slots - n_players, n_slots))])
+    cost = -values.T                # slots × players
+    if linear_sum_assignment is not None:
+        slot_rows, players = linear_sum_assignment(cost)
+        lineup = np.full(n_slots, -1)
+        lineup[slot_rows] = players
+    else:
+        lineup = _hungarian(cost)
+    lineup[(lineup >= n_players) | (values[np.clip(lineup, 0, None), np.arange(n_slots)] <= 0)] = -1
+    return lineup
+
+
+def optimize_days(points: np.ndarray, eligible: np.ndarray) -> tuple:
+    """
+    points: days × players projected points. Returns (lineups days × slots
+    of player rows, -1 for empty; totals per day). Identical days are solved once.
+    """
+    points = np.asarray(points, dtype="float64")
+    unique, inverse = np.unique(points, axis=0, return_inverse=True)
+    solved = np.stack([solve_day(day[:, None] * eligible) for day in unique]) if len(unique) else \
+        np.empty((0, eligible.shape[1]), dtype=int)
+    lineups = solved[inverse.reshape(-1)]
+    filled = np.where(lineups >= 0, np.take_along_axis(points, np.clip(lineups, 0, None), axis=1), 0.0)
+    return lineups, filled.sum(axis=1)
+
+
+def load_daily_points(path: str, names: pd.Series) -> tuple:
+    """
+    (dates, days × players points) from a Date, Name, Points file, with
+    players in the order of `names`; anyone missing on a day scores 0.
+    """
+    daily = pd.read_csv(path)
+    wide = daily.pivot_table(index="Date", columns="Name", values="Points", aggfunc="sum")
+    wide = wide.reindex(columns=names.to_numpy()).fillna(0.0)
+    return wide.index.to_numpy(), wide.to_numpy(dtype="float64")
+
+
+def lineup_table(dates: np.ndarray, lineups: np.ndarray, points: np.ndarray, names: pd.Series,
+                 slots: list = LINEUP_SLOTS) -> pd.DataFrame:
+    """Long table: Date, Slot, Name, Points (one row per filled slot)."""
+    days, slot_idx = np.nonzero(lineups >= 0)
+    rows = lineups[days, slot_idx]
+    return pd.DataFrame({
+        "Date":   dates[days],
+        "Slot":   np.asarray(slots)[slot_idx],
+        "Name":   names.to_numpy()[rows],
+        "Points": points[days, rows].round(1),
+    })
@@ -0,0 +1,127 @@
+import re
+import unicodedata
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from rapidfuzz import fuzz, process
+
+FUZZY_THRESHOLD = 88
+
+_SUFFIXES = {"jr", "sr", "ii", "iii", "iv"}
+_PUNCT    = re.compile(r"[^a-z ]+")
+
+
+@lru_cache(maxsize=65536)
+def normalize_name(name) -> str:
+    """
+    Canonical form used for matching: accents stripped, lowercase, no
+    punctuation.  "Ronald Acuña Jr." -> "ronald acuna jr"
+    Suffixes are kept — "Luis Garcia" and "Luis Garcia Jr." are different players.
+    """
+    name = unicodedata.normalize("NFKD", str(name)).encode("ascii", "ignore").decode()
+    name = _PUNCT.sub("", name.lower().replace("-", " "))
+    return " ".join(name.split())
+
+
+def normalize_names(names) -> pd.Series:
+    """normalize_name over a column (cached, so repeat names are free)."""
+    names = pd.Series(names).astype(str)
+    values = names.to_numpy(dtype=object)
+    return pd.Series([normalize_name(n) for n in values], index=names.index, dtype=object)
+
+
+def _block_key(norm: str) -> str:
+    # First letter of the last name — cheap, and typos rarely land there
+    tokens = [t for t in norm.split() if t not in _SUFFIXES] or [""]
+    return tokens[-1][:1]
+
+
+def _block_keys(norm: pd.Series) -> pd.Series:
+    return norm.map(_block_key)
+
+
+def match_names(left_names, right_names, threshold: int = FUZZY_THRESHOLD) -> pd.DataFrame:
+    """
+    One-to-one name matching between two lists.
+
+    1. Exact matches on the normalized name are taken first (hash join).
+       Duplicate normalized names pair up in order of appearance.
+    2. Leftovers are blocked on the last-name initial and scored in bulk
+       with rapidfuzz cdist (WRatio, the thefuzz extractOne default).
+    3. Within each block, pairs >= threshold are assigned greedily by
+       descending score, then left index, then right index — so every right
+       row is claimed at most once and results are deterministic.
+
+    Returns DataFrame[left, right, score] of positional indices.
+    """
+    left  = pd.DataFrame({"norm": normalize_names(left_names).to_numpy()})
+    right = pd.DataFrame({"norm": normalize_names(right_names).to_numpy()})
+    left["left"]   = np.arange(len(left))
+    right["right"] = np.arange(len(right))
+    left["dup"]    = left.groupby("norm").cumcount()
+    right["dup"]   = right.groupby("norm").cumcount()
+
+    exact = left.merge(right, on=["norm", "dup"])[["left", "right"]]
+    exact["score"] = 100.0
+
+    rest_l = left[~left["left"].isin(exact["left"])]
+    rest_r = right[~right["right"].isin(exact["right"])]
+    rest_l = rest_l.assign(block=_block_keys(rest_l["norm"]))
+    rest_r = rest_r.assign(block=_block_keys(rest_r["norm"]))
+
+    pairs = [exact]
+    right_groups = {k: g for k, g in rest_r.groupby("block", sort=False)}
+    for key, lg in rest_l.groupby("block", sort=True):
+        rg = right_groups.get(key)
+        if rg is None:
+            continue
+        scores = process.cdist(
+            lg["norm"].tolist(), rg["norm"].tolist(),
+            scorer=fuzz.WRatio, score_cutoff=threshold, dtype=np.float32, workers=-1,
+        )
+        li, ri = np.nonzero(scores >= threshold)
+        if len(li) == 0:
+            continue
+        cand = pd.DataFrame({
+            "left":  lg["left"].to_numpy()[li],
+            "right": rg["right"].to_numpy()[ri],
+            "score": scores[li, ri].astype(float),
+        }).sort_values(["score", "left", "right"], ascending=[False, True, True])
+
+        used_l, used_r, keep = set(), set(), []
+        for l, r in zip(cand["left"].to_numpy(), cand["right"].to_numpy()):
+            keep.append(l not in used_l and r not in used_r)
+            if keep[-1]:
+                used_l.add(l)
+                used_r.add(r)
+        pairs.append(cand[keep])
+
+    out = pd.concat(pairs, ignore_index=True)
+    return out.sort_values("left").reset_index(drop=True)
+
+
+def fuzzy_merge(df_left: pd.DataFrame, df_right: pd.DataFrame, left_on: str, right_on: str,
+                threshold: int = FUZZY_THRESHOLD) -> pd.DataFrame:
+    """
+    Left join df_right onto df_left using match_names.  Left rows keep their
+    own key; matched rows get the right-hand columns plus match_score.
+    """
+    pairs = match_names(df_left[left_on], df_right[right_on], threshold)
+
+    left = df_left.reset_index(drop=True)
+    right_cols = [c for c in df_right.columns if c != right_on and c not in left.columns]
+    right = df_right.reset_index(drop=True)[right_cols].iloc[pairs["right"].to_numpy()]
+    right.index = pairs["left"].to_numpy()
+    right["match_score"] = pairs["score"].to_numpy()
+
+    return left.join(right)
+
+
+def player_ids(names) -> pd.Series:
+    """
+    Stable 64-bit player key from the normalized name, so the same player
+    gets the same ID across sources and runs regardless of accents/punctuation.
+    """
+    norm = normalize_names(names)
+    return pd.Series(pd.util.hash_array(norm.to_numpy(dtype=object)), index=norm.index, name="Player_ID")
@@ -0,0 +1,246 @@
+"""
+Content-hashed stage runner for the draft-board pipeline.
+
+Each stage declares the files it reads (data and the code that processes
+it), the stages it depends on, and the files it writes. Its cache key is a
+hash of those input files' contents, the upstream stages' keys and any
+params. When the key matches the last successful run, the stage is skipped:
+its returned DataFrame is loaded from the cache (Parquet, dtypes preserved;
+other results are pickled) and its output files are restored if they are
+missing or differ.
+
+    pipe = Pipeline()
+    pipe.add("score", score, inputs=["data/projections.csv", "src/scoring.py"])
+    pipe.add("vorp",  vorp,  deps=["score"], inputs=["data/espn_eligibility.csv", "src/scarcity.py"])
+    results = pipe.run()
+
+A stage function receives its deps' results as positional arguments; stages
+added with result=False (ones that only write files) pass None on. Stages
+added with cache=False (network fetches) always run and don't feed their key
+downstream — whatever they change is picked up through downstream input files.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import time
+
+import pandas as pd
+
+from src.profiling import span
+
+CACHE_DIR = ".cache/pipeline"
+
+_CHUNK = 1 << 20
+
+
+def file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def expand_inputs(patterns: list) -> list:
+    """Paths and glob patterns -> sorted existing files (missing plain paths are kept, and hash as missing)."""
+    paths = set()
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            paths.update(p for p in glob.glob(pattern, recursive=True) if os.path.isfile(p))
+        elif os.path.isdir(pattern):
+            paths.update(p for p in glob.glob(os.path.join(pattern, "**", "*"), recursive=True) if os.path.isfile(p))
+        else:
+            paths.add(pattern)
+    return sorted(paths)
+
+
+def _discard_result(fn):
+    def call(*args):
+        fn(*args)
+    return call
+
+
+class Pipeline:
+    def __init__(self, cache_dir: str = CACHE_DIR, use_cache: bool = True):
+        self.cache_dir = cache_dir
+        self.use_cache = use_cache
+        self.stages    = {}
+        self.timings   = []
+        self._digests  = self._load_digests()
+
+    # --- declaration -----------------------------------------------------------
+
+    def add(self, name: str, fn, inputs: list = (), deps: list = (), outputs: list = (),
+            params: dict | None = None, cache: bool = True, result: bool = True) -> None:
+        missing = [d for d in deps if d not in self.stages]
+        if missing:
+            raise ValueError(f"stage {name!r} depends on undeclared stage(s) {missing}")
+        self.stages[name] = {
+            "fn":      fn,
+            "inputs":  list(inputs),
+            "deps":    list(deps),
+            "outputs": list(outputs),
+            "params":  params or {},
+            "cache":   cache,
+            "result":  result,
+        }
+
+    # --- hashing ---------------------------------------------------------------
+
+    def _digests_path(self) -> str:
+        return os.path.join(self.cache_dir, "file_digests.json")
+
+    def _load_digests(self) -> dict:
+        try:
+            with open(self._digests_path()) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save_digests(self) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = self._digests_path() + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self._digests, f)
+        os.replace(tmp, self._digests_path())
+
+    def digest(self, path: str) -> str:
+        """Content hash of a file, reusing the last one while size and mtime are unchanged."""
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return "missing"
+        stamp = [st.st_size, st.st_mtime_ns]
+        known = self._digests.get(path)
+        if known and known[0] == stamp:
+            return known[1]
+        digest = file_digest(path)
+        self._digests[path] = [stamp, digest]
+        return digest
+
+    def stage_key(self, name: str, keys: dict) -> str:
+        stage = self.stages[name]
+        h = hashlib.sha256(name.encode())
+        for path in expand_inputs(stage["inputs"]):
+            h.update(f"\0{path}\0{self.digest(path)}".encode())
+        for dep in stage["deps"]:
+            h.update(f"\0dep:{dep}\0{keys.get(dep) or ''}".encode())
+        h.update(json.dumps(stage["params"], sort_keys=True, default=str).encode())
+        return h.hexdigest()[:16]
+
+    # --- cache entries -----------------------------------------------------------
+
+    def _entry_dir(self, name: str) -> str:
+        return os.path.join(self.cache_dir, name)
+
+    def _manifest(self, name: str) -> dict | None:
+        try:
+            with open(os.path.join(self._entry_dir(name), "manifest.json")) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _restore(self, name: str, key: str):
+        """Cached result for `key` (restoring output files), or raise LookupError."""
+        manifest = self._manifest(name)
+        if manifest is None or manifest["key"] != key:
+            raise LookupError(name)
+        entry = self._entry_dir(name)
+        for i, (path, digest) in enumerate(manifest["outputs"]):
+            if self.digest(path) != digest:
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                shutil.copyfile(os.path.join(entry, f"output_{i}"), path)
+                self.digest(path)
+        if not manifest["has_result"]:
+            return None
+        if manifest.get("result_format") == "parquet":
+            return pd.read_parquet(os.path.join(entry, "result.parquet"))
+        with open(os.path.join(entry, "result.pkl"), "rb") as f:
+            return pickle.load(f)
+
+    def _store(self, name: str, key: str, result) -> None:
+        """Replace the stage's cache entry with this run's result and outputs."""
+        entry = self._entry_dir(name)
+        tmp = entry + ".tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+        outputs = []
+        for i, path in enumerate(self.stages[name]["outputs"]):
+            if os.path.isfile(path):
+                shutil.copyfile(path, os.path.join(tmp, f"output_{i}"))
+                outputs.append([path, self.digest(path)])
+        result_format = None
+        if isinstance(result, pd.DataFrame):
+            try:
+                result.to_parquet(os.path.join(tmp, "result.parquet"), compression="zstd")
+                result_format = "parquet"
+            except (TypeError, ValueError, NotImplementedError, ImportError):
+                # mixed-type object columns etc. -> pickle
+                if os.path.exists(os.path.join(tmp, "result.parquet")):
+                    os.remove(os.path.join(tmp, "result.parquet"))
+        if result is not None and result_format is None:
+            with open(os.path.join(tmp, "result.pkl"), "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            result_format = "pickle"
+        with open(os.path.join(tmp, "manifest.json"), "w") as f:
+            json.dump({"key": key, "outputs": outputs, "has_result": result is not None,
+                       "result_format": result_format, "created": time.time()}, f)
+        shutil.rmtree(entry, ignore_errors=True)
+        os.replace(tmp, entry)
+
+    # --- running ---------------------------------------------------------------
+
+    def _run_stage(self, name: str, results: dict, keys: dict) -> tuple:
+        """(result, "ran" | "cached"); sets keys[name]."""
+        stage = self.stages[name]
+        args = [results[d] for d in stage["deps"]]
+        call = stage["fn"] if stage["result"] else _discard_result(stage["fn"])
+
+        if not stage["cache"]:
+            keys[name] = None
+            return call(*args), "ran"
+
+        keys[name] = key = self.stage_key(name, keys)
+        if self.use_cache:
+            try:
+                return self._restore(name, key), "cached"
+            except LookupError:
+                pass
+        result = call(*args)
+        self._store(name, key, result)
+        return result, "ran"
+
+    def run(self, targets: list | None = None) -> dict:
+        """Run `targets` (default: every stage) and their deps, in declaration order; returns {stage: result}."""
+        needed = set()
+
+        def collect(name):
+            if name not in needed:
+                needed.add(name)
+                for dep in self.stages[name]["deps"]:
+                    collect(dep)
+
+        for target in targets or list(self.stages):
+            collect(target)
+
+        results, keys = {}, {}
+        self.timings = []
+        for name in (n for n in self.stages if n in needed):
+            start = time.perf_counter()
+            with span(name) as record:
+                results[name], status = self._run_stage(name, results, keys)
+                record["status"] = status
+                if hasattr(results[name], "__len__"):
+                    record["rows"] = len(results[name])
+
+            seconds = time.perf_counter() - start
+            self.timings.append({"stage": name, "status": status, "seconds": seconds})
+            mark = "✓" if status == "cached" else "→"
+            print(f"{mark} [{name}] {status} in {seconds:.2f}s")
+
+        self._save_digests()
+        return results
@@ -0,0 +1,151 @@
+"""
+Per-stage profiling for main.py --profile.
+
+Code marks regions with `span(name)`; while profiling is enabled each span
+records wall time, CPU time, peak traced memory (tracemalloc) and a row count,
+nested under whatever span was open. Disabled (the default), span() does
+nothing beyond yielding a throwaway dict.
+
+    with span("rules") as s:
+        df = apply_rules(df, rules)
+        s["rows"] = len(df)
+
+The report is JSON (write_json) and, optionally, a Chrome trace
+(write_chrome_trace) — open it in chrome://tracing or https://ui.perfetto.dev.
+"""
+
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+_active = None
+
+
+class Profiler:
+    def __init__(self, trace_memory: bool = True):
+        self.trace_memory = trace_memory
+        self.records      = []
+        self._stack       = []
+        self._t0          = time.perf_counter()
+        self._cpu0        = time.process_time()
+        self._peak        = 0      # highest traced memory seen by any span (spans reset tracemalloc's peak)
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def _memory(self) -> tuple:
+        return tracemalloc.get_traced_memory() if self.trace_memory else (0, 0)
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        parent = self._stack[-1] if self._stack else None
+        current, peak = self._memory()
+        self._peak = max(self._peak, peak)
+        if parent is not None:
+            parent["_peak"] = max(parent["_peak"], peak)
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+
+        record = {
+            "name":     name,
+            "path":     "/".join([r["name"] for r in self._stack] + [name]),
+            "depth":    len(self._stack),
+            "start_ms": (time.perf_counter() - self._t0) * 1000,
+            "rows":     None,
+            **attrs,
+            "_cpu":     time.process_time(),
+            "_mem0":    current,
+            "_peak":    current,
+        }
+        self._stack.append(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            wall = time.perf_counter() - start
+            self._stack.pop()
+            peak = max(record.pop("_peak"), self._memory()[1])
+            self._peak = max(self._peak, peak)
+            if parent is not None:
+                parent["_peak"] = max(parent["_peak"], peak)
+            record["wall_ms"] = wall * 1000
+            record["cpu_ms"]  = (time.process_time() - record.pop("_cpu")) * 1000
+            record["peak_mb"] = (peak - record.pop("_mem0")) / 2**20
+            self.records.append(record)
+
+    def report(self) -> dict:
+        spans = sorted(self.records, key=lambda r: r["start_ms"])
+        return {
+            "created":  time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "total": {
+                "wall_ms": (time.perf_counter() - self._t0) * 1000,
+                "cpu_ms":  (time.process_time() - self._cpu0) * 1000,
+                "peak_mb": max(self._peak, self._memory()[1]) / 2**20,
+            },
+            "spans": [{k: round(v, 3) if isinstance(v, float) else v for k, v in r.items()} for r in spans],
+        }
+
+    def write_json(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+
+    def write_chrome_trace(self, path: str) -> None:
+        """Chrome trace-event format: one complete ("X") event per span."""
+        events = []
+        for r in self.records:
+            args = {k: v for k, v in r.items() if k not in ("name", "path", "depth", "start_ms", "wall_ms")}
+            events.append({
+                "name": r["name"], "cat": r["path"].split("/")[0], "ph": "X",
+                "ts": round(r["start_ms"] * 1000), "dur": round(r["wall_ms"] * 1000),
+                "pid": os.getpid(), "tid": 0, "args": args,
+            })
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    def print_summary(self) -> None:
+        report = self.report()
+        print("\n=== Profile ===")
+        print(f"{'stage':32} {'wall ms':>9} {'cpu ms':>9} {'peak MB':>8} {'rows':>7}")
+        for r in report["spans"]:
+            label = "  " * r["depth"] + r["name"]
+            if r.get("status"):
+                label += f" ({r['status']})"
+            rows = "" if r["rows"] is None else r["rows"]
+            print(f"{label:32} {r['wall_ms']:9.1f} {r['cpu_ms']:9.1f} {r['peak_mb']:8.1f} {rows:>7}")
+        t = report["total"]
+        print(f"{'total':32} {t['wall_ms']:9.1f} {t['cpu_ms']:9.1f} {t['peak_mb']:8.1f}")
+
+
+def enable(trace_memory: bool = True) -> Profiler:
+    global _active
+    _active = Profiler(trace_memory)
+    return _active
+
+
+def disable() -> None:
+    global _active
+    if _active is not None and _active.trace_memory and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _active = None
+
+
+@contextmanager
+def span(name: str, **attrs):
+    """Profile the enclosed block if profiling is enabled; yields a dict for extra fields (rows, ...)."""
+    if _active is None:
+        yield {}
+        return
+    with _active.span(name, **attrs) as record:
+        yield record
+
+
+def profiled(name: str, fn, *args, **kwargs):
+    """fn(*args, **kwargs) inside span(name), recording len(result) as rows when it has one."""
+    with span(name) as record:
+        result = fn(*args, **kwargs)
+        if hasattr(result, "__len__"):
+            record["rows"] = len(result)
+    return result
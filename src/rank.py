@@ -1,15 +1,21 @@
+import numpy as np
 import pandas as pd
 
+from src.adp_history import HISTORY_DIR, TREND_COLS, compute_adp_trends
+from src.matching import player_ids
+from src.storage import KEY, read_table
 
-def merge_adp(df: pd.DataFrame, adp_path: str = "data/adp.csv") -> pd.DataFrame:
+
+def merge_adp(df: pd.DataFrame, adp_path: str = "data/adp.parquet") -> pd.DataFrame:
     """
     Merge consensus ADP into the player DataFrame.
     Players without ADP get 999 so they sort last.
     """
     try:
-        adp_df = pd.read_csv(adp_path)
+        adp_df = read_table(adp_path)
         adp_df = adp_df.drop_duplicates(subset="Name", keep="first")
-        df = df.merge(adp_df[["Name", "ADP"]], on="Name", how="left")
+        cols = [c for c in ["Name", "ADP", "ADP_Std", "ADP_N"] if c in adp_df.columns]
+        df = df.merge(adp_df[cols], on="Name", how="left")
         df["ADP"] = df["ADP"].fillna(999.0)
     except FileNotFoundError:
         print(f"Warning: ADP file not found at {adp_path}.")
@@ -17,16 +23,40 @@ def merge_adp(df: pd.DataFrame, adp_path: str = "data/adp.csv") -> pd.DataFrame:
     return df
 
 
+def merge_adp_trends(df: pd.DataFrame, history_dir: str = HISTORY_DIR) -> pd.DataFrame:
+    """
+    Add ADP movement columns (7/14-day trend, volatility, source divergence)
+    from the snapshot history written by combine_adp. No history -> NaN.
+    """
+    trends = compute_adp_trends(history_dir)
+    if trends.empty:
+        print(f"No ADP history at {history_dir} — run scripts/combine_adp.py to start one.")
+    df = df.copy()
+    had_key = KEY in df.columns
+    if not had_key:
+        df[KEY] = player_ids(df["Name"]).to_numpy()
+    df = df.merge(trends, on=KEY, how="left")
+    return df if had_key else df.drop(columns=KEY)
+
+
 def compute_value_score(df: pd.DataFrame) -> pd.DataFrame:
     """
     Value = ADP rank minus VORP rank.
     Positive = steal (going later than their value warrants).
     Negative = reach (going earlier than their value warrants).
+
+    Value_Adj shrinks Value toward 0 by the spread between ADP sources
+    (ADP_Std, in picks): a +15 steal on a player the sources disagree on by
+    12 picks is only +3 beyond the noise.
     """
     df = df.copy()
     df["VORP_Rank"] = df["VORP"].rank(ascending=False).astype(int)
     df["ADP_Rank"]  = df["ADP"].rank(ascending=True, method="first").astype(int)
     df["Value"]     = df["ADP_Rank"] - df["VORP_Rank"]
+
+    spread = df["ADP_Std"].fillna(0) if "ADP_Std" in df.columns else 0
+    # + 0.0 turns the -0.0 of a small negative Value inside the spread into 0.0
+    df["Value_Adj"] = (np.sign(df["Value"]) * (df["Value"].abs() - spread).clip(lower=0)).round(1) + 0.0
     return df
 
 
@@ -39,5 +69,5 @@ def build_draft_board(df: pd.DataFrame) -> pd.DataFrame:
     df["Draft_Rank"] = df.index + 1
     df["Est_Round"]  = ((df["Draft_Rank"] - 1) // 12) + 1
 
-    cols = ["Draft_Rank", "Name", "Position", "projected_points", "VORP", "ADP", "Value", "Est_Round"]
+    cols = ["Draft_Rank", "Name", "Position", "projected_points", "VORP", "ADP", "ADP_Std", "Value", "Value_Adj", "Est_Round"] + TREND_COLS
     return df[[c for c in cols if c in df.columns]]
@@ -0,0 +1,169 @@
+"""
+Analyst adjustments applied to the projection table in one vectorized pass.
+
+Rules live in data/rules.csv, one per line:
+
+    Name,Action,Stat,Value,Note
+    Emmanuel Clase,exclude,,,leave
+    Marcell Ozuna,position,,OF,
+    Mike Trout,playing_time,,0.8,IL stint - ~130 games
+    Corbin Carroll,stat,SB,0.7,hamstring
+
+    exclude        drop the player
+    position       set Position to Value
+    playing_time   multiply every counting stat by Value
+    stat           multiply Stat by Value
+
+Multipliers for the same player compound; for position the last rule wins.
+The older data/injured_out.csv (Name, Reason) and data/position_overrides.csv
+(Name, Position) are still read, as exclude and position rules ahead of
+rules.csv.
+
+Rules are joined to the table on Player_ID (the normalized-name key), so
+"Ronald Acuna Jr" matches "Ronald Acuña Jr.", and the cost is a few hash joins
+however many rules there are.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.matching import player_ids
+from src.storage import KEY
+
+RULES_PATH      = "data/rules.csv"
+EXCLUSIONS_PATH = "data/injured_out.csv"       # legacy: Name, Reason
+POSITIONS_PATH  = "data/position_overrides.csv"  # legacy: Name, Position
+
+ACTIONS      = ("exclude", "position", "playing_time", "stat")
+RULE_COLUMNS = ["Name", "Action", "Stat", "Value", "Note"]
+# not scaled by playing_time
+NON_STAT_COLS = {KEY, "Name", "Position", "Primary_Position"}
+# per-player lines printed before switching to counts only
+MAX_LISTED = 20
+
+
+def _read_csv(path: str) -> pd.DataFrame | None:
+    try:
+        return pd.read_csv(path, dtype=str, keep_default_na=False, comment="#")
+    except FileNotFoundError:
+        return None
+
+
+def load_rules(path: str = RULES_PATH, exclusions_path: str | None = EXCLUSIONS_PATH,
+               positions_path: str | None = POSITIONS_PATH) -> pd.DataFrame:
+    """All rules as DataFrame[Player_ID, Name, Action, Stat, Value, Note], legacy files first."""
+    frames = []
+    excluded = _read_csv(exclusions_path) if exclusions_path else None
+    if excluded is not None:
+        frames.append(pd.DataFrame({"Name": excluded["Name"], "Action": "exclude",
+                                    "Note": excluded.get("Reason", "")}))
+    positions = _read_csv(positions_path) if positions_path else None
+    if positions is not None:
+        frames.append(pd.DataFrame({"Name": positions["Name"], "Action": "position",
+                                    "Value": positions["Position"]}))
+    rules = _read_csv(path)
+    if rules is not None:
+        frames.append(rules)
+
+    if not frames:
+        return pd.DataFrame({KEY: pd.Series(dtype="uint64"),
+                             **{c: pd.Series(dtype=object) for c in RULE_COLUMNS}})
+    rules = pd.concat(frames, ignore_index=True).reindex(columns=RULE_COLUMNS).fillna("")
+    rules = rules[rules["Name"].str.strip() != ""]
+    rules["Action"] = rules["Action"].str.strip().str.lower()
+    rules["Stat"]   = rules["Stat"].str.strip()
+    rules["Value"]  = rules["Value"].str.strip()
+
+    unknown = ~rules["Action"].isin(ACTIONS)
+    if unknown.any():
+        print(f"  ⚠ Ignoring {unknown.sum()} rules with unknown action: "
+              f"{', '.join(sorted(rules.loc[unknown, 'Action'].unique()))} (expected {', '.join(ACTIONS)})")
+        rules = rules[~unknown]
+
+    numeric = rules["Action"].isin(["playing_time", "stat"])
+    factors = pd.to_numeric(rules["Value"].where(numeric), errors="coerce")
+    bad = numeric & factors.isna()
+    if bad.any():
+        print(f"  ⚠ Ignoring {bad.sum()} multiplier rules without a numeric Value: "
+              f"{', '.join(rules.loc[bad, 'Name'].head(5))}")
+        rules = rules[~bad]
+
+    rules = rules.reset_index(drop=True)
+    rules.insert(0, KEY, player_ids(rules["Name"]).to_numpy())
+    return rules
+
+
+def _listed(label: str, items: list) -> None:
+    if items and len(items) <= MAX_LISTED:
+        for item in items:
+            print(f"  {label}: {item}")
+
+
+def apply_rules(df: pd.DataFrame, rules: pd.DataFrame) -> pd.DataFrame:
+    """Apply `rules` (from load_rules) to a projection table; returns a new frame."""
+    if rules.empty:
+        return df
+    ids = df[KEY] if KEY in df.columns else player_ids(df["Name"])
+    ids = pd.Series(ids.to_numpy(), index=df.index)
+    matched = rules[KEY].isin(ids)
+    if not matched.all():
+        missing = rules.loc[~matched, "Name"].unique()
+        print(f"  ⚠ {len(missing)} rule names not in projections: {', '.join(missing[:10])}"
+              + (" ..." if len(missing) > 10 else ""))
+    rules = rules[matched]
+    action = rules["Action"]
+
+    # exclusions: anti-join
+    drop = ids.isin(rules.loc[action == "exclude", KEY])
+    _listed("Excluded", df.loc[drop, "Name"].tolist())
+    df, ids = df[~drop].reset_index(drop=True), ids[~drop].reset_index(drop=True)
+
+    # positions: last rule per player wins
+    positions = rules[action == "position"].drop_duplicates(KEY, keep="last").set_index(KEY)["Value"]
+    new_pos = ids.map(positions)
+    changed = new_pos.notna() & (new_pos != df["Position"].astype(str))
+    if changed.any():
+        df = df.copy()
+        if isinstance(df["Position"].dtype, pd.CategoricalDtype):
+            extra = sorted(set(new_pos[changed]) - set(df["Position"].cat.categories))
+            if extra:
+                df["Position"] = df["Position"].cat.add_categories(extra)
+        _listed("Position override", [f"{n} {o} -> {p}" for n, o, p in
+                                     zip(df.loc[changed, "Name"], df.loc[changed, "Position"], new_pos[changed])])
+        df.loc[changed, "Position"] = new_pos[changed].to_numpy()
+
+    # multipliers: one factor per (player, stat), compounded, broadcast onto the stat matrix
+    scaled = rules[action.isin(["playing_time", "stat"])]
+    n_scaled = 0
+    if not scaled.empty:
+        stats = [c for c in df.columns if c not in NON_STAT_COLS and pd.api.types.is_float_dtype(df[c])]
+        factors = scaled.assign(Value=scaled["Value"].astype("float64"))
+        unknown = (factors["Action"] == "stat") & ~factors["Stat"].isin(stats)
+        if unknown.any():
+            print(f"  ⚠ Ignoring stat rules for unknown columns: {', '.join(sorted(factors.loc[unknown, 'Stat'].unique()))}")
+            factors = factors[~unknown]
+        is_pt = factors["Action"] == "playing_time"
+
+        playing_time = factors[is_pt].groupby(KEY)["Value"].prod()
+        per_stat = factors[~is_pt].groupby([KEY, "Stat"])["Value"].prod().unstack(fill_value=1.0)
+
+        matrix = np.ones((len(df), len(stats)))
+        matrix *= ids.map(playing_time).fillna(1.0).to_numpy()[:, None]
+        if not per_stat.empty:
+            cols = [stats.index(c) for c in per_stat.columns]
+            matrix[:, cols] *= per_stat.reindex(ids.to_numpy()).fillna(1.0).to_numpy()
+
+        rows = (matrix != 1.0).any(axis=1)
+        n_scaled = int(rows.sum())
+        if n_scaled:
+            df = df.copy()
+            for j, col in enumerate(stats):
+                values = df[col].to_numpy(dtype="float64", copy=True)
+                # stats are stored with one decimal
+                values[rows] = np.round(values[rows] * matrix[rows, j], 1)
+                df[col] = values.astype(df[col].dtype)
+            _listed("Adjusted", df.loc[rows, "Name"].tolist())
+
+    print(f"  Rules: {int(drop.sum())} excluded, {int(changed.sum())} position changes, "
+          f"{n_scaled} players' stats adjusted ({len(rules)} rules)")
+    return df
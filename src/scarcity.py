@@ -1,20 +1,30 @@
+import numpy as np
 import pandas as pd
 
 TEAMS = 12
 
-STARTERS = {
-    "C":  1 * TEAMS,   # 12
-    "1B": 1 * TEAMS,   # 12
-    "2B": 1 * TEAMS,   # 12
-    "3B": 1 * TEAMS,   # 12
-    "SS": 1 * TEAMS,   # 12
-    "OF": 4 * TEAMS,   # 48
-    "DH": 1 * TEAMS,   # 12
-    "SP": 5 * TEAMS,   # 60  — 5 SP slots per team
-    "RP": 2 * TEAMS,   # 24  — 2 RP slots per team
+# starting slots per team
+SLOTS = {
+    "C":  1,
+    "1B": 1,
+    "2B": 1,
+    "3B": 1,
+    "SS": 1,
+    "OF": 4,
+    "DH": 1,
+    "SP": 5,
+    "RP": 2,
 }
 
 
+def starters_for(teams: int = TEAMS, slots: dict = SLOTS) -> dict:
+    """League-wide starters per position, e.g. OF: 4 * 12 = 48."""
+    return {pos: n * teams for pos, n in slots.items()}
+
+
+STARTERS = starters_for(TEAMS)
+
+
 def load_eligibility(path: str = "data/espn_eligibility.csv") -> dict:
     try:
         df = pd.read_csv(path)
@@ -43,66 +53,96 @@ def get_all_positions(player_name: str, primary_pos: str, eligibility: dict) ->
     return [primary_pos]
 
 
-def compute_vorp(df: pd.DataFrame, eligibility_path: str = "data/espn_eligibility.csv") -> pd.DataFrame:
+def position_table(df: pd.DataFrame, eligibility: dict) -> pd.DataFrame:
+    """
+    One row per (player row, eligible position) — get_all_positions for the
+    whole table: the player's eligibility list with their listed Position
+    first if it isn't on it. `order` is the position's place in that list.
+    """
+    position = df["Position"].astype(str).to_numpy()
+    listed = pd.DataFrame({"row": np.arange(len(df)), "pos": position, "order": -1})
+    elig = df["Name"].map(eligibility).reset_index(drop=True)
+    elig = elig[elig.notna()]
+    if elig.empty:
+        return listed
+    long = elig.explode().rename("pos").reset_index().rename(columns={"index": "row"})
+    long = long[long["pos"].notna()]
+    long["order"] = long.groupby("row").cumcount()
+    table = pd.concat([listed, long], ignore_index=True)
+    # a listed Position that is also on the list keeps its list order
+    table = table.drop_duplicates(["row", "pos"], keep="last")
+    return table.sort_values(["row", "order"], kind="stable").reset_index(drop=True)
+
+
+def replacement_matrix(points: np.ndarray, positions: pd.DataFrame, starters: dict = STARTERS) -> dict:
+    """
+    Points of the last starter at each position (the whole pool if it's
+    smaller than the slots), for every column of a players × seasons matrix
+    at once: {pos: array of one level per season}.
+    """
+    points = np.asarray(points, dtype="float64")
+    rows, pos = positions["row"].to_numpy(), positions["pos"].to_numpy()
+    levels = {}
+    for position, num_starters in starters.items():
+        # DH is a flex hitter slot — use OF replacement level since any hitter can DH.
+        # This prevents a single player like Ohtani from having 0 VORP due to tiny pool.
+        pool = "OF" if position == "DH" else position
+        ranked = -np.sort(-points[rows[pos == pool]], axis=0)
+        if len(ranked) >= num_starters:
+            levels[position] = ranked[num_starters - 1]
+        elif len(ranked):
+            levels[position] = ranked[-1]
+        else:
+            levels[position] = np.zeros(points.shape[1:])
+    return levels
+
+
+def replacement_levels(points: pd.Series, positions: pd.DataFrame, starters: dict = STARTERS) -> dict:
+    """Replacement level per position for one season (see replacement_matrix)."""
+    levels = {pos: level[0] for pos, level in
+              replacement_matrix(points.to_numpy(dtype="float64")[:, None], positions, starters).items()}
+    counts = positions["pos"].value_counts()
+    for pos, num_starters in starters.items():
+        pool = counts.get("OF" if pos == "DH" else pos, 0)
+        print(f"  Replacement level {pos:3}: {levels[pos]:.1f} pts  ({pool} players, {num_starters} slots)")
+    return levels
+
+
+def vorp_matrix(points: np.ndarray, positions: pd.DataFrame, levels: dict) -> np.ndarray:
+    """Each player's best VORP across their positions, per season column; 0 with no rostered position."""
+    points = np.asarray(points, dtype="float64")
+    valid = positions[positions["pos"].isin(list(levels))]
+    rows = valid["row"].to_numpy()
+    vorp = points[rows] - np.stack([levels[pos] for pos in valid["pos"]]) if len(valid) else points[:0]
+    best = np.full(points.shape, -np.inf)
+    np.maximum.at(best, rows, vorp)
+    best[np.isinf(best)] = 0.0
+    return best
+
+
+def compute_vorp(df: pd.DataFrame, eligibility_path: str = "data/espn_eligibility.csv",
+                 starters: dict = STARTERS) -> pd.DataFrame:
     """
     Compute VORP with split SP/RP slots (5 SP + 2 RP per team).
     SP and RP now have separate replacement levels — closers compete
     only against other closers for 24 slots, not 84 combined pitcher slots.
     """
-    df = df.copy()
+    df = df.copy().reset_index(drop=True)
     eligibility = load_eligibility(eligibility_path)
-
-    # Build position pools
-    pos_pools = {pos: [] for pos in STARTERS}
-
-    for _, row in df.iterrows():
-        all_pos = get_all_positions(row["Name"], row["Position"], eligibility)
-        for pos in all_pos:
-            if pos in pos_pools:
-                pos_pools[pos].append(row["projected_points"])
-
-    # DH is a flex hitter slot — use OF replacement level since any hitter can DH.
-    # This prevents a single player like Ohtani from having 0 VORP due to tiny pool.
-    pos_pools["DH"] = pos_pools["OF"].copy()
-
-    # Compute replacement levels
-    replacement_levels = {}
-    for pos, num_starters in STARTERS.items():
-        points = sorted(pos_pools[pos], reverse=True)
-        if len(points) >= num_starters:
-            replacement_levels[pos] = points[num_starters - 1]
-        elif points:
-            replacement_levels[pos] = points[-1]
-        else:
-            replacement_levels[pos] = 0
-        print(f"  Replacement level {pos:3}: {replacement_levels[pos]:.1f} pts  ({len(points)} players, {num_starters} slots)")
-
-    # Assign each player VORP at their best position
-    vorp_list     = []
-    best_pos_list = []
-
-    for _, row in df.iterrows():
-        all_pos  = get_all_positions(row["Name"], row["Position"], eligibility)
-        best_vorp = None
-        best_pos  = row["Position"]
-
-        for pos in all_pos:
-            if pos not in replacement_levels:
-                continue
-            vorp = row["projected_points"] - replacement_levels[pos]
-            if best_vorp is None or vorp > best_vorp:
-                best_vorp = vorp
-                best_pos  = pos
-
-        vorp_list.append(round(best_vorp, 1) if best_vorp is not None else 0.0)
-        best_pos_list.append(best_pos)
-
-    df["VORP"]     = vorp_list
-    df["Best_Pos"] = best_pos_list
-
-    df["Eligibility"] = df["Name"].apply(
-        lambda n: "/".join(eligibility.get(n, [])) if n in eligibility else df.loc[df["Name"] == n, "Position"].values[0]
-    )
+    positions = position_table(df, eligibility)
+    levels = replacement_levels(df["projected_points"], positions, starters)
+
+    # Each player's VORP at their best position; the earlier position wins ties
+    scored = positions[positions["pos"].isin(list(levels))].copy()
+    scored["vorp"] = (df["projected_points"].to_numpy(dtype="float64")[scored["row"].to_numpy()]
+                      - scored["pos"].map(levels).astype("float64").to_numpy())
+    best = scored.sort_values(["row", "vorp", "order"], ascending=[True, False, True], kind="stable")
+    best = best.drop_duplicates("row").set_index("row")
+
+    df["VORP"]     = best["vorp"].reindex(df.index).round(1).fillna(0.0).to_numpy()
+    df["Best_Pos"] = best["pos"].reindex(df.index).fillna(pd.Series(df["Position"].astype(str))).to_numpy()
+    joined = df["Name"].map(lambda n: "/".join(eligibility[n]) if n in eligibility else None)
+    df["Eligibility"] = joined.fillna(df["Position"].astype(str)).astype(str)
 
     df = df.sort_values("VORP", ascending=False).reset_index(drop=True)
     return df
@@ -0,0 +1,134 @@
+"""
+Scoring what-ifs: how the board moves when the league changes its weights.
+
+A scenario is a set of weight overrides (src.scoring.FEATURES, e.g.
+{"IP": 2, "QS": 3}); a grid is every combination of the values given per
+feature. Points for a batch of scenarios are one matrix product,
+
+    points (players × scenarios) = scoring_features(df) @ weights (features × scenarios)
+
+and replacement levels, VORP and ranks come from the same players × columns
+array code the dynasty board uses (src.scarcity.replacement_matrix /
+vorp_matrix), so a batch is a handful of numpy calls. Batches run in a
+process pool.
+
+Per scenario, against the current weights:
+
+    spearman       rank correlation of VORP ranks over every player
+    mean_shift     mean |rank change| of the baseline top TOP_N
+    top_changed    baseline top-TOP_N players who fall out of it
+    movers         the biggest risers and fallers among either top TOP_N
+"""
+
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from src.scarcity import STARTERS, load_eligibility, position_table, replacement_matrix, vorp_matrix
+from src.scoring import FEATURES, scoring_features, weight_vector
+
+TOP_N  = 200     # ranks that matter for a draft
+MOVERS = 10      # movers kept per scenario
+CHUNK  = 50      # scenarios per process-pool job
+
+
+def parse_vary(specs: list) -> dict:
+    """["IP=1,2,3", "QS=2:4:0.5"] -> {"IP": [1, 2, 3], "QS": [2, 2.5, 3, 3.5, 4]}."""
+    vary = {}
+    for spec in specs:
+        name, _, values = spec.partition("=")
+        if name not in FEATURES or not values:
+            raise ValueError(f"bad --vary {spec!r}: use FEATURE=v1,v2 or FEATURE=start:stop:step "
+                             f"(features: {', '.join(FEATURES)})")
+        if ":" in values:
+            start, stop, step = (float(v) for v in values.split(":"))
+            vary[name] = list(np.round(np.arange(start, stop + step / 2, step), 6))
+        else:
+            vary[name] = [float(v) for v in values.split(",")]
+    return vary
+
+
+def scenario_grid(vary: dict) -> list:
+    """Every combination of the varied weights, as override dicts."""
+    names = list(vary)
+    return [dict(zip(names, values)) for values in itertools.product(*(vary[n] for n in names))]
+
+
+def vorp_ranks(points: np.ndarray, positions: pd.DataFrame, starters: dict = STARTERS) -> tuple:
+    """(VORP, rank) players × scenarios; ties keep table order."""
+    levels = replacement_matrix(points, positions, starters)
+    vorp = vorp_matrix(points, positions, levels)
+    order = np.argsort(-vorp, axis=0, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, len(points) + 1)[:, None], axis=0)
+    return vorp, ranks
+
+
+def _run_chunk(features: np.ndarray, positions: pd.DataFrame, starters: dict, scenarios: list,
+               base_rank: np.ndarray, names: np.ndarray, top_n: int, movers: int) -> tuple:
+    """Summary rows and mover rows for a batch of scenarios."""
+    weights = np.stack([weight_vector(s) for s in scenarios], axis=1)         # features × scenarios
+    points = (features @ weights).round(1)
+    _, ranks = vorp_ranks(points, positions, starters)
+
+    n = len(base_rank)
+    shift = base_rank[:, None] - ranks                                        # + = moved up
+    spearman = 1 - 6 * (shift.astype("float64") ** 2).sum(axis=0) / (n * (n ** 2 - 1))
+    in_base = base_rank <= top_n
+    relevant = in_base[:, None] | (ranks <= top_n)
+
+    summary, rows = [], []
+    for k, scenario in enumerate(scenarios):
+        s = shift[:, k]
+        candidates = np.flatnonzero(relevant[:, k])
+        best = candidates[np.argsort(-np.abs(s[candidates]), kind="stable")[:movers]]
+        riser, faller = candidates[np.argmax(s[candidates])], candidates[np.argmin(s[candidates])]
+        summary.append({
+            **scenario,
+            "spearman":    round(float(spearman[k]), 4),
+            "mean_shift":  round(float(np.abs(s[in_base]).mean()), 1),
+            "top_changed": int((ranks[in_base, k] > top_n).sum()),
+            "top_riser":   f"{names[riser]} (+{s[riser]})",
+            "top_faller":  f"{names[faller]} ({s[faller]})",
+        })
+        rows += [{**scenario, "Name": names[r], "Base_Rank": int(base_rank[r]),
+                  "Rank": int(ranks[r, k]), "Shift": int(s[r])} for r in best]
+    return summary, rows
+
+
+def run_scenarios(df: pd.DataFrame, scenarios: list, eligibility_path: str = "data/espn_eligibility.csv",
+                  starters: dict = STARTERS, workers: int | None = None, chunk: int = CHUNK,
+                  top_n: int = TOP_N, movers: int = MOVERS) -> tuple:
+    """
+    (summary, movers) DataFrames for `scenarios` (weight override dicts) on
+    the rules-applied projections `df`. Batches of `chunk` scenarios run in a
+    process pool of `workers` (1 runs inline).
+    """
+    df = df.reset_index(drop=True)
+    features = scoring_features(df)
+    positions = position_table(df, load_eligibility(eligibility_path))
+    names = df["Name"].to_numpy()
+    _, base = vorp_ranks((features @ weight_vector()).round(1)[:, None], positions, starters)
+    base_rank = base[:, 0]
+
+    batches = [scenarios[i:i + chunk] for i in range(0, len(scenarios), chunk)]
+    args = (features, positions, starters)
+    results = []
+    if workers == 1 or len(batches) == 1:
+        results = [_run_chunk(*args, batch, base_rank, names, top_n, movers) for batch in batches]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_run_chunk, *args, batch, base_rank, names, top_n, movers) for batch in batches]
+            for future in as_completed(futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    print(f"  ⚠ scenario batch failed: {e}")
+
+    summary = pd.DataFrame([row for s, _ in results for row in s])
+    mover_rows = pd.DataFrame([row for _, m in results for row in m])
+    if not summary.empty:
+        summary = summary.sort_values("spearman", kind="stable").reset_index(drop=True)
+    return summary, mover_rows
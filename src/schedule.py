@@ -0,0 +1,193 @@
+"""
+Schedule-aware weekly projections for H2H leagues, with two-start pitchers.
+
+Inputs (all optional except the schedule):
+
+    data/schedule.csv        Date, Home, Away — one row per MLB game (a Week
+                             column overrides the Monday-to-Sunday weeks)
+    data/mlb_teams.csv       Name, Team, Rotation — each player's MLB team;
+                             Rotation is the starter's slot (1-5) in order
+    data/team_factors.csv    Team, Park, Offense, Pitching — multipliers, 1.0
+                             neutral: Park is the home park's run factor,
+                             Offense runs the team scores, Pitching runs it allows
+
+Each game is scored once per side with a factor:
+
+    hitters    Park[home] × Pitching[opponent]
+    pitchers   1 / (Park[home] × Offense[opponent])
+
+and summed into teams × weeks matrices (starts per rotation slot for SPs:
+the team's k-th game goes to slot k mod 5). A player's week is then
+
+    hitters, RP, SP without a slot    season points / team games × Σ game factors that week
+    rotation SP                       season points / slot's starts × Σ start factors
+
+— one fancy-indexing pass over players × weeks. Players with no known team
+get the league-average team. Weeks where a rotation SP lines up for two or
+more starts are listed in Two_Start_Weeks.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.matching import player_ids
+from src.scoring import HITTER_POSITIONS
+
+SCHEDULE_PATH = "data/schedule.csv"
+MLB_TEAMS_PATH = "data/mlb_teams.csv"
+FACTORS_PATH = "data/team_factors.csv"
+
+WEEKS = 26
+ROTATION_SIZE = 5
+
+
+def load_schedule(path: str = SCHEDULE_PATH) -> pd.DataFrame:
+    """Games with Date, Home, Away and Week (1-based)."""
+    games = pd.read_csv(path)
+    games["Date"] = pd.to_datetime(games["Date"])
+    games["Home"], games["Away"] = games["Home"].astype(str), games["Away"].astype(str)
+    if "Week" not in games.columns:
+        first_monday = games["Date"].min() - pd.Timedelta(days=games["Date"].min().weekday())
+        games["Week"] = (games["Date"] - first_monday).dt.days // 7 + 1
+    return games.sort_values("Date", kind="stable").reset_index(drop=True)
+
+
+def load_team_factors(teams: list, path: str = FACTORS_PATH) -> pd.DataFrame:
+    """Park / Offense / Pitching per team in `teams` order; 1.0 where unknown."""
+    factors = pd.DataFrame(1.0, index=teams, columns=["Park", "Offense", "Pitching"])
+    try:
+        given = pd.read_csv(path)
+    except FileNotFoundError:
+        print(f"⚠ No {path} — no park or opponent adjustments")
+        return factors
+    given = given.assign(Team=given["Team"].astype(str)).set_index("Team")
+    factors.update(given.reindex(columns=factors.columns))
+    return factors
+
+
+def load_mlb_teams(path: str = MLB_TEAMS_PATH) -> pd.DataFrame:
+    """Team and rotation slot by Player_ID (empty if there is no file)."""
+    try:
+        teams = pd.read_csv(path)
+    except FileNotFoundError:
+        print(f"⚠ No {path} — every player gets the league-average schedule")
+        return pd.DataFrame(columns=["Team", "Rotation"])
+    if "Rotation" not in teams.columns:
+        teams["Rotation"] = np.nan
+    teams = teams.assign(Team=teams["Team"].astype(str))
+    teams.index = player_ids(teams["Name"]).to_numpy()
+    return teams[~teams.index.duplicated()][["Team", "Rotation"]]
+
+
+def schedule_matrices(games: pd.DataFrame, factors: pd.DataFrame, weeks: int) -> dict:
+    """
+    Per-team weekly sums over the schedule, with one extra last row for the
+    league-average team:
+        games     teams              games played
+        hit       teams × weeks      Σ hitter factors
+        pitch     teams × weeks      Σ pitcher factors
+        start     teams × 5 × weeks  Σ pitcher factors per rotation slot
+        starts    teams × 5 × weeks  starts per rotation slot
+    """
+    teams = list(factors.index)
+    code = {team: i for i, team in enumerate(teams)}
+    home, away = games["Home"].map(code).to_numpy(), games["Away"].map(code).to_numpy()
+    week = np.clip(games["Week"].to_numpy(dtype=int), 1, weeks) - 1
+
+    park, offense, pitching = (factors[c].to_numpy(dtype="float64") for c in ("Park", "Offense", "Pitching"))
+    # both sides of every game, in date order
+    team = np.concatenate([home, away])
+    opp = np.concatenate([away, home])
+    site = np.concatenate([home, home])
+    week2 = np.concatenate([week, week])
+    order = np.argsort(np.concatenate([np.arange(len(games))] * 2), kind="stable")
+    team, opp, site, week2 = team[order], opp[order], site[order], week2[order]
+
+    hit_f = park[site] * pitching[opp]
+    pitch_f = 1.0 / (park[site] * offense[opp])
+    n = len(teams)
+    played = np.bincount(team, minlength=n).astype("float64")
+    hit = np.zeros((n, weeks))
+    pitch = np.zeros((n, weeks))
+    np.add.at(hit, (team, week2), hit_f)
+    np.add.at(pitch, (team, week2), pitch_f)
+
+    # k-th game of each team goes to rotation slot k mod 5
+    game_no = pd.Series(team).groupby(team).cumcount().to_numpy()
+    slot = game_no % ROTATION_SIZE
+    start = np.zeros((n, ROTATION_SIZE, weeks))
+    starts = np.zeros((n, ROTATION_SIZE, weeks))
+    np.add.at(start, (team, slot, week2), pitch_f)
+    np.add.at(starts, (team, slot, week2), 1.0)
+
+    def with_average(a):
+        return np.concatenate([a, a.mean(axis=0, keepdims=True)])
+
+    return {"games": with_average(played), "hit": with_average(hit), "pitch": with_average(pitch),
+            "start": with_average(start), "starts": with_average(starts), "teams": teams}
+
+
+def weekly_points(df: pd.DataFrame, mats: dict, mlb_teams: pd.DataFrame) -> tuple:
+    """(points players × weeks, starts players × weeks) for the scored table `df`."""
+    ids = player_ids(df["Name"]).to_numpy()
+    code = {team: i for i, team in enumerate(mats["teams"])}
+    average = len(mats["teams"])
+    known = mlb_teams.reindex(ids)
+    team = known["Team"].map(code).fillna(average).to_numpy(dtype=int)
+    slot = known["Rotation"].to_numpy(dtype="float64") - 1
+    points = df["projected_points"].to_numpy(dtype="float64")
+    position = df["Position"].astype(str).to_numpy()
+
+    hitter = np.isin(position, list(HITTER_POSITIONS))
+    rotation = (position == "SP") & (slot >= 0) & (slot < ROTATION_SIZE)
+    slot = np.where(rotation, slot, 0).astype(int)
+
+    per_game = points / np.maximum(mats["games"][team], 1)
+    weekly = per_game[:, None] * np.where(hitter[:, None], mats["hit"][team], mats["pitch"][team])
+
+    # season points spread over the starts the schedule gives the slot, so weeks add back up to the season
+    per_start = points / np.maximum(mats["starts"][team, slot].sum(axis=1), 1)
+    weekly = np.where(rotation[:, None], per_start[:, None] * mats["start"][team, slot], weekly)
+    starts = np.where(rotation[:, None], mats["starts"][team, slot], 0.0)
+    return weekly, starts
+
+
+def build_weekly_board(scored: pd.DataFrame, schedule_path: str = SCHEDULE_PATH,
+                       teams_path: str = MLB_TEAMS_PATH, factors_path: str = FACTORS_PATH) -> pd.DataFrame:
+    """Weekly board: Name, Position, Team, Week_1..Week_N points and Two_Start_Weeks."""
+    df = scored.reset_index(drop=True)
+    board = df[["Name", "Position"]].copy()
+    try:
+        games = load_schedule(schedule_path)
+    except FileNotFoundError:
+        print(f"⚠ No {schedule_path} — season points split evenly over {WEEKS} weeks")
+        weekly = np.repeat(df["projected_points"].to_numpy(dtype="float64")[:, None] / WEEKS, WEEKS, axis=1)
+        starts = np.zeros_like(weekly)
+        board["Team"] = ""
+    else:
+        weeks = int(games["Week"].max())
+        teams = sorted(set(games["Home"]) | set(games["Away"]))
+        mats = schedule_matrices(games, load_team_factors(teams, factors_path), weeks)
+        mlb_teams = load_mlb_teams(teams_path)
+        weekly, starts = weekly_points(df, mats, mlb_teams)
+        board["Team"] = mlb_teams.reindex(player_ids(df["Name"]).to_numpy())["Team"].fillna("").to_numpy()
+        print(f"✓ Weekly projections: {len(games)} games, {len(teams)} teams, {weeks} weeks")
+
+    board["projected_points"] = df["projected_points"].to_numpy()
+    week_cols = [f"Week_{w + 1}" for w in range(weekly.shape[1])]
+    board = pd.concat([board, pd.DataFrame(weekly.round(1), columns=week_cols)], axis=1)
+    two = starts >= 2
+    board["Two_Start_Weeks"] = ""
+    for w in np.flatnonzero(two.any(axis=0)):
+        sep = np.where(board["Two_Start_Weeks"].to_numpy() == "", "", ",")
+        board.loc[two[:, w], "Two_Start_Weeks"] = (board["Two_Start_Weeks"] + sep + str(w + 1))[two[:, w]]
+    print(f"✓ {int(two.any(axis=1).sum())} SPs with two-start weeks ({int(two.sum())} two-start weeks)")
+    return board.sort_values("projected_points", ascending=False, kind="stable").reset_index(drop=True)
+
+
+def two_start_pitchers(board: pd.DataFrame, week: int) -> pd.DataFrame:
+    """Two-start SPs for `week`, best projected week first."""
+    weeks = board["Two_Start_Weeks"].str.split(",")
+    mask = weeks.apply(lambda ws: str(week) in ws)
+    out = board.loc[mask, ["Name", "Team", f"Week_{week}", "projected_points"]]
+    return out.sort_values(f"Week_{week}", ascending=False).reset_index(drop=True)
@@ -1,43 +1,68 @@
-def calculate_points(row) -> float:
+import numpy as np
+import pandas as pd
+
+HITTER_POSITIONS  = {"C", "1B", "2B", "3B", "SS", "OF", "CI", "MI", "DH"}
+PITCHER_POSITIONS = {"SP", "RP", "P"}
+
+
+def _stat(df, *names) -> np.ndarray:
+    """First of `names` present in df as float64, else zeros — row.get() for a whole column."""
+    for name in names:
+        if name in df.columns:
+            return df[name].to_numpy(dtype="float64")
+    return np.zeros(len(df))
+
+
+# League scoring settings, in FEATURES order for scoring_features / calculate_points_frame.
+# Pitchers' strikeouts are K_pitch so they can be weighted apart from hitters' K.
+BATTING_WEIGHTS = {"R": 1, "TB": 1, "RBI": 1, "BB": 1, "K": -1, "SB": 1, "CYC": 8, "GSHR": 4}
+PITCHING_WEIGHTS = {"IP": 3, "ER": -2, "K_pitch": 1, "SV": 5, "H_allowed": -1, "BB_issued": -1,
+                    "QS": 2, "CG": 4, "NH": 6, "PG": 10, "HLD": 2}
+FEATURES = list(BATTING_WEIGHTS) + list(PITCHING_WEIGHTS)
+
+
+def scoring_features(df) -> np.ndarray:
+    """
+    players × FEATURES: the stats each weight multiplies, with batting
+    features zero for pitchers and pitching features zero for hitters, so
+    points = scoring_features(df) @ weight_vector().
     """
-    Calculate projected fantasy points based on actual league scoring settings.
+    position = df["Position"].astype(str)
+    hitter   = position.isin(HITTER_POSITIONS).to_numpy()
+    pitcher  = position.isin(PITCHER_POSITIONS).to_numpy()
+
+    h, doubles, triples, hr = _stat(df, "H"), _stat(df, "2B"), _stat(df, "3B"), _stat(df, "HR")
+    singles = h - doubles - triples - hr
+    batting = {
+        "R": _stat(df, "R"), "TB": singles + 2 * doubles + 3 * triples + 4 * hr, "RBI": _stat(df, "RBI"),
+        "BB": _stat(df, "BB"), "K": _stat(df, "K"), "SB": _stat(df, "SB"),
+        "CYC": _stat(df, "CYC"), "GSHR": _stat(df, "GSHR"),
+    }
+    pitching = {
+        "IP": _stat(df, "IP"), "ER": _stat(df, "ER"), "K_pitch": _stat(df, "K_pitch", "K"),
+        "SV": _stat(df, "SV"), "H_allowed": _stat(df, "H_allowed", "HA"),
+        "BB_issued": _stat(df, "BB_issued", "BBI"), "QS": _stat(df, "QS"), "CG": _stat(df, "CG"),
+        "NH": _stat(df, "NH"), "PG": _stat(df, "PG"), "HLD": _stat(df, "HLD"),
+    }
+    features = np.empty((len(df), len(FEATURES)))
+    for j, name in enumerate(FEATURES):
+        features[:, j] = batting[name] * hitter if name in batting else pitching[name] * pitcher
+    return features
 
-    BATTING:
-      R=1, TB=1, RBI=1, BB=1, K=-1, SB=1, CYC=8, GSHR=4
 
-    PITCHING:
-      IP=3, ER=-2, K=1, SV=5, H=-1, BB=-1, QS=2, CG=4, NH=6, PG=10, HD=2
+def weight_vector(overrides: dict | None = None) -> np.ndarray:
+    """Weights in FEATURES order, with `overrides` ({feature: weight}) applied."""
+    weights = {**BATTING_WEIGHTS, **PITCHING_WEIGHTS, **(overrides or {})}
+    unknown = set(weights) - set(FEATURES)
+    if unknown:
+        raise ValueError(f"unknown scoring features {sorted(unknown)} (known: {', '.join(FEATURES)})")
+    return np.array([weights[name] for name in FEATURES], dtype="float64")
+
+
+def calculate_points_frame(df, weights: dict | None = None) -> pd.Series:
+    """
+    Projected fantasy points for every row under the league scoring settings
+    (BATTING_WEIGHTS / PITCHING_WEIGHTS, with `weights` overriding some).
+    Pitchers' strikeouts come from K_pitch when the table has one, else K.
     """
-    hitter_positions = {"C", "1B", "2B", "3B", "SS", "OF", "CI", "MI", "DH"}
-    pitcher_positions = {"SP", "RP", "P"}
-
-    if row["Position"] in hitter_positions:
-        singles = row["H"] - row["2B"] - row["3B"] - row["HR"]
-        TB = singles + 2 * row["2B"] + 3 * row["3B"] + 4 * row["HR"]
-        return (
-            row["R"]             * 1
-            + TB                 * 1
-            + row["RBI"]         * 1
-            + row["BB"]          * 1
-            + row["K"]           * -1
-            + row["SB"]          * 1
-            + row.get("CYC", 0)  * 8
-            + row.get("GSHR", 0) * 4
-        )
-
-    elif row["Position"] in pitcher_positions:
-        return (
-            row["IP"]                                       * 3    # changed from 1 to 3
-            + row.get("ER", 0)                              * -2
-            + row["K"]                                      * 1
-            + row["SV"]                                     * 5
-            + row.get("H_allowed", row.get("HA", 0))        * -1
-            + row.get("BB_issued", row.get("BBI", 0))       * -1
-            + row["QS"]                                     * 2
-            + row.get("CG", 0)                              * 4
-            + row.get("NH", 0)                              * 6
-            + row.get("PG", 0)                              * 10
-            + row["HLD"]                                    * 2
-        )
-
-    return 0.0
+    return pd.Series(scoring_features(df) @ weight_vector(weights), index=df.index)
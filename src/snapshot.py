@@ -0,0 +1,149 @@
+"""
+Binary board snapshot: a column store that board.py can memory-map and query
+without importing pandas or numpy. Standard library only.
+
+Layout:
+    b"DBSNAP1\\n"                     magic
+    uint32 (little-endian)           header length
+    header JSON                      rows, byteorder, columns [{name, kind, offset, ...}]
+    column blocks, 8-byte aligned
+        kind "f"   float32 values
+        kind "i"   int32 values
+        kind "s"   int32 end-offsets (rows) + UTF-8 blob
+
+Numeric columns are returned as memoryviews straight onto the mapped file, so
+opening a snapshot costs one small header read however big the board is.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+MAGIC = b"DBSNAP1\n"
+
+_ALIGN = 8
+
+
+def _pad(n: int) -> int:
+    return (-n) % _ALIGN
+
+
+def _kind(values: list) -> str:
+    if all(isinstance(v, int) and -2**31 <= v < 2**31 for v in values):
+        return "i"
+    if all(isinstance(v, (int, float)) for v in values):
+        return "f"
+    return "s"
+
+
+def write_snapshot(columns: dict, path: str, meta: dict | None = None) -> None:
+    """
+    columns: {name: list of values}, all the same length (e.g. df.to_dict("list")).
+    Ints become int32, other numbers float32 (NaN kept), everything else —
+    including ints too wide for int32, such as Player_ID — text.
+    """
+    names = list(columns)
+    rows = len(columns[names[0]]) if names else 0
+    blocks, specs, offset = [], [], 0
+
+    for name in names:
+        values = columns[name]
+        kind = _kind(values)
+        if kind == "s":
+            encoded = [("" if v is None or v != v else str(v)).encode() for v in values]
+            ends, total = array("i"), 0
+            for b in encoded:
+                total += len(b)
+                ends.append(total)
+            data = ends.tobytes()
+            blob = b"".join(encoded)
+            spec = {"name": name, "kind": "s", "offset": offset, "data_offset": offset + len(data),
+                    "data_nbytes": len(blob)}
+            data += blob
+        else:
+            data = array("i" if kind == "i" else "f", values).tobytes()
+            spec = {"name": name, "kind": kind, "offset": offset}
+        specs.append(spec)
+        blocks.append(data + b"\0" * _pad(len(data)))
+        offset += len(blocks[-1])
+
+    header = json.dumps({"rows": rows, "byteorder": sys.byteorder, "columns": specs,
+                         "meta": meta or {}}).encode()
+    prefix = MAGIC + struct.pack("<I", len(header)) + header
+    prefix += b"\0" * _pad(len(prefix))
+    # replace atomically, so a board.py session mapping the old file is unaffected
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(prefix)
+        # block offsets in the header are relative to the end of the prefix
+        for block in blocks:
+            f.write(block)
+    os.replace(tmp, path)
+
+
+class Snapshot:
+    """Read-only, memory-mapped view of a snapshot file."""
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        self._map  = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a board snapshot")
+        (n,) = struct.unpack_from("<I", self._map, len(MAGIC))
+        start = len(MAGIC) + 4
+        header = json.loads(self._map[start:start + n])
+        self.rows     = header["rows"]
+        self.meta     = header.get("meta", {})
+        self._specs   = {c["name"]: c for c in header["columns"]}
+        self._base    = start + n + _pad(start + n)
+        self._swap    = header["byteorder"] != sys.byteorder
+        self._cache   = {}
+
+    @property
+    def columns(self) -> list:
+        return list(self._specs)
+
+    def column(self, name: str):
+        """float32/int32 columns as a sequence of numbers, text columns as StrColumn."""
+        col = self._cache.get(name)
+        if col is None:
+            col = self._cache[name] = self._load(self._specs[name])
+        return col
+
+    def _numbers(self, typecode: str, offset: int):
+        view = memoryview(self._map)[self._base + offset:self._base + offset + 4 * self.rows]
+        if not self._swap:
+            return view.cast(typecode)
+        values = array(typecode, view.tobytes())
+        values.byteswap()
+        return values
+
+    def _load(self, spec: dict):
+        if spec["kind"] in ("f", "i"):
+            return self._numbers(spec["kind"], spec["offset"])
+        return StrColumn(self._numbers("i", spec["offset"]), self._map, self._base + spec["data_offset"])
+
+    def row(self, i: int) -> dict:
+        return {name: self.column(name)[i] for name in self._specs}
+
+
+class StrColumn:
+    """Text column decoded one value at a time."""
+
+    def __init__(self, ends, buf, base: int):
+        self._ends = ends
+        self._buf  = buf
+        self._base = base
+
+    def __len__(self) -> int:
+        return len(self._ends)
+
+    def __getitem__(self, i: int) -> str:
+        start = self._ends[i - 1] if i > 0 else 0
+        return self._buf[self._base + start:self._base + self._ends[i]].decode()
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
@@ -0,0 +1,104 @@
+"""
+Typed Parquet storage for pipeline tables (projections, ADP, boards).
+
+CSV stored every stat as text and re-parsed it on every run, with batter and
+pitcher columns both present (mostly zeros) as float64. Tables written here
+are columnar and typed:
+
+    Player_ID        uint64 key (src.matching.player_ids of Name), first column
+    Name             string
+    Position, ...    category (CATEGORY_COLS)
+    rank/round cols  int32 (INT_COLS)
+    ADP*, Value*     float64 (FLOAT64_PREFIXES) — shown to one decimal, where
+                     float32 would print 76.4 as 76.400002
+    other numbers    float32
+
+and zstd-compressed, which collapses the zero runs. CSV stays available as an
+export next to each Parquet file.
+"""
+
+import os
+import tempfile
+
+import pandas as pd
+
+from src.matching import player_ids
+
+KEY              = "Player_ID"
+CATEGORY_COLS    = ("Position", "Primary_Position")
+INT_COLS         = ("Draft_Rank", "Est_Round", "VORP_Rank", "ADP_Rank")
+FLOAT64_PREFIXES = ("ADP", "Value")
+COMPRESSION      = "zstd"
+
+
+def typed_frame(df: pd.DataFrame, key: bool = True) -> pd.DataFrame:
+    """Storage dtypes for `df` (see module docstring); adds Player_ID from Name when key=True."""
+    cols = {}
+    if key and "Name" in df.columns:
+        cols[KEY] = df[KEY].astype("uint64") if KEY in df.columns else player_ids(df["Name"]).to_numpy()
+    for col in df.columns:
+        if col == KEY and key:
+            continue
+        s = df[col]
+        if col in CATEGORY_COLS:
+            cols[col] = s.astype("category")
+        elif col in INT_COLS and pd.api.types.is_numeric_dtype(s) and s.notna().all():
+            cols[col] = s.astype("int32")
+        elif pd.api.types.is_bool_dtype(s) or col == KEY:
+            cols[col] = s
+        elif pd.api.types.is_numeric_dtype(s):
+            cols[col] = s.astype("float64" if col.startswith(FLOAT64_PREFIXES) else "float32")
+        else:
+            cols[col] = s
+    return pd.DataFrame(cols, index=df.index)
+
+
+def parquet_path(path: str) -> str:
+    """data/projections.csv -> data/projections.parquet"""
+    return os.path.splitext(path)[0] + ".parquet"
+
+
+def write_table(df: pd.DataFrame, path: str, key: bool = True) -> pd.DataFrame:
+    """Write `df` with storage dtypes to Parquet atomically; returns the typed frame."""
+    typed = typed_frame(df, key=key)
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=".parquet")
+    os.close(fd)
+    try:
+        typed.to_parquet(tmp, index=False, compression=COMPRESSION)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return typed
+
+
+def read_table(path: str, columns: list | None = None) -> pd.DataFrame:
+    """
+    Read a table written by write_table. A .csv path (or a .parquet path that
+    doesn't exist yet but has a .csv next to it) is read as CSV and given
+    storage dtypes, so older data directories keep working. A CSV edited or
+    re-fetched after its Parquet twin was written wins, with a warning.
+    """
+    csv_path = os.path.splitext(path)[0] + ".csv"
+    if path.endswith(".parquet") and os.path.exists(path):
+        if not os.path.exists(csv_path) or os.path.getmtime(csv_path) <= os.path.getmtime(path):
+            df = pd.read_parquet(path, columns=columns)
+            # files written before FLOAT64_PREFIXES stored these as float32
+            for c in df.columns:
+                if c.startswith(FLOAT64_PREFIXES) and df[c].dtype == "float32":
+                    df[c] = df[c].astype("float64").round(4)
+            return df
+        print(f"⚠ {csv_path} is newer than {path} — reading the CSV")
+    if not os.path.exists(csv_path):
+        raise FileNotFoundError(path)
+    df = typed_frame(pd.read_csv(csv_path))
+    return df[columns] if columns is not None else df
+
+
+def write_with_csv(df: pd.DataFrame, csv_path: str) -> pd.DataFrame:
+    """Write the CSV export and its typed Parquet twin; returns the typed frame."""
+    os.makedirs(os.path.dirname(csv_path) or ".", exist_ok=True)
+    df.to_csv(csv_path, index=False)
+    return write_table(df, parquet_path(csv_path))
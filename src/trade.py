@@ -0,0 +1,198 @@
+"""
+Trade analyzer: what a trade does to each side's starting lineup.
+
+A roster's value is its optimal starting lineup's projected points (exact
+assignment, src.lineup), with any slot the roster can't fill taken by a
+replacement-level player from waivers — the scarcity replacement level for
+that slot (src.scarcity.replacement_matrix). So
+
+    Lineup_Points   = best lineup points, open slots at replacement level
+    Roster_VORP     = Σ max(VORP, 0) over the roster (depth / trade currency)
+
+and a trade is scored by each side's change in both. Rosters don't grow: the
+side getting more players than it sends drops its lowest-VORP bench players
+(outside its new best lineup; starters only if the bench runs out) to get
+back to its pre-trade size, so their VORP leaves Roster_VORP. The side
+getting fewer plays short, with open slots at replacement level.
+
+search() looks for 1-for-1, 2-for-1 and 1-for-2 trades with every other team.
+Each player's marginal value is precomputed per side — what their team loses
+without them, what the other team gains with them — and candidate trades are
+estimated from those sums with array broadcasting. Only trades whose estimate
+is within PRUNE_SLACK of acceptable for both sides get exact lineup solves.
+Partners run in parallel processes.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+from src.lineup import LINEUP_SLOTS, eligibility_matrix, solve_day
+from src.scarcity import STARTERS, load_eligibility, position_table, replacement_matrix, vorp_matrix
+from src.storage import KEY
+from src.waivers import points_column
+
+PRUNE_SLACK  = 15.0     # points an estimate may be off by before a trade is skipped
+EXACT_LIMIT  = 300      # most exact evaluations per partner, best estimates first
+MIN_GAIN     = 0.0      # our minimum lineup gain for search results
+PARTNER_GAIN = 0.0      # partner's minimum lineup gain (0: they don't get worse)
+
+
+class TradeAnalyzer:
+    """Board points, slot eligibility and replacement levels, plus every team's roster rows."""
+
+    def __init__(self, board: pd.DataFrame, rosters: pd.DataFrame,
+                 eligibility_path: str = "data/espn_eligibility.csv", starters: dict = STARTERS):
+        self.board    = board.reset_index(drop=True)
+        self.points   = self.board[points_column(self.board)].to_numpy(dtype="float64")
+        eligibility   = load_eligibility(eligibility_path)
+        self.eligible = eligibility_matrix(self.board, eligibility)
+
+        positions   = position_table(self.board, eligibility)
+        levels      = replacement_matrix(self.points[:, None], positions, starters)
+        self.levels = np.array([float(levels[slot][0]) for slot in LINEUP_SLOTS])
+        self.vorp   = np.clip(vorp_matrix(self.points[:, None], positions, levels)[:, 0], 0, None)
+
+        row = pd.Series(np.arange(len(self.board)), index=self.board[KEY].to_numpy())
+        row = row[~row.index.duplicated()]
+        rosters = rosters.assign(row=row.reindex(rosters[KEY].to_numpy()).to_numpy())
+        rosters = rosters[rosters["row"].notna()]
+        self.teams = {team: group["row"].astype(int).to_numpy() for team, group in rosters.groupby("Team")}
+
+    def _lineup(self, rows: np.ndarray) -> tuple:
+        """(candidate values, candidate per slot) — `rows` then one replacement-level player per slot."""
+        values = self.points[rows, None] * self.eligible[rows]
+        candidates = np.vstack([values, np.diag(np.clip(self.levels, 0, None))])
+        return candidates, solve_day(candidates)
+
+    def lineup_points(self, rows: np.ndarray) -> float:
+        """Best starting lineup from `rows`, open slots at replacement level."""
+        candidates, lineup = self._lineup(rows)
+        filled = lineup >= 0
+        return float(candidates[lineup[filled], np.flatnonzero(filled)].sum())
+
+    def drop_order(self, rows: np.ndarray) -> np.ndarray:
+        """`rows` in the order they'd be dropped: bench before starters, lowest VORP (then points) first."""
+        _, lineup = self._lineup(rows)
+        starting = np.isin(rows, rows[lineup[(lineup >= 0) & (lineup < len(rows))]])
+        return rows[np.lexsort((self.points[rows], self.vorp[rows], starting))]
+
+    def roster_vorp(self, rows: np.ndarray) -> float:
+        return float(self.vorp[rows].sum())
+
+    def _after(self, team: str, give: np.ndarray, get: np.ndarray) -> tuple:
+        """(roster after the trade, rows dropped to keep it at its pre-trade size)."""
+        rows = self.teams[team]
+        after = np.concatenate([rows[~np.isin(rows, give)], get])
+        drops = self.drop_order(after)[:max(len(after) - len(rows), 0)]
+        return after[~np.isin(after, drops)], drops
+
+    def evaluate(self, team_a: str, team_b: str, give: np.ndarray, get: np.ndarray) -> dict:
+        """
+        Changes for both sides when team_a sends rows `give` to team_b for rows
+        `get`, plus the rows each side drops (<side>_drops).
+        """
+        result = {}
+        for side, team, out, incoming in (("a", team_a, give, get), ("b", team_b, get, give)):
+            before = self.teams[team]
+            after, drops = self._after(team, out, incoming)
+            result[f"{side}_points"] = self.lineup_points(after) - self.lineup_points(before)
+            result[f"{side}_vorp"]   = self.roster_vorp(after) - self.roster_vorp(before)
+            result[f"{side}_drops"]  = drops
+        return result
+
+    def rows_for(self, team: str, names: list) -> np.ndarray:
+        """Board rows for player names on `team` (KeyError for anyone not on it)."""
+        rows = self.teams[team]
+        lookup = {name.lower(): r for r, name in zip(rows, self.board.loc[rows, "Name"])}
+        missing = [n for n in names if n.lower() not in lookup]
+        if missing:
+            raise KeyError(f"not on {team}: {', '.join(missing)}")
+        return np.array([lookup[n.lower()] for n in names], dtype=int)
+
+    def marginals(self, team: str, others: np.ndarray) -> tuple:
+        """
+        (loss per own player if removed, gain per `others` row if added) —
+        lineup points against the team's current roster.
+        """
+        rows = self.teams[team]
+        base = self.lineup_points(rows)
+        loss = np.array([base - self.lineup_points(np.delete(rows, i)) for i in range(len(rows))])
+        gain = np.array([self.lineup_points(np.append(rows, r)) - base for r in others])
+        return loss, gain
+
+    def describe(self, trade: dict) -> dict:
+        names = self.board["Name"].to_numpy()
+        return {**trade, "give": " + ".join(names[trade["give"]]), "get": " + ".join(names[trade["get"]])}
+
+
+def _candidates(ours: np.ndarray, theirs: np.ndarray, est_us: callable, est_them: callable,
+                slack: float, min_gain: float, partner_gain: float) -> list:
+    """(give, get, estimate) for 1-for-1, 2-for-1 and 1-for-2 shapes that survive pruning."""
+    shapes = [(list(combinations(range(len(ours)), k)), list(combinations(range(len(theirs)), j)))
+              for k, j in ((1, 1), (2, 1), (1, 2))]
+    out = []
+    for gives, gets in shapes:
+        if not gives or not gets:
+            continue
+        gives, gets = np.array(gives), np.array(gets)
+        us = est_us(gives, gets)                # gives × gets
+        them = est_them(gives, gets)
+        keep = (us >= min_gain - slack) & (them >= partner_gain - slack)
+        for g, t in zip(*np.nonzero(keep)):
+            out.append((ours[gives[g]], theirs[gets[t]], us[g, t]))
+    return out
+
+
+def search_partner(analyzer: TradeAnalyzer, team: str, partner: str, slack: float = PRUNE_SLACK,
+                   min_gain: float = MIN_GAIN, partner_gain: float = PARTNER_GAIN,
+                   limit: int = EXACT_LIMIT) -> list:
+    """Trades with one partner that help us and don't hurt them, exactly evaluated."""
+    ours, theirs = analyzer.teams[team], analyzer.teams[partner]
+    our_loss, our_gain = analyzer.marginals(team, theirs)
+    their_loss, their_gain = analyzer.marginals(partner, ours)
+
+    def est_us(gives, gets):
+        return our_gain[gets].sum(axis=1)[None, :] - our_loss[gives].sum(axis=1)[:, None]
+
+    def est_them(gives, gets):
+        return their_gain[gives].sum(axis=1)[:, None] - their_loss[gets].sum(axis=1)[None, :]
+
+    candidates = _candidates(ours, theirs, est_us, est_them, slack, min_gain, partner_gain)
+    candidates.sort(key=lambda c: -c[2])
+    trades = []
+    for give, get, estimate in candidates[:limit]:
+        result = analyzer.evaluate(team, partner, give, get)
+        if result["a_points"] > min_gain and result["b_points"] >= partner_gain:
+            trades.append({"partner": partner, "give": give, "get": get, "estimate": estimate, **result})
+    return trades
+
+
+def search(analyzer: TradeAnalyzer, team: str, workers: int | None = None, **kwargs) -> pd.DataFrame:
+    """
+    Best trades with every other team, one process per partner (workers=1
+    runs inline), sorted by our lineup gain.
+    """
+    partners = [t for t in analyzer.teams if t != team]
+    trades = []
+    if workers == 1 or len(partners) <= 1:
+        for partner in partners:
+            trades += search_partner(analyzer, team, partner, **kwargs)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(search_partner, analyzer, team, partner, **kwargs): partner
+                       for partner in partners}
+            for future in as_completed(futures):
+                try:
+                    trades += future.result()
+                except Exception as e:
+                    print(f"  ⚠ {futures[future]}: {e}")
+
+    columns = ["partner", "give", "get", "a_points", "b_points", "a_vorp", "b_vorp"]
+    if not trades:
+        return pd.DataFrame(columns=columns)
+    table = pd.DataFrame([analyzer.describe(t) for t in trades])[columns]
+    table[columns[3:]] = table[columns[3:]].round(1)
+    return table.sort_values(["a_points", "b_points"], ascending=False).reset_index(drop=True)
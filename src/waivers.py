@@ -0,0 +1,141 @@
+"""
+Waiver-wire ranking: free agents by how much they'd add to our lineup.
+
+Rosters come from data/rosters.csv (Team, Name — every fantasy team's
+players). Everyone on the board who isn't on a roster is a free agent. A free
+agent's gain at a position is
+
+    gain = points - points of our weakest starter there
+
+(the weakest starter counts as 0 where we can't fill the slots), and their
+gain is the best over their eligible positions — any hitter can play DH. Our
+starters come from one optimal lineup over our roster (src.lineup.solve_day),
+so a multi-position player starts at one position only and DH holds whoever
+is left over, not our best hitter. Points are ROS_Points from the in-season
+board when there is one, projected_points otherwise.
+
+WaiverIndex sorts the player universe by points once per position. Ranking is
+then the first few free agents down each position's list; a roster move only
+flips availability masks, and our lineup is re-solved only when our own
+roster changed, so re-ranking never re-sorts the universe.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.lineup import solve_day
+from src.matching import player_ids
+from src.scarcity import SLOTS, load_eligibility, position_table
+from src.scoring import HITTER_POSITIONS
+from src.storage import KEY
+
+ROSTERS_PATH = "data/rosters.csv"
+
+
+def points_column(board: pd.DataFrame) -> str:
+    return "ROS_Points" if "ROS_Points" in board.columns else "projected_points"
+
+
+def load_rosters(path: str = ROSTERS_PATH) -> pd.DataFrame:
+    """Team, Name and Player_ID per rostered player."""
+    rosters = pd.read_csv(path)
+    rosters["Team"] = rosters["Team"].astype(str)
+    rosters[KEY] = player_ids(rosters["Name"]).to_numpy()
+    return rosters
+
+
+class WaiverIndex:
+    """Per-position points order over the whole board, plus who is ours and who is free."""
+
+    def __init__(self, board: pd.DataFrame, eligibility_path: str = "data/espn_eligibility.csv",
+                 slots: dict = SLOTS):
+        self.board  = board.reset_index(drop=True)
+        self.slots  = slots
+        self.points = self.board[points_column(self.board)].to_numpy(dtype="float64")
+        ids         = player_ids(self.board["Name"]).to_numpy()
+        self.row    = pd.Series(np.arange(len(ids)), index=ids)
+        self.row    = self.row[~self.row.index.duplicated()]
+
+        positions = position_table(self.board, load_eligibility(eligibility_path))[["row", "pos"]]
+        if "DH" in slots:
+            hitters = np.flatnonzero(self.board["Position"].astype(str).isin(HITTER_POSITIONS).to_numpy())
+            positions = pd.concat([positions, pd.DataFrame({"row": hitters, "pos": "DH"})])
+        positions = positions[positions["pos"].isin(list(slots))].drop_duplicates()
+        # rows per position, best first — the only sort
+        self.by_pos = {pos: rows[np.argsort(-self.points[rows], kind="stable")]
+                       for pos, rows in positions.groupby("pos")["row"].apply(np.asarray).items()}
+        self.player_positions = positions.groupby("row")["pos"].apply(list).to_dict()
+
+        self.mine    = np.zeros(len(self.board), dtype=bool)
+        self.free    = np.ones(len(self.board), dtype=bool)
+        self.weakest = {}           # pos -> (points, row) of our last starter; row -1 for an open slot
+        self.lineup_slots = [pos for pos, n in slots.items() for _ in range(n)]
+
+    def rows_for(self, ids: np.ndarray) -> np.ndarray:
+        rows = self.row.reindex(ids).to_numpy()
+        return rows[~np.isnan(rows)].astype(int)
+
+    def _weakest(self) -> dict:
+        """
+        pos -> (points, row) of our last starter there in our optimal lineup,
+        or (0, -1) where the lineup leaves one of its slots open.
+        """
+        ours = np.flatnonzero(self.mine)
+        eligible = np.array([[slot in self.player_positions.get(r, []) for slot in self.lineup_slots]
+                             for r in ours], dtype=bool).reshape(len(ours), len(self.lineup_slots))
+        lineup = solve_day(self.points[ours][:, None] * eligible)
+        weakest = {}
+        for pos in self.slots:
+            starters = lineup[[j for j, slot in enumerate(self.lineup_slots) if slot == pos]]
+            if (starters < 0).any():
+                weakest[pos] = (0.0, -1)
+            else:
+                last = ours[starters[np.argmin(self.points[ours[starters]])]]
+                weakest[pos] = (float(self.points[last]), int(last))
+        return weakest
+
+    def set_rosters(self, rosters: pd.DataFrame, team: str) -> dict:
+        """
+        Load every team's rosters, applying only what changed since the last
+        call; returns how many players moved and the time taken.
+        """
+        start = time.perf_counter()
+        rostered = np.zeros(len(self.board), dtype=bool)
+        rostered[self.rows_for(rosters[KEY].to_numpy())] = True
+        mine = np.zeros(len(self.board), dtype=bool)
+        mine[self.rows_for(rosters.loc[rosters["Team"] == team, KEY].to_numpy())] = True
+
+        moved = np.flatnonzero((rostered == self.free) | (mine != self.mine))
+        self.free = ~rostered
+        changed_mine = np.flatnonzero(mine != self.mine)
+        self.mine = mine
+        if len(changed_mine) or not self.weakest:
+            self.weakest = self._weakest()
+        return {"moved": len(moved), "ms": (time.perf_counter() - start) * 1000}
+
+    def rank(self, limit: int = 25, position: str | None = None) -> pd.DataFrame:
+        """Top free agents by gain over our weakest starter at their best position."""
+        positions = [position] if position else list(self.by_pos)
+        rows, gains, pos_names = [], [], []
+        for pos in positions:
+            order = self.by_pos.get(pos, np.array([], dtype=int))
+            top = order[self.free[order]][:limit]
+            rows.append(top)
+            gains.append(self.points[top] - self.weakest.get(pos, (0.0, -1))[0])
+            pos_names.append(np.full(len(top), pos, dtype=object))
+        if not rows:
+            return pd.DataFrame(columns=["Name", "Position", "Best_Pos", "Points", "Replaces", "Gain"])
+
+        cand = pd.DataFrame({"row": np.concatenate(rows), "gain": np.concatenate(gains),
+                             "pos": np.concatenate(pos_names)})
+        cand = cand.sort_values("gain", ascending=False, kind="stable").drop_duplicates("row").head(limit)
+        out = self.board.loc[cand["row"].to_numpy(), ["Name", "Position"]].reset_index(drop=True)
+        out["Best_Pos"] = cand["pos"].to_numpy()
+        out["Points"]   = self.points[cand["row"].to_numpy()].round(1)
+        weakest = [self.weakest.get(p, (0.0, -1))[1] for p in cand["pos"]]
+        out["Replaces"] = [self.board.at[r, "Name"] if r >= 0 else "(open slot)" for r in weakest]
+        out["Gain"]     = cand["gain"].to_numpy().round(1)
+        return out
+
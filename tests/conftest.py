@@ -0,0 +1,92 @@
+"""
+Shared fixtures: a local http.server stand-in for the sites the fetch
+scripts scrape, and a session pointed at it.
+
+The scripts import each other by bare module name (from http_client import
+...), so scripts/ goes on sys.path next to the repo root.
+"""
+
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(ROOT, "tests", "fixtures")
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+from http_client import HostLimitedAdapter, PooledSession  # noqa: E402
+
+
+def fixture_bytes(name: str) -> bytes:
+    with open(os.path.join(FIXTURES, name), "rb") as f:
+        return f.read()
+
+
+class StandIn:
+    """
+    Routes are keyed by path + query. A route is (status, headers, body) or a
+    callable(request_headers) returning one; unknown paths get a 404. Every
+    request is kept in `requests` as (path, headers).
+    """
+
+    def __init__(self):
+        self.routes   = {}
+        self.requests = []
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stand_in.requests.append((self.path, dict(self.headers)))
+                route = stand_in.routes.get(self.path)
+                if route is None:
+                    status, headers, body = 404, {}, b"not found"
+                else:
+                    status, headers, body = route(self.headers) if callable(route) else route
+                self.send_response(status)
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url    = f"http://127.0.0.1:{self.server.server_port}"
+
+    def serve(self, path: str, body: bytes, status: int = 200, content_type: str = "text/plain",
+              headers: dict | None = None) -> None:
+        self.routes[path] = (status, {"Content-Type": content_type, **(headers or {})}, body)
+
+    def hits(self, path: str) -> int:
+        return sum(p == path for p, _ in self.requests)
+
+
+@pytest.fixture
+def stand_in():
+    server = StandIn()
+    thread = threading.Thread(target=server.server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.server.shutdown()
+    server.server.server_close()
+
+
+def make_test_session(cache=None, cache_mode: str = "off") -> PooledSession:
+    """A PooledSession like http_client.make_session's, without rate limits or retries."""
+    session = PooledSession(cache, cache_mode)
+    adapter = HostLimitedAdapter(rate_limits={"127.0.0.1": (1000.0, 1000)}, max_retries=0,
+                                 metrics=session.metrics)
+    session.mount("http://", adapter)
+    return session
+
+
+@pytest.fixture
+def session():
+    with make_test_session() as s:
+        yield s
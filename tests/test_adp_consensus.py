@@ -0,0 +1,40 @@
+"""Weighted ADP consensus over a players × sources matrix."""
+
+import numpy as np
+import pandas as pd
+
+from src.adp_consensus import consensus_adp, drop_fringe
+
+
+def long_frame(rows: list) -> tuple:
+    long = pd.DataFrame(rows, columns=["Player_ID", "source", "ADP"])
+    long["Player_ID"] = long["Player_ID"].astype("uint64")
+    names = pd.Series([f"P{i}" for i in sorted(set(long["Player_ID"]))],
+                      index=pd.Index(sorted(set(long["Player_ID"])), dtype="uint64"))
+    return long, names
+
+
+def test_weighted_mean_and_std():
+    long, names = long_frame([(1, "A", 10.0), (1, "B", 20.0), (1, "C", 30.0), (2, "A", 5.0)])
+    out = consensus_adp(long, names, {"A": 2.0, "B": 1.0, "C": 1.0}).set_index("Name")
+
+    x, w = np.array([10.0, 20.0, 30.0]), np.array([2.0, 1.0, 1.0])
+    mean = (w * x).sum() / w.sum()
+    std = np.sqrt((w * (x - mean) ** 2).sum() / (w.sum() - (w ** 2).sum() / w.sum()))
+    assert out.loc["P1", "ADP"] == round(mean, 1)
+    assert out.loc["P1", "ADP_Std"] == round(std, 1)
+    assert np.isnan(out.loc["P2", "ADP_Std"]) and out.loc["P2", "ADP_N"] == 1
+
+
+def test_equal_weights_give_sample_std():
+    long, names = long_frame([(1, "A", 10.0), (1, "B", 14.0), (1, "C", 21.0)])
+    out = consensus_adp(long, names, {})
+
+    assert out.loc[0, "ADP_Std"] == round(np.std([10.0, 14.0, 21.0], ddof=1), 1)
+
+
+def test_drop_fringe_keeps_primary_or_shared_players():
+    long, names = long_frame([(1, "A", 10.0), (2, "B", 40.0), (3, "B", 50.0), (3, "C", 52.0)])
+    out = drop_fringe(consensus_adp(long, names, {}), "A")
+
+    assert sorted(out["Name"]) == ["P1", "P3"]
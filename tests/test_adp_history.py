@@ -0,0 +1,46 @@
+"""ADP snapshots and trend columns."""
+
+import numpy as np
+import pandas as pd
+
+from src.adp_history import append_snapshot, compute_adp_trends
+from src.matching import player_ids
+
+
+def snapshot(tmp_path, date: str, adp: dict) -> None:
+    append_snapshot(pd.DataFrame({"Name": list(adp), "ADP": list(adp.values())}), date=date, root=str(tmp_path))
+
+
+def trends(tmp_path, **kwargs) -> pd.DataFrame:
+    out = compute_adp_trends(root=str(tmp_path), **kwargs)
+    ids = dict(zip(player_ids(pd.Series(["Aaron Judge", "Juan Soto", "Paul Skenes"])), ["Judge", "Soto", "Skenes"]))
+    return out.set_index(out["Player_ID"].map(ids))
+
+
+def test_single_snapshot_has_no_trend(tmp_path):
+    snapshot(tmp_path, "2026-03-01", {"Aaron Judge": 1.5, "Juan Soto": 4.0})
+    out = trends(tmp_path)
+
+    assert out[["ADP_Trend_7d", "ADP_Trend_14d", "ADP_Volatility"]].isna().all().all()
+
+
+def test_trend_against_oldest_snapshot_in_window(tmp_path):
+    snapshot(tmp_path, "2026-02-10", {"Aaron Judge": 9.0, "Juan Soto": 9.0})
+    snapshot(tmp_path, "2026-02-20", {"Aaron Judge": 2.5, "Juan Soto": 3.0})
+    snapshot(tmp_path, "2026-02-25", {"Aaron Judge": 2.0, "Juan Soto": 5.0})
+    snapshot(tmp_path, "2026-03-01", {"Aaron Judge": 1.5, "Juan Soto": 4.0, "Paul Skenes": 12.0})
+    out = trends(tmp_path)
+
+    assert out.loc["Judge", "ADP_Trend_7d"] == 0.5       # 02-25 -> 03-01
+    assert out.loc["Judge", "ADP_Trend_14d"] == 1.0      # 02-20 -> 03-01
+    assert out.loc["Soto", "ADP_Trend_7d"] == 1.0
+    # new today: nothing earlier to compare against
+    assert np.isnan(out.loc["Skenes", "ADP_Trend_7d"]) and np.isnan(out.loc["Skenes", "ADP_Trend_14d"])
+
+
+def test_as_of_ignores_later_snapshots(tmp_path):
+    snapshot(tmp_path, "2026-02-25", {"Aaron Judge": 2.0})
+    snapshot(tmp_path, "2026-03-01", {"Aaron Judge": 1.5})
+    out = trends(tmp_path, as_of="2026-02-25")
+
+    assert np.isnan(out.loc["Judge", "ADP_Trend_7d"])
@@ -0,0 +1,21 @@
+"""Backtest metrics share one player pool: players with an ADP."""
+
+import pandas as pd
+
+from src.backtest import score_rankings
+
+
+def test_points_only_drafts_players_with_an_adp():
+    board = pd.DataFrame({"Name": ["Ace", "Bee", "Cee", "Sleeper"],
+                          "ADP": [1.0, 2.0, 3.0, 999.0],
+                          "projected_points": [300.0, 250.0, 200.0, 900.0]})
+    realized = pd.Series([280.0, 150.0, 240.0, 1000.0])
+
+    summary, per_round = score_rankings(board, realized, teams=1, rounds=2, top_n=(1,))
+    by_ranking = {row["ranking"]: row for row in summary}
+
+    # the undrafted Sleeper would top "points" if it could be picked
+    assert by_ranking["points"]["points"] == 280.0 + 150.0
+    assert by_ranking["board"]["points"] == by_ranking["adp"]["points"] == 280.0 + 150.0
+    assert [r["points"] for r in per_round if r["ranking"] == "points"] == [280.0, 150.0]
+    assert by_ranking["points"]["hit@1"] == 1.0
@@ -0,0 +1,45 @@
+"""Source selection and position lookup in combine_projections."""
+
+import os
+
+import pandas as pd
+
+from combine_projections import infer_position, is_pitcher, load_fangraphs_systems
+
+
+def write_system(tmp_path, system: str, names: list, mtime: float) -> None:
+    path = tmp_path / f"fangraphs_{system}.parquet"
+    pd.DataFrame({"Name": names, "Position": "BAT", "HR": 10.0}).to_parquet(path)
+    os.utime(path, (mtime, mtime))
+
+
+def test_per_system_files_older_than_csv_are_skipped(tmp_path):
+    csv = tmp_path / "fangraphs_projections.csv"
+    csv.write_text("Name,HR\nAaron Judge,40\n")
+    now = os.path.getmtime(csv)
+    write_system(tmp_path, "steamer", ["Aaron Judge"], now - 3600)
+    write_system(tmp_path, "zips", ["Aaron Judge"], now + 60)
+    pattern = str(tmp_path / "fangraphs_*.parquet")
+
+    assert list(load_fangraphs_systems(pattern, str(csv))) == ["zips"]
+    assert list(load_fangraphs_systems(pattern, str(csv), use=True)) == ["steamer", "zips"]
+    assert load_fangraphs_systems(pattern, str(csv), use=False) == {}
+
+
+def test_per_system_files_used_without_csv(tmp_path):
+    write_system(tmp_path, "steamer", ["Aaron Judge"], 0)
+
+    systems = load_fangraphs_systems(str(tmp_path / "fangraphs_*.parquet"), str(tmp_path / "missing.csv"))
+    assert list(systems) == ["steamer"]
+
+
+def test_positions_come_from_every_system():
+    fp = pd.DataFrame({"Name": ["Aaron Judge"], "Position": ["OF"]})
+    steamer = pd.DataFrame({"Name": ["Aaron Judge"], "Position": ["BAT"]})
+    zips = pd.DataFrame({"Name": ["Aaron Judge", "Emmanuel Clase"], "Position": ["BAT", "PIT"]})
+    frames = [fp, steamer, zips, None]
+
+    assert infer_position(frames, "Aaron Judge") == "OF"
+    assert infer_position(frames, "Emmanuel Clase") == "PIT"       # only the second system has him
+    assert is_pitcher(frames, "Emmanuel Clase") and not is_pitcher(frames, "Aaron Judge")
+    assert infer_position(frames, "Nobody") == "" and not is_pitcher(frames, "Nobody")
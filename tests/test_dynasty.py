@@ -0,0 +1,35 @@
+"""Multi-season points: aligning the dynasty file's years to the board's season."""
+
+import numpy as np
+import pandas as pd
+
+from src.dynasty import points_by_year
+
+
+def current() -> pd.DataFrame:
+    return pd.DataFrame({"Name": ["Bobby Witt", "Paul Skenes"], "Position": ["SS", "SP"],
+                         "projected_points": [500.0, 450.0]})
+
+
+def future(years: list) -> pd.DataFrame:
+    return pd.DataFrame({"Name": ["Bobby Witt"] * len(years) + ["Travis Bazzana"],
+                         "Position": ["SS"] * len(years) + ["2B"],
+                         "Year": years + [years[0] + 1],
+                         "points": [510.0 + 10 * i for i in range(len(years))] + [300.0]})
+
+
+def test_file_starting_next_season_fills_season_one(capsys):
+    players, points = points_by_year(current(), future([2027, 2028]), pd.Series(dtype="float64"), 3, season=2026)
+
+    assert "start in 2027, not 2026" in capsys.readouterr().out
+    np.testing.assert_allclose(points[0], [500.0, 510.0, 520.0])
+    bazzana = players.index[players["Name"] == "Travis Bazzana"][0]
+    # first projected in 2028: nothing for 2026-2027
+    assert np.isnan(points[bazzana, :2]).all() and points[bazzana, 2] == 300.0
+
+
+def test_file_starting_this_season_keeps_the_board_for_season_zero(capsys):
+    _, points = points_by_year(current(), future([2026, 2027]), pd.Series(dtype="float64"), 3, season=2026)
+
+    assert "⚠" not in capsys.readouterr().out
+    np.testing.assert_allclose(points[0], [500.0, 520.0, 520.0])
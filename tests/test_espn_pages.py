@@ -0,0 +1,34 @@
+"""ESPN paging: page size comes from the first response."""
+
+import pytest
+
+import fetch_espn_players as espn
+
+
+def fake_espn(monkeypatch, total: int, cap: int) -> list:
+    """ESPN with `total` players that returns at most `cap` per page; returns the requests made."""
+    calls = []
+
+    def fetch_page(offset, cookies, limit=espn.PAGE_SIZE):
+        calls.append((offset, limit))
+        return [{"id": i} for i in range(offset, min(offset + min(limit, cap), total))]
+
+    monkeypatch.setattr(espn, "fetch_page", fetch_page)
+    return calls
+
+
+@pytest.mark.parametrize("total, cap", [(430, 100), (1200, 250), (600, 50), (250, 250), (0, 100)])
+def test_every_player_fetched_once(monkeypatch, total, cap):
+    fake_espn(monkeypatch, total, cap)
+    ids = [p["id"] for page in espn.iter_pages({}, max_offset=5000) for p in page]
+
+    assert ids == list(range(total))
+
+
+def test_short_first_page_sets_the_page_size(monkeypatch):
+    calls = fake_espn(monkeypatch, 430, 100)
+    pages = list(espn.iter_pages({}))
+
+    assert [len(p) for p in pages] == [100, 100, 100, 100, 30]
+    assert calls[0] == (0, espn.PAGE_SIZE)
+    assert sorted(calls[1:]) == [(100, 100), (200, 100), (300, 100), (400, 100)]
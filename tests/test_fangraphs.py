@@ -0,0 +1,89 @@
+"""fetch_fangraphs_systems against recorded FanGraphs responses served locally."""
+
+import os
+
+import pandas as pd
+import pytest
+
+import fetch_fangraphs_projections as fg
+from tests.conftest import fixture_bytes
+
+
+def api_path(system: str, stats: str) -> str:
+    return f"/api/projections?type={system}&stats={stats}&pos=all&team=0&players=0"
+
+
+def csv_path(system: str, stats: str) -> str:
+    return f"/projections.aspx?pos=all&stats={stats}&type={system}&team=0&lg=all&players=0&download=1"
+
+
+@pytest.fixture
+def fangraphs(stand_in, monkeypatch):
+    """steamer answers on the JSON API; zips only on the CSV download; anything else 404s."""
+    for stats in ("bat", "pit"):
+        stand_in.serve(api_path("steamer", stats), fixture_bytes(f"fangraphs_steamer_{stats}.json"),
+                       content_type="application/json")
+        stand_in.serve(csv_path("zips", stats), fixture_bytes(f"fangraphs_zips_{stats}.csv"),
+                       content_type="text/csv")
+    monkeypatch.setattr(fg, "FANGRAPHS", stand_in.url)
+    return stand_in
+
+
+def test_fetches_several_systems(fangraphs, session, tmp_path):
+    results = fg.fetch_fangraphs_systems(["steamer", "zips"], out_dir=str(tmp_path), session=session)
+
+    assert sorted(results) == ["steamer", "zips"]
+    for system in ("steamer", "zips"):
+        on_disk = pd.read_parquet(tmp_path / f"fangraphs_{system}.parquet")
+        pd.testing.assert_frame_equal(on_disk, results[system], check_categorical=False)
+    # Ohtani is in both steamer groups; the batter row wins
+    steamer = results["steamer"].set_index("Name")
+    assert len(steamer) == 5
+    assert steamer.loc["Shohei Ohtani", "Position"] == "BAT"
+    # zips fell back from the JSON API to the CSV download
+    assert fangraphs.hits(api_path("zips", "bat")) == 1
+    assert fangraphs.hits(csv_path("zips", "bat")) == 1
+    assert set(results["zips"]["Name"]) == {"Aaron Judge", "Bobby Witt Jr.", "Juan Soto",
+                                           "Tarik Skubal", "Emmanuel Clase"}
+
+
+def test_failed_system_does_not_block_the_others(fangraphs, session, tmp_path):
+    results = fg.fetch_fangraphs_systems(["steamer", "atc", "zips"], out_dir=str(tmp_path), session=session)
+
+    assert sorted(results) == ["steamer", "zips"]
+    assert sorted(os.listdir(tmp_path)) == ["fangraphs_steamer.parquet", "fangraphs_zips.parquet"]
+    assert fangraphs.hits(csv_path("atc", "pit")) == 1
+
+
+def test_one_stat_group_failing_keeps_the_other(fangraphs, session, tmp_path):
+    del fangraphs.routes[api_path("steamer", "pit")]
+    results = fg.fetch_fangraphs_systems(["steamer"], out_dir=str(tmp_path), session=session)
+
+    assert set(results["steamer"]["Position"]) == {"BAT"}
+    assert (tmp_path / "fangraphs_steamer.parquet").exists()
+
+
+def test_to_typed_columns_maps_fangraphs_names(fangraphs, session):
+    bat = fg.to_typed_columns(fg.fetch_stat_group("steamer", "bat", session), fg.BATTER_COL_MAP)
+    pit = fg.to_typed_columns(fg.fetch_stat_group("steamer", "pit", session), fg.PITCHER_COL_MAP)
+
+    assert list(bat.columns) == ["Name", "Position", "G", "AB", "PA", "H", "2B", "3B", "HR", "R",
+                                 "RBI", "BB", "K", "SB", "CS", "AVG", "OBP", "SLG"]
+    assert list(pit.columns) == ["Name", "Position", "W", "L", "GS", "G", "SV", "HLD", "IP", "H_allowed",
+                                 "ER", "HR_allowed", "BB_issued", "K_pitch", "ERA", "WHIP", "QS"]
+    judge = bat.set_index("Name").loc["Aaron Judge"]
+    assert judge["K"] == 168 and judge["HR"] == 45
+    skubal = pit.set_index("Name").loc["Tarik Skubal"]
+    assert (skubal["K_pitch"], skubal["H_allowed"], skubal["BB_issued"], skubal["HR_allowed"]) == (221, 160, 45, 20)
+
+    for df in (bat, pit):
+        assert isinstance(df["Position"].dtype, pd.CategoricalDtype)
+        assert (df.drop(columns=["Name", "Position"]).dtypes == "float32").all()
+
+
+def test_to_typed_columns_from_csv_download(fangraphs, session):
+    bat = fg.to_typed_columns(fg.fetch_stat_group("zips", "bat", session), fg.BATTER_COL_MAP)
+
+    assert "Team" not in bat.columns and "playerid" not in bat.columns
+    assert bat.set_index("Name").loc["Juan Soto", "K"] == 116
+    assert bat["AVG"].dtype == "float32"
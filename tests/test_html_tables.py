@@ -0,0 +1,61 @@
+"""The lxml table parsers against trimmed FantasyPros / BBRef pages and the old BeautifulSoup path."""
+
+import pandas as pd
+import pytest
+
+from fetch_bbref_projections import parse_bbref_page
+from fetch_fantasypros_projections import BATTER_COL_MAP, parse_projection_page
+from html_tables import parse_data_stat_table, parse_header_table
+from tests.conftest import fixture_bytes
+
+pytest.importorskip("bs4")
+from bench_html_parse import legacy_bbref, legacy_fp  # noqa: E402
+
+FP_PAGE = fixture_bytes("fantasypros_1b.html").decode()
+BR_PAGE = fixture_bytes("bbref_standard_batting.html").decode()
+
+
+def assert_same(new: pd.DataFrame, old: pd.DataFrame) -> None:
+    pd.testing.assert_frame_equal(new.reset_index(drop=True), old.reset_index(drop=True),
+                                  check_dtype=False, check_column_type=False)
+
+
+def test_fantasypros_matches_beautifulsoup():
+    assert_same(parse_projection_page(FP_PAGE, "1B", BATTER_COL_MAP), legacy_fp(FP_PAGE, "1B", BATTER_COL_MAP))
+
+
+def test_bbref_matches_beautifulsoup():
+    assert_same(parse_bbref_page(BR_PAGE, "batting_standard", "BAT"), legacy_bbref(BR_PAGE, "batting_standard", "BAT"))
+
+
+def test_parse_header_table():
+    columns = parse_header_table(FP_PAGE, table_id="data", name_col="Player")
+
+    assert columns["Player"] == ["Freddie Freeman", "Vladimir Guerrero Jr.", "Pete Alonso",
+                                 "Christian Walker", "Spencer Torkelson"]
+    assert columns["AB"][0] == "563.0" and columns["Rost"][3] == "-"
+    # Torkelson's row stops before OPS; the ad row (one cell) is skipped
+    assert columns["OPS"][4] is None and columns["Rost"][4] is None
+    assert parse_header_table(FP_PAGE, table_id="missing") is None
+
+
+def test_parse_data_stat_table():
+    columns = parse_data_stat_table(BR_PAGE, "batting_standard")
+
+    # the <thead> row comes through (as it did with BeautifulSoup); repeated
+    # class="thead" rows are dropped; a traded player's TOT and team rows are both kept
+    assert columns["Name"][:5] == ["Player", "CJ\xa0Abrams", "Nolan\xa0Arenado",
+                                   "Randy\xa0Arozarena", "Randy\xa0Arozarena"]
+    assert columns["team_ID"][3:5] == ["TOT", "SEA"]
+    assert columns["ranker"].count("Rk") == 1
+    assert len(columns["Name"]) == len(columns["HR"]) == 9
+    # falls back to the first stats_table when the id isn't there
+    assert parse_data_stat_table(BR_PAGE, "pitching_standard")["Name"] == columns["Name"]
+
+
+def test_bbref_board_rows():
+    df = parse_bbref_page(BR_PAGE, "batting_standard", "BAT").set_index("Name")
+
+    assert df.loc["Randy\xa0Arozarena", "HR"] == 27        # TOT row wins
+    assert df.loc["Aaron\xa0Judge", "K"] == 160
+    assert df.loc["Jace\xa0Jung", "AVG"] == 0              # blank cell
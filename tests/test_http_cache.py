@@ -0,0 +1,95 @@
+"""PooledSession + HttpCache against a local stand-in server."""
+
+import pytest
+
+from http_cache import CacheMiss, HttpCache
+from tests.conftest import make_test_session
+
+BODY = b'{"players": [1, 2, 3]}'
+
+
+def cached_session(tmp_path, mode: str = "on", ttl: int = 3600):
+    return make_test_session(HttpCache(str(tmp_path), ttls={"127.0.0.1": ttl}), mode)
+
+
+def conditional_route(validator: str, request_header: str, value: str):
+    """200 with `validator: value`, or 304 when the request carries it back."""
+    def route(headers):
+        if headers.get(request_header) == value:
+            return 304, {validator: value}, b""
+        return 200, {"Content-Type": "application/json", validator: value}, BODY
+    return route
+
+
+@pytest.mark.parametrize("validator, request_header, value", [
+    ("ETag", "If-None-Match", '"v1"'),
+    ("Last-Modified", "If-Modified-Since", "Tue, 10 Mar 2026 08:00:00 GMT"),
+])
+def test_stale_entry_revalidates_with_304(stand_in, tmp_path, validator, request_header, value):
+    stand_in.routes["/page"] = conditional_route(validator, request_header, value)
+    with cached_session(tmp_path, ttl=0) as session:
+        first = session.get(stand_in.url + "/page")
+        second = session.get(stand_in.url + "/page")
+
+    assert first.content == second.content == BODY
+    assert second.status_code == 200 and second.from_cache
+    assert stand_in.hits("/page") == 2
+    assert request_header not in stand_in.requests[0][1]
+    assert stand_in.requests[1][1][request_header] == value
+    assert session.cache.stats == {"hit": 0, "revalidated": 1, "miss": 1, "stored": 1}
+
+
+def test_fresh_entry_is_served_without_a_request(stand_in, tmp_path):
+    stand_in.serve("/page", BODY, content_type="application/json", headers={"ETag": '"v1"'})
+    with cached_session(tmp_path, ttl=3600) as session:
+        session.get(stand_in.url + "/page")
+        again = session.get(stand_in.url + "/page")
+
+    assert again.from_cache and again.json() == {"players": [1, 2, 3]}
+    assert stand_in.hits("/page") == 1
+    assert session.cache.stats["hit"] == 1
+
+
+def test_replay_serves_recorded_response_offline(stand_in, tmp_path):
+    stand_in.serve("/page", BODY, content_type="application/json")
+    url = stand_in.url + "/page"
+    with cached_session(tmp_path, "on") as session:
+        session.get(url)
+    stand_in.server.shutdown()
+    stand_in.server.server_close()
+
+    with cached_session(tmp_path, "replay", ttl=0) as session:
+        resp = session.get(url)
+
+    assert resp.status_code == 200 and resp.content == BODY
+    assert resp.headers["Content-Type"] == "application/json"
+
+
+def test_replay_miss_fails_clearly(stand_in, tmp_path):
+    with cached_session(tmp_path, "replay") as session:
+        with pytest.raises(CacheMiss, match="not recorded: .*/never-fetched"):
+            session.get(stand_in.url + "/never-fetched")
+    assert stand_in.requests == []
+
+
+def test_streamed_body_is_cached_as_it_is_read(stand_in, tmp_path):
+    stand_in.serve("/page", BODY, content_type="application/json")
+    with cached_session(tmp_path) as session:
+        with session.get(stand_in.url + "/page", stream=True) as resp:
+            assert session.cache.stats["stored"] == 0
+            body = b"".join(resp.iter_content(4))
+        again = session.get(stand_in.url + "/page", stream=True)
+
+    assert body == BODY == b"".join(again.iter_content(4))
+    assert again.from_cache and stand_in.hits("/page") == 1
+
+
+def test_partly_read_stream_is_not_cached(stand_in, tmp_path):
+    stand_in.serve("/page", BODY, content_type="application/json")
+    with cached_session(tmp_path) as session:
+        with session.get(stand_in.url + "/page", stream=True) as resp:
+            next(resp.iter_content(4))
+        session.get(stand_in.url + "/page")
+
+    assert stand_in.hits("/page") == 2
+    assert session.cache.stats["stored"] == 1
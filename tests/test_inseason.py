@@ -0,0 +1,63 @@
+"""Stabilization blending of preseason rates with season-to-date lines."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.inseason import STABILIZATION, InSeasonState
+
+
+def players() -> pd.DataFrame:
+    return pd.DataFrame({"Name": ["Juan Soto", "Garrett Crochet"], "Position": ["OF", "SP"],
+                         "PA": [600.0, 0.0], "H": [150.0, 0.0], "HR": [30.0, 0.0], "K": [120.0, 0.0],
+                         "IP": [0.0, 180.0], "K_pitch": [0.0, 216.0], "H_allowed": [0.0, 135.0],
+                         "BB_issued": [0.0, 45.0]})
+
+
+def state(tmp_path) -> InSeasonState:
+    return InSeasonState(players(), str(tmp_path / "no_eligibility.csv"))
+
+
+def ros(st: InSeasonState, name: str, stat: str) -> float:
+    return st.ros[st.players.index[st.players["Name"] == name][0], st.stats.index(stat)]
+
+
+def test_blend_is_stabilization_weighted_mean(tmp_path):
+    st = state(tmp_path)
+    st.update(pd.DataFrame({"Name": ["Juan Soto"], "PA": [60.0], "H": [12.0], "K": [30.0]}))
+
+    s = STABILIZATION["K"]
+    assert ros(st, "Juan Soto", "K") == pytest.approx((120 / 600 * s + 30) / (s + 60) * 540)
+    s = STABILIZATION["H"]
+    assert ros(st, "Juan Soto", "H") == pytest.approx((150 / 600 * s + 12) / (s + 60) * 540)
+
+
+def test_stat_missing_from_a_file_keeps_its_preseason_rate(tmp_path):
+    st = state(tmp_path)
+    st.update(pd.DataFrame({"Name": ["Juan Soto"], "PA": [20.0], "H": [5.0]}))
+
+    assert ros(st, "Juan Soto", "K") == pytest.approx(120 / 600 * 580)
+    assert ros(st, "Juan Soto", "HR") == pytest.approx(30 / 600 * 580)
+
+
+def test_blank_cells_are_not_zeros(tmp_path):
+    st = state(tmp_path)
+    st.update(pd.DataFrame({"Name": ["Juan Soto", "Garrett Crochet"], "PA": [20.0, np.nan],
+                            "K": [4.0, np.nan], "IP": [np.nan, 6.0], "H_allowed": [np.nan, 5.0]}))
+
+    assert ros(st, "Garrett Crochet", "BB_issued") == pytest.approx(45 / 180 * 174)
+    assert ros(st, "Garrett Crochet", "K_pitch") == pytest.approx(216 / 180 * 174)
+    s = STABILIZATION["H_allowed"]
+    assert ros(st, "Garrett Crochet", "H_allowed") == pytest.approx((135 / 180 * s + 5) / (s + 6) * 174)
+
+
+def test_per_stat_opportunities_survive_save_and_load(tmp_path):
+    st = state(tmp_path)
+    st.update(pd.DataFrame({"Name": ["Juan Soto"], "PA": [20.0], "H": [5.0]}), "2026-04-01")
+    path = str(tmp_path / "ytd.parquet")
+    st.save(path)
+
+    restored = state(tmp_path)
+    restored.load(path)
+    assert restored.days == ["2026-04-01"]
+    np.testing.assert_allclose(restored.ros, st.ros, rtol=1e-6)
@@ -0,0 +1,73 @@
+"""Lineup assignment: the numpy Hungarian fallback against scipy, and day dedup."""
+
+import numpy as np
+import pytest
+
+import src.lineup as lineup
+from src.lineup import optimize_days, solve_day
+
+pytest.importorskip("scipy")
+
+
+def total(values: np.ndarray, assignment: np.ndarray) -> float:
+    filled = assignment >= 0
+    return float(values[assignment[filled], np.flatnonzero(filled)].sum())
+
+
+def both(values: np.ndarray, monkeypatch) -> tuple:
+    """(scipy assignment, fallback assignment) for the same values."""
+    with_scipy = solve_day(values)
+    with monkeypatch.context() as m:
+        m.setattr(lineup, "linear_sum_assignment", None)
+        fallback = solve_day(values)
+    return with_scipy, fallback
+
+
+def check(values: np.ndarray, monkeypatch) -> None:
+    with_scipy, fallback = both(values, monkeypatch)
+    assert total(values, fallback) == pytest.approx(total(values, with_scipy))
+    used = fallback[fallback >= 0]
+    assert len(set(used)) == len(used)                          # nobody plays two slots
+    assert (values[used, np.flatnonzero(fallback >= 0)] > 0).all()
+
+
+@pytest.mark.parametrize("players, slots", [(20, 19), (40, 19), (8, 19), (19, 19), (1, 5)])
+def test_fallback_matches_scipy_on_random_values(players, slots, monkeypatch):
+    rng = np.random.default_rng(players * 100 + slots)
+    for _ in range(25):
+        eligible = rng.random((players, slots)) < 0.3
+        check(rng.gamma(2.0, 50.0, (players, slots)) * eligible, monkeypatch)
+
+
+def test_fallback_with_ineligible_columns(monkeypatch):
+    rng = np.random.default_rng(7)
+    values = rng.random((12, 6)) * 100
+    values[:, [1, 4]] = 0.0
+    with_scipy, fallback = both(values, monkeypatch)
+
+    assert fallback[1] == -1 and fallback[4] == -1
+    assert total(values, fallback) == pytest.approx(total(values, with_scipy))
+
+
+def test_fallback_with_nobody_eligible(monkeypatch):
+    with_scipy, fallback = both(np.zeros((4, 3)), monkeypatch)
+    assert (fallback == -1).all() and (with_scipy == -1).all()
+
+
+def test_optimize_days_solves_each_distinct_day_once(monkeypatch):
+    rng = np.random.default_rng(3)
+    eligible = rng.random((10, 6)) < 0.5
+    distinct = rng.random((3, 10)) * 50
+    order = [2, 0, 2, 1, 0, 2]
+    points = distinct[order]
+
+    calls = []
+    real = lineup.solve_day
+    monkeypatch.setattr(lineup, "solve_day", lambda values: calls.append(values) or real(values))
+    lineups, totals = optimize_days(points, eligible)
+
+    assert len(calls) == 3
+    for day, d in enumerate(order):
+        expected = real(distinct[d][:, None] * eligible)
+        np.testing.assert_array_equal(lineups[day], expected)
+        assert totals[day] == pytest.approx(total(distinct[d][:, None] * eligible, expected))
@@ -0,0 +1,29 @@
+"""main.py's stage inputs cover the src modules their code imports."""
+
+import ast
+import os
+
+import pytest
+
+from main import build_pipeline
+from tests.conftest import ROOT
+
+
+def src_imports(path: str) -> set:
+    """src/*.py files `path` imports at module level."""
+    with open(os.path.join(ROOT, path)) as f:
+        tree = ast.parse(f.read())
+    found = set()
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and (node.module or "").startswith("src."):
+            found.add(f"src/{node.module.split('.', 1)[1]}.py")
+    return found
+
+
+@pytest.mark.parametrize("options", [{}, {"dynasty": True, "weekly": True, "combine": True}])
+def test_stage_inputs_are_closed_under_imports(options):
+    pipe = build_pipeline(use_cache=False, **options)
+    for name, stage in pipe.stages.items():
+        modules = {p for p in stage["inputs"] if p.startswith("src/") and p.endswith(".py")}
+        missing = {imp for m in modules for imp in src_imports(m)} - modules - {"src/profiling.py"}
+        assert not missing, f"stage {name!r} is missing {sorted(missing)}"
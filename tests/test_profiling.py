@@ -0,0 +1,38 @@
+"""Profiler spans and report totals."""
+
+import tracemalloc
+
+import pytest
+
+from src.profiling import Profiler
+
+
+@pytest.fixture
+def profiler():
+    yield Profiler()
+    tracemalloc.stop()
+
+
+def test_total_peak_covers_every_span(profiler):
+    with profiler.span("big"):
+        block = bytearray(8 * 2**20)
+        del block
+    with profiler.span("small"):
+        block = bytearray(2**20)
+        del block
+
+    report = profiler.report()
+    big, small = (next(s for s in report["spans"] if s["name"] == n) for n in ("big", "small"))
+    assert big["peak_mb"] >= 8 > small["peak_mb"]
+    assert report["total"]["peak_mb"] >= big["peak_mb"]
+
+
+def test_nested_span_peak_reaches_parent(profiler):
+    with profiler.span("outer"):
+        with profiler.span("inner"):
+            block = bytearray(4 * 2**20)
+            del block
+
+    spans = {s["name"]: s for s in profiler.report()["spans"]}
+    assert spans["outer"]["peak_mb"] >= spans["inner"]["peak_mb"] >= 4
+    assert spans["inner"]["depth"] == 1 and spans["inner"]["path"] == "outer/inner"
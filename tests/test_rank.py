@@ -0,0 +1,17 @@
+"""Value scores on the draft board."""
+
+import numpy as np
+import pandas as pd
+
+from src.rank import compute_value_score
+
+
+def test_value_inside_the_adp_spread_is_plain_zero():
+    df = pd.DataFrame({"Name": ["Juan Soto", "Elly De La Cruz", "Gunnar Henderson"],
+                       "VORP": [150.0, 120.0, 100.0], "ADP": [8.0, 2.0, 5.0], "ADP_Std": [4.0, 1.0, 0.5]})
+    out = compute_value_score(df)
+
+    assert out["Value"].tolist() == [2, -1, -1]
+    assert out["Value_Adj"].tolist() == [0.0, 0.0, -0.5]
+    assert not np.signbit(out["Value_Adj"].iloc[:2]).any()
+    assert "-0.0" not in out.to_csv(index=False)
@@ -0,0 +1,52 @@
+"""Typed Parquet tables and their CSV twins."""
+
+import os
+
+import pandas as pd
+
+from src.storage import read_table, typed_frame, write_table, write_with_csv
+
+
+def board() -> pd.DataFrame:
+    return pd.DataFrame({"Name": ["Aaron Judge", "Juan Soto"], "Position": ["OF", "OF"],
+                         "ADP": [1.8, 76.4], "ADP_Std": [1.2, 3.3], "Value_Adj": [-2.0, 0.5],
+                         "Draft_Rank": [1, 2], "HR": [45.0, 36.0]})
+
+
+def test_typed_frame_keeps_adp_and_value_float64():
+    typed = typed_frame(board())
+
+    assert typed[["ADP", "ADP_Std", "Value_Adj"]].dtypes.eq("float64").all()
+    assert typed["HR"].dtype == "float32" and typed["Draft_Rank"].dtype == "int32"
+    assert "76.4" in typed.to_string() and "76.400002" not in typed.to_string()
+
+
+def test_old_float32_parquet_reads_back_clean(tmp_path):
+    path = str(tmp_path / "adp.parquet")
+    board().astype({"ADP": "float32"}).to_parquet(path, index=False)
+
+    assert read_table(path)["ADP"].tolist() == [1.8, 76.4]
+
+
+def test_newer_csv_wins_over_parquet(tmp_path, capsys):
+    csv = str(tmp_path / "projections.csv")
+    write_with_csv(board(), csv)
+    assert read_table(str(tmp_path / "projections.parquet"))["HR"].tolist() == [45.0, 36.0]
+
+    board().assign(HR=[50.0, 40.0]).to_csv(csv, index=False)
+    later = os.path.getmtime(tmp_path / "projections.parquet") + 10
+    os.utime(csv, (later, later))
+    df = read_table(str(tmp_path / "projections.parquet"))
+
+    assert df["HR"].tolist() == [50.0, 40.0]
+    assert "is newer than" in capsys.readouterr().out
+
+
+def test_parquet_newer_than_csv_is_used(tmp_path):
+    csv = tmp_path / "adp.csv"
+    board().assign(HR=[0.0, 0.0]).to_csv(csv, index=False)
+    write_table(board(), str(tmp_path / "adp.parquet"))
+    earlier = os.path.getmtime(tmp_path / "adp.parquet") - 10
+    os.utime(csv, (earlier, earlier))
+
+    assert read_table(str(tmp_path / "adp.parquet"))["HR"].tolist() == [45.0, 36.0]
@@ -0,0 +1,58 @@
+"""Trade evaluation: lineup points and roster VORP for both sides."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.matching import player_ids
+from src.scarcity import starters_for
+from src.storage import KEY
+from src.trade import TradeAnalyzer
+
+ROSTERS = {
+    "A": [("Ann First", "1B", 100.0), ("Ann Alpha", "OF", 90.0), ("Ann Bravo", "OF", 80.0),
+          ("Ann Charlie", "OF", 70.0), ("Ann Delta", "OF", 60.0), ("Ann Echo", "OF", 55.0)],
+    "B": [("Bob First", "1B", 70.0), ("Bob Alpha", "OF", 85.0), ("Bob Bravo", "OF", 65.0), ("Bob Charlie", "OF", 40.0),
+          ("Bob Delta", "OF", 35.0)],
+}
+
+
+@pytest.fixture
+def analyzer(tmp_path) -> TradeAnalyzer:
+    players = [(team, *p) for team, roster in ROSTERS.items() for p in roster] + [(None, "Free Agent", "OF", 10.0)]
+    board = pd.DataFrame(players, columns=["Team", "Name", "Position", "projected_points"])
+    board[KEY] = player_ids(board["Name"]).to_numpy()
+    rosters = board[board["Team"].notna()][["Team", "Name", KEY]]
+    return TradeAnalyzer(board.drop(columns="Team"), rosters, str(tmp_path / "no_eligibility.csv"),
+                         starters=starters_for(2))
+
+
+def names(analyzer: TradeAnalyzer, rows: np.ndarray) -> list:
+    return analyzer.board.loc[rows, "Name"].tolist()
+
+
+def test_two_for_one_drops_the_weakest_bench_player(analyzer):
+    give = analyzer.rows_for("A", ["Ann Alpha"])
+    get = analyzer.rows_for("B", ["Bob Alpha", "Bob Bravo"])
+    result = analyzer.evaluate("A", "B", give, get)
+
+    # A's new outfield is Bob Alpha, Ann Bravo, Ann Charlie, Bob Bravo; Ann Delta (VORP 20)
+    # and Ann Echo (VORP 15) sit
+    assert names(analyzer, result["a_drops"]) == ["Ann Echo"]
+    assert len(result["b_drops"]) == 0
+    after, _ = analyzer._after("A", give, get)
+    assert len(after) == len(analyzer.teams["A"])
+
+    # the dropped player's VORP is lost, so the VORP changes no longer cancel
+    assert result["a_vorp"] + result["b_vorp"] == pytest.approx(-analyzer.vorp[result["a_drops"]].sum())
+    assert analyzer.vorp[result["a_drops"]].sum() == pytest.approx(15.0)
+    # a bench drop leaves the lineup alone
+    full = np.concatenate([np.setdiff1d(analyzer.teams["A"], give), get])
+    assert result["a_points"] == pytest.approx(analyzer.lineup_points(full) - analyzer.lineup_points(analyzer.teams["A"]))
+
+
+def test_one_for_one_drops_nobody(analyzer):
+    result = analyzer.evaluate("A", "B", analyzer.rows_for("A", ["Ann Echo"]), analyzer.rows_for("B", ["Bob Charlie"]))
+
+    assert len(result["a_drops"]) == 0 and len(result["b_drops"]) == 0
+    assert result["a_vorp"] == pytest.approx(-result["b_vorp"])
@@ -0,0 +1,44 @@
+"""Waiver gains against the weakest starters of our optimal lineup."""
+
+import pandas as pd
+
+from src.matching import player_ids
+from src.storage import KEY
+from src.waivers import WaiverIndex
+
+SLOTS = {"1B": 1, "2B": 1, "DH": 1}
+
+
+def index(tmp_path) -> WaiverIndex:
+    board = pd.DataFrame({"Name": ["Utility Guy", "First Base", "Second Base", "Free Agent"],
+                          "Position": ["1B", "1B", "2B", "1B"],
+                          "projected_points": [30.0, 20.0, 10.0, 15.0]})
+    eligibility = tmp_path / "eligibility.csv"
+    pd.DataFrame({"Name": ["Utility Guy"], "Primary_Position": ["1B"],
+                  "Eligible_Positions": ["2B"]}).to_csv(eligibility, index=False)
+    return WaiverIndex(board, str(eligibility), slots=SLOTS)
+
+
+def rosters(names: list) -> pd.DataFrame:
+    return pd.DataFrame({"Team": "Us", "Name": names, KEY: player_ids(pd.Series(names)).to_numpy()})
+
+
+def test_weakest_starters_come_from_one_lineup(tmp_path):
+    waivers = index(tmp_path)
+    waivers.set_rosters(rosters(["Utility Guy", "First Base", "Second Base"]), "Us")
+
+    # Utility Guy starts at 2B only; DH is our leftover hitter, not our best one
+    names = {pos: waivers.board.at[row, "Name"] for pos, (_, row) in waivers.weakest.items()}
+    assert names == {"1B": "First Base", "2B": "Utility Guy", "DH": "Second Base"}
+
+    top = waivers.rank(1)
+    assert top.loc[0, ["Name", "Best_Pos", "Replaces", "Gain"]].tolist() == ["Free Agent", "DH", "Second Base", 5.0]
+
+
+def test_open_slot_after_roster_move(tmp_path):
+    waivers = index(tmp_path)
+    waivers.set_rosters(rosters(["Utility Guy", "First Base", "Second Base"]), "Us")
+    waivers.set_rosters(rosters(["Utility Guy", "First Base"]), "Us")
+
+    assert waivers.weakest["DH"] == (0.0, -1)
+    assert waivers.rank(1).loc[0, ["Replaces", "Gain"]].tolist() == ["(open slot)", 15.0]